@@ -1,13 +1,24 @@
 import sys
 from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import Qt
 from views.main_window import MainWindow
 from utils.theme import DarkTheme
 
 class GCSApplication:
-    def __init__(self):
+    def __init__(self, headless_map=False, replay=None, replay_speed=1.0, udp_port=None,
+                 vehicles=None, fleet_kernel=False, fleet_rate=1.0, seed=None,
+                 profile=False):
+        # Lets QtWebEngine be imported after the QApplication exists (see MapWidget.load)
+        QApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
         self.app = QApplication(sys.argv)
         self.app.setStyleSheet(DarkTheme.STYLESHEET)
-        self.window = MainWindow()
+        self.window = MainWindow(headless_map=headless_map, seed=seed, profile=profile)
+        if replay:
+            self.window.start_replay(replay, speed=replay_speed)
+        elif udp_port:
+            self.window.start_udp(udp_port)
+        elif vehicles:
+            self.window.start_fleet(vehicles, 1.0 / fleet_rate, kernel=fleet_kernel, seed=seed)
         
         
     def run(self):
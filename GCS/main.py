@@ -1,5 +1,31 @@
+import argparse
+# First, so the startup timeline includes the imports below
+import utils.startup
 from app import GCSApplication
 
 if __name__ == "__main__":
-    GCSApplication().run()
+    parser = argparse.ArgumentParser(description="Ground Control Station")
+    # --headless-map skips the web map entirely (no Chromium renderer)
+    parser.add_argument("--headless-map", action="store_true")
+    parser.add_argument("--replay", metavar="LOG",
+                        help="play back a DataLogger file or session manifest")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="replay speed multiplier (1-1000)")
+    parser.add_argument("--udp", type=int, metavar="PORT",
+                        help="receive binary telemetry over UDP instead of simulating")
+    parser.add_argument("--vehicles", type=int, metavar="N",
+                        help="simulate a fleet of N vehicles, one process each")
+    parser.add_argument("--fleet-kernel", action="store_true",
+                        help="simulate the fleet in one vectorized NumPy kernel instead")
+    parser.add_argument("--fleet-rate", type=float, default=1.0, metavar="HZ",
+                        help="fleet simulation steps per second")
+    parser.add_argument("--seed", type=int, help="seed simulated telemetry for repeatable runs")
+    parser.add_argument("--profile", action="store_true",
+                        help="show the slot profiler overlay (F12) and dump a profile on exit")
+    args, _ = parser.parse_known_args()
+    GCSApplication(headless_map=args.headless_map, replay=args.replay,
+                   replay_speed=args.speed, udp_port=args.udp,
+                   vehicles=args.vehicles, fleet_kernel=args.fleet_kernel,
+                   fleet_rate=args.fleet_rate, seed=args.seed,
+                   profile=args.profile).run()
     
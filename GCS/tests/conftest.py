@@ -0,0 +1,5 @@
+import os
+import sys
+
+# GCS modules import each other relative to the GCS directory (utils.*, widgets.*)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
@@ -0,0 +1,99 @@
+"""Offline map path: a local {z}/{x}/{y}.png directory stands in for the tile server"""
+import os
+import socket
+import urllib.request
+import pytest
+from utils.tile_cache import (TileCache, TileSource, LEAFLET_ASSETS, prefetch,
+                              tiles_in_bbox)
+from utils.tile_server import TileServer
+
+BBOX = (12.95, 77.55, 13.05, 77.65)
+TILE_BYTES = 20000
+
+@pytest.fixture
+def tile_dir(tmp_path):
+    """Local tile source covering BBOX at zoom 10-15, plus Leaflet"""
+    root = tmp_path / "tiles"
+    for zoom, x, y in tiles_in_bbox(*BBOX, 10, 15):
+        path = root / str(zoom) / str(x) / f"{y}.png"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(f"{zoom}/{x}/{y}".encode().ljust(TILE_BYTES, b"\0"))
+    for name in LEAFLET_ASSETS:
+        path = root / "leaflet" / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(f"leaflet {name}".encode())
+    return root
+
+@pytest.fixture
+def unreachable_source():
+    """A URL source on a port nothing listens on"""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    return TileSource(f"http://127.0.0.1:{port}/{{z}}/{{x}}/{{y}}.png", timeout=1)
+
+def test_prefetch_fills_mbtiles(tmp_path, tile_dir):
+    cache = TileCache(str(tmp_path / "tiles.mbtiles"))
+    tiles = list(tiles_in_bbox(*BBOX, 10, 13))
+    fetched, skipped, failed = prefetch(cache, TileSource(str(tile_dir)), *BBOX, 10, 13)
+    assert (fetched, skipped, failed) == (len(tiles), 0, 0)
+    for zoom, x, y in tiles:
+        assert cache.get(zoom, x, y).startswith(f"{zoom}/{x}/{y}".encode())
+    for name in LEAFLET_ASSETS:
+        assert cache.get_asset(name) == f"leaflet {name}".encode()
+
+    # A second run only skips
+    assert prefetch(cache, TileSource(str(tile_dir)), *BBOX, 10, 13) == (0, len(tiles), 0)
+    cache.close()
+
+def test_prefetch_fails_without_leaflet(tmp_path, tile_dir):
+    for name in LEAFLET_ASSETS:
+        os.remove(tile_dir / "leaflet" / name)
+    cache = TileCache(str(tmp_path / "tiles.mbtiles"))
+    with pytest.raises(RuntimeError, match="leaflet.js"):
+        prefetch(cache, TileSource(str(tile_dir)), *BBOX, 10, 13)
+    cache.close()
+
+def test_eviction_keeps_cache_under_quota(tmp_path, tile_dir):
+    path = str(tmp_path / "tiles.mbtiles")
+    quota_mb = 0.5
+    cache = TileCache(path, quota_mb=quota_mb)
+    tiles = list(tiles_in_bbox(*BBOX, 10, 15))
+    assert len(tiles) * TILE_BYTES > 2 * quota_mb * 1024 * 1024
+    prefetch(cache, TileSource(str(tile_dir)), *BBOX, 10, 15)
+
+    quota = quota_mb * 1024 * 1024
+    assert cache.total_bytes <= quota
+    stored = cache.conn.execute("SELECT SUM(LENGTH(tile_data)) FROM tiles").fetchone()[0]
+    assert stored <= quota
+    # The newest tiles survive, the oldest are gone
+    assert cache.contains(*tiles[-1])
+    assert not cache.contains(*tiles[0])
+    cache.close()
+    # Freed pages are handed back, so the file is bounded too
+    assert os.path.getsize(path) <= 1.5 * quota
+
+def test_server_works_with_upstream_unreachable(tmp_path, tile_dir, unreachable_source):
+    cache = TileCache(str(tmp_path / "tiles.mbtiles"))
+    prefetch(cache, TileSource(str(tile_dir)), *BBOX, 10, 12)
+    server = TileServer(cache=cache, source=unreachable_source)
+    server.start()
+    try:
+        zoom, x, y = next(tiles_in_bbox(*BBOX, 12, 12))
+        with urllib.request.urlopen(server.url(f"tiles/{zoom}/{x}/{y}.png"), timeout=5) as r:
+            assert r.headers["Content-Type"] == "image/png"
+            assert r.read().startswith(f"{zoom}/{x}/{y}".encode())
+        for name in LEAFLET_ASSETS:
+            with urllib.request.urlopen(server.url(f"leaflet/{name}"), timeout=5) as r:
+                assert r.read() == f"leaflet {name}".encode()
+        with urllib.request.urlopen(server.url("map.html"), timeout=5) as r:
+            assert b"leaflet/leaflet.js" in r.read()
+
+        # A tile that was never cached is a 404, and upstream is left alone for a while
+        zoom, x, y = next(tiles_in_bbox(*BBOX, 13, 13))
+        with pytest.raises(urllib.error.HTTPError) as missing:
+            urllib.request.urlopen(server.url(f"tiles/{zoom}/{x}/{y}.png"), timeout=5)
+        assert missing.value.code == 404
+        assert not server._upstream_available()
+    finally:
+        server.stop()
@@ -0,0 +1,325 @@
+"""Post-flight analytics over DataLogger sessions.
+
+Sessions are read in chunks (``pd.read_csv(chunksize=...)`` for CSV logs,
+runs of column blocks decoded one at a time for .gtl logs) and folded
+into small running accumulators, so memory use depends on the chunk size
+rather than on how many GB of logs are analysed. Every statistic is
+computed with vectorized pandas/NumPy operations on whole chunks. Empty
+log files count as sessions with no frames; files that cannot be read
+are reported and skipped.
+
+Usage (from the GCS directory)::
+
+    python -m utils.analytics logs/*.csv --out report.json
+"""
+import os
+import sys
+import json
+import zlib
+import argparse
+import numpy as np
+import pandas as pd
+from utils.logger import load_manifest
+from utils.telemetry_log import ColumnarLogReader
+
+DEFAULT_CHUNKSIZE = 100000
+
+def session_files(path):
+    """Expand a session manifest into its completed segment files"""
+    if path.endswith('.manifest.json'):
+        return load_manifest(path)['complete_files']
+    return [path]
+
+def iter_chunks(path, chunksize=DEFAULT_CHUNKSIZE):
+    """Yield DataFrames of at most ``chunksize`` rows for a log or manifest"""
+    for file in session_files(path):
+        if file.endswith('.gtl'):
+            yield from _gtl_chunks(file, chunksize)
+        else:
+            try:
+                # '' error cells become NaN, which the histograms simply skip
+                yield from pd.read_csv(file, chunksize=chunksize, low_memory=False)
+            except pd.errors.EmptyDataError:
+                # A session that was started but never got a frame
+                pass
+
+def _gtl_chunks(file, chunksize):
+    """Group a .gtl file's blocks into DataFrames of about ``chunksize`` rows"""
+    reader = ColumnarLogReader(file)
+    pending, rows = [], 0
+    for block in reader.iter_blocks():
+        pending.append(block)
+        rows += len(next(iter(block.values()))) if block else 0
+        if rows >= chunksize:
+            yield _concat_blocks(pending)
+            pending, rows = [], 0
+    if rows:
+        yield _concat_blocks(pending)
+
+def _concat_blocks(blocks):
+    return pd.DataFrame({name: np.concatenate([block[name] for block in blocks])
+                         for name in blocks[0]})
+
+def _columns(frame, prefix):
+    return [c for c in frame.columns if c.startswith(prefix)]
+
+class RunningStats:
+    """Count/sum/sum of squares/min/max per column, mergeable across chunks"""
+
+    def __init__(self):
+        self.count = None
+
+    def update(self, frame):
+        values = frame.astype(float)
+        stats = pd.DataFrame({
+            'count': values.count(),
+            'sum': values.sum(),
+            'sumsq': (values ** 2).sum(),
+            'min': values.min(),
+            'max': values.max(),
+        })
+        self._merge(stats)
+
+    def _merge(self, stats):
+        if self.count is None:
+            self.count = stats
+            return
+        merged = self.count.add(stats[['count', 'sum', 'sumsq']], fill_value=0)
+        merged['min'] = np.fmin(self.count['min'].reindex(merged.index),
+                                stats['min'].reindex(merged.index))
+        merged['max'] = np.fmax(self.count['max'].reindex(merged.index),
+                                stats['max'].reindex(merged.index))
+        self.count = merged[['count', 'sum', 'sumsq', 'min', 'max']]
+
+    def merge(self, other):
+        if other.count is not None:
+            self._merge(other.count)
+
+    def result(self):
+        if self.count is None:
+            return {}
+        stats = self.count
+        mean = stats['sum'] / stats['count']
+        std = np.sqrt(np.maximum(stats['sumsq'] / stats['count'] - mean ** 2, 0))
+        return {
+            name: {'mean': round(float(mean[name]), 3), 'std': round(float(std[name]), 3),
+                   'min': float(stats['min'][name]), 'max': float(stats['max'][name])}
+            for name in stats.index
+        }
+
+class SessionAnalyzer:
+    """Folds the chunks of one session into summary statistics.
+
+    Logs carry no timestamps, so rates assume ``frame_interval`` seconds
+    between frames. GPS quality is averaged over windows of
+    ``gps_window`` frames.
+    """
+
+    def __init__(self, name, frame_interval=1.0, gps_window=60):
+        self.name = name
+        self.frame_interval = frame_interval
+        self.gps_window = gps_window
+        self.frames = 0
+        self.armed_frames = 0
+
+        self.motors = RunningStats()
+        self.battery_drain = None      # per-battery % drained while armed
+        self.last_battery = None       # last row of the previous chunk
+        self.gps_sums = None           # window -> HDOP/PDOP/satellites sums
+        self.failure_open = {}         # sensor -> start frame of open failure
+        self.failures = []
+        self.errors = pd.Series(dtype='int64')
+        self.error_sources = pd.Series(dtype='int64')
+
+    def update(self, chunk):
+        offset = self.frames
+        index = np.arange(offset, offset + len(chunk))
+        self.frames += len(chunk)
+
+        self.motors.update(chunk[_columns(chunk, 'motor_rpms_') + _columns(chunk, 'motor_temps_')])
+        armed = chunk['arm_status'].astype(str).isin(['True', '1']).to_numpy() \
+            if 'arm_status' in chunk else np.ones(len(chunk), dtype=bool)
+        self.armed_frames += int(armed.sum())
+        self._update_battery(chunk, armed)
+        self._update_gps(chunk, index)
+        self._update_failures(chunk, index)
+        self._update_errors(chunk)
+
+    def _update_battery(self, chunk, armed):
+        levels = chunk[_columns(chunk, 'battery_levels_')].astype(float)
+        if levels.empty:
+            return
+        previous = levels.shift(1)
+        if self.last_battery is not None:
+            previous.iloc[0] = self.last_battery
+        # Only count drops while armed; charging/swaps show up as rises
+        drops = (previous - levels).clip(lower=0)[armed].sum()
+        self.battery_drain = drops if self.battery_drain is None else self.battery_drain + drops
+        self.last_battery = levels.iloc[-1].to_numpy()
+
+    def _update_gps(self, chunk, index):
+        columns = [c for c in ('gps_health_HDOP', 'gps_health_PDOP', 'gps_health_satellites')
+                   if c in chunk]
+        if not columns:
+            return
+        gps = chunk[columns].astype(float)
+        gps['frames'] = 1
+        sums = gps.groupby(index // self.gps_window).sum()
+        self.gps_sums = sums if self.gps_sums is None else self.gps_sums.add(sums, fill_value=0)
+
+    def _update_failures(self, chunk, index):
+        for column in _columns(chunk, 'sensor_health_'):
+            sensor = column[len('sensor_health_'):]
+            failed = chunk[column].astype(float).to_numpy() == 0
+            # Edges of failure runs; a run open from the last chunk carries over
+            was_failed = np.concatenate(([sensor in self.failure_open], failed))
+            starts = index[~was_failed[:-1] & failed]
+            ends = index[was_failed[:-1] & ~failed]
+            if sensor in self.failure_open:
+                starts = np.concatenate(([self.failure_open.pop(sensor)], starts))
+            for start, end in zip(starts, ends):
+                self.failures.append((sensor, int(start), int(end)))
+            if len(starts) > len(ends):
+                self.failure_open[sensor] = int(starts[-1])
+
+    def _update_errors(self, chunk):
+        if 'errors_code' not in chunk:
+            return
+        codes = chunk['errors_code'].dropna()
+        codes = codes[codes.astype(str) != '']
+        self.errors = self.errors.add(codes.value_counts(), fill_value=0)
+        if 'errors_source' in chunk:
+            sources = chunk.loc[codes.index, 'errors_source']
+            self.error_sources = self.error_sources.add(sources.value_counts(), fill_value=0)
+
+    def result(self):
+        for sensor, start in self.failure_open.items():
+            self.failures.append((sensor, start, self.frames))
+        self.failure_open = {}
+
+        armed_minutes = self.armed_frames * self.frame_interval / 60
+        drain = {}
+        if self.battery_drain is not None:
+            for name, value in self.battery_drain.items():
+                drain[name] = {
+                    'drained_pct': round(float(value), 3),
+                    'pct_per_min': round(float(value) / armed_minutes, 4) if armed_minutes else None,
+                }
+
+        gps = []
+        if self.gps_sums is not None:
+            means = self.gps_sums.div(self.gps_sums['frames'], axis=0).drop(columns='frames')
+            for window, row in means.iterrows():
+                gps.append({'start_frame': int(window) * self.gps_window,
+                            **{k.replace('gps_health_', ''): round(float(v), 3)
+                               for k, v in row.items()}})
+
+        return {
+            'session': self.name,
+            'frames': self.frames,
+            'duration_s': self.frames * self.frame_interval,
+            'armed_s': self.armed_frames * self.frame_interval,
+            'motors': self.motors.result(),
+            'battery_drain': drain,
+            'gps_quality': gps,
+            'sensor_failures': [
+                {'sensor': s, 'start_frame': a, 'end_frame': b,
+                 'duration_s': (b - a) * self.frame_interval}
+                for s, a, b in sorted(self.failures, key=lambda f: f[1])
+            ],
+            'error_histogram': {str(k): int(v) for k, v in
+                                self.errors.sort_values(ascending=False).items()},
+            'error_sources': {str(k): int(v) for k, v in
+                              self.error_sources.sort_values(ascending=False).items()},
+        }
+
+def analyze_session(path, chunksize=DEFAULT_CHUNKSIZE, **kwargs):
+    """Return (summary dict, analyzer) for one log file or manifest"""
+    name = os.path.basename(path).replace('.manifest.json', '')
+    analyzer = SessionAnalyzer(name, **kwargs)
+    for chunk in iter_chunks(path, chunksize):
+        analyzer.update(chunk)
+    return analyzer.result(), analyzer
+
+def analyze_sessions(paths, chunksize=DEFAULT_CHUNKSIZE, progress=None, **kwargs):
+    """Analyse many sessions one at a time and add a fleet-wide summary.
+
+    A session that cannot be read is listed under ``skipped`` with the
+    error instead of aborting the whole report.
+    """
+    sessions = []
+    skipped = []
+    fleet_motors = RunningStats()
+    fleet_errors = pd.Series(dtype='int64')
+    frames = 0
+    for i, path in enumerate(paths, 1):
+        try:
+            summary, analyzer = analyze_session(path, chunksize, **kwargs)
+        except (OSError, ValueError, KeyError, zlib.error) as e:
+            # ValueError covers pandas parser errors and foreign .gtl files
+            print(f"[Analytics] Skipping {path}: {e}", file=sys.stderr)
+            skipped.append({'path': path, 'error': str(e)})
+            if progress:
+                progress(i, len(paths), path)
+            continue
+        sessions.append(summary)
+        fleet_motors.merge(analyzer.motors)
+        fleet_errors = fleet_errors.add(analyzer.errors, fill_value=0)
+        frames += analyzer.frames
+        if progress:
+            progress(i, len(paths), path)
+
+    return {
+        'fleet': {
+            'sessions': len(sessions),
+            'frames': frames,
+            'motors': fleet_motors.result(),
+            'error_histogram': {str(k): int(v) for k, v in
+                                fleet_errors.sort_values(ascending=False).items()},
+            'sensor_failure_count': sum(len(s['sensor_failures']) for s in sessions),
+        },
+        'sessions': sessions,
+        'skipped': skipped,
+    }
+
+def format_report(report):
+    """Short human-readable summary of an analyze_sessions report"""
+    fleet = report['fleet']
+    lines = [f"Sessions: {fleet['sessions']}  Frames: {fleet['frames']}"]
+    for name, stats in fleet['motors'].items():
+        lines.append(f"  {name:<16} mean {stats['mean']:>9.1f}  max {stats['max']:>9.1f}")
+    lines.append(f"Sensor failures: {fleet['sensor_failure_count']}")
+    top = list(fleet['error_histogram'].items())[:10]
+    lines.append("Top errors: " + ", ".join(f"{code} x{count}" for code, count in top))
+    if report['skipped']:
+        lines.append(f"Skipped (unreadable): {len(report['skipped'])}")
+    for session in report['sessions']:
+        drains = [d['pct_per_min'] for d in session['battery_drain'].values()
+                  if d['pct_per_min'] is not None]
+        drain = f"{max(drains):.3f}%/min" if drains else "n/a"
+        lines.append(f"- {session['session']}: {session['frames']} frames, "
+                     f"max battery drain {drain}, "
+                     f"{len(session['sensor_failures'])} sensor failures")
+    return "\n".join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="GCS post-flight analytics")
+    parser.add_argument("logs", nargs="+", help="log files or session manifests")
+    parser.add_argument("--out", default="flight_report.json")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE)
+    parser.add_argument("--frame-interval", type=float, default=1.0,
+                        help="seconds between logged frames")
+    args = parser.parse_args(argv)
+
+    def progress(done, total, path):
+        print(f"[Analytics] {done}/{total} {path}", file=sys.stderr)
+
+    report = analyze_sessions(args.logs, args.chunksize, progress=progress,
+                              frame_interval=args.frame_interval)
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=2)
+    print(format_report(report))
+    print(f"[Analytics] Report written to {args.out}")
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,33 @@
 from PyQt5.QtCore import QThread, pyqtSignal
+from datetime import datetime, timedelta
+import argparse
 import random
+import os
 import time
 import math
 
 class DataSimulator(QThread):
+    """Simulated vehicle telemetry.
+
+    In real time (the default) one frame is emitted every ``interval``
+    seconds. With ``realtime=False`` the simulated clock advances by
+    ``interval`` per frame without sleeping: frames are emitted in lists of
+    ``batch_size`` on ``data_batch`` (plus the last one on
+    ``data_updated`` so the views keep up), and the run ends after
+    ``duration`` simulated seconds if given.
+    """
     data_updated = pyqtSignal(dict)
+    data_batch = pyqtSignal(list)
     
-    def __init__(self, interval=1):
+    def __init__(self, interval=1, realtime=True, batch_size=500, duration=None, seed=None):
         super().__init__()
+        self.seed = seed
+        self.rng = random.Random(seed)
         self.running = True
         self.interval = interval # in seconds
+        self.realtime = realtime
+        self.batch_size = batch_size
+        self.duration = duration
         
         # Initial GPS state
         self.lat = 13.0000
@@ -17,7 +35,7 @@ class DataSimulator(QThread):
         self.alt = 150.0
         
         # Flight dynamics
-        self.heading = random.uniform(0, 360)  # degrees
+        self.heading = self.rng.uniform(0, 360)  # degrees
         self.speed = 0.0  # m/s
         self.max_speed = 15.0  # m/s
         self.acceleration = 0.2  # m/s²
@@ -30,9 +48,9 @@ class DataSimulator(QThread):
         # System state
         self.armed = False
         self.motor_rpms = [0] * 7
-        self.motor_temps = [ambient_temp() for _ in range(7)]
+        self.motor_temps = [ambient_temp(self.rng) for _ in range(7)]
         self.battery_levels = [100.0] * 4
-        self.battery_temps = [ambient_temp() for _ in range(4)]
+        self.battery_temps = [ambient_temp(self.rng) for _ in range(4)]
         
         # Sensor health - more realistic to start with all healthy
         self.sensor_health = {
@@ -49,12 +67,59 @@ class DataSimulator(QThread):
         self.time_elapsed = 0
         
     def run(self):
+        if not self.realtime:
+            self._run_simulated_clock()
+            return
         while self.running:
             self._update_flight_dynamics()
             data = self._generate_data()
             self.data_updated.emit(data)
             time.sleep(self.interval)
             self.time_elapsed += self.interval
+
+    def _run_simulated_clock(self):
+        batch = []
+        for data in self.frames():
+            if not self.running:
+                break
+            batch.append(data)
+            if len(batch) >= self.batch_size:
+                self.data_batch.emit(batch)
+                self.data_updated.emit(batch[-1])
+                batch = []
+        if batch:
+            self.data_batch.emit(batch)
+            self.data_updated.emit(batch[-1])
+
+    def step(self):
+        """Advance the simulated clock by one interval and return the frame.
+
+        Unlike the frames emitted in real time, the returned dict owns its
+        lists, so it stays valid after later steps.
+        """
+        self._update_flight_dynamics()
+        data = self._generate_data()
+        self.time_elapsed += self.interval
+        data['motor_rpms'] = list(data['motor_rpms'])
+        data['motor_temps'] = list(data['motor_temps'])
+        data['battery_levels'] = list(data['battery_levels'])
+        data['battery_temps'] = list(data['battery_temps'])
+        data['sensor_health'] = dict(data['sensor_health'])
+        return data
+
+    def frames(self, count=None):
+        """Yield frames as fast as they can be computed.
+
+        Stops after ``count`` frames, or when ``duration`` simulated
+        seconds have elapsed.
+        """
+        produced = 0
+        while count is None or produced < count:
+            # Half an interval of slack absorbs float drift in time_elapsed
+            if self.duration is not None and self.time_elapsed >= self.duration - self.interval / 2:
+                break
+            yield self.step()
+            produced += 1
             
     def stop(self):
         self.running = False
@@ -65,8 +130,8 @@ class DataSimulator(QThread):
         # Simulate realistic flight behavior
         
         # Random heading changes (smoother turns)
-        if random.random() < 0.1:
-            heading_change = random.uniform(-5, 5)
+        if self.rng.random() < 0.1:
+            heading_change = self.rng.uniform(-5, 5)
             self.heading = (self.heading + heading_change) % 360
             # Bank into turns
             self.roll = heading_change * 2
@@ -75,13 +140,13 @@ class DataSimulator(QThread):
             self.roll = self.roll * 0.9
         
         # Speed changes
-        if not self.armed and random.random() < 0.05:
+        if not self.armed and self.rng.random() < 0.05:
             self.armed = True
         
         if self.armed:
-            if self.speed < self.max_speed and random.random() < 0.7:
+            if self.speed < self.max_speed and self.rng.random() < 0.7:
                 self.speed = min(self.max_speed, self.speed + self.acceleration)
-            elif random.random() < 0.1:
+            elif self.rng.random() < 0.1:
                 self.speed = max(0, self.speed - self.acceleration)
         else:
             self.speed = max(0, self.speed - self.acceleration)
@@ -96,8 +161,8 @@ class DataSimulator(QThread):
         self.lon += lon_change
         
         # Altitude changes (smoother)
-        if random.random() < 0.1:
-            self.alt += random.uniform(-2, 2)
+        if self.rng.random() < 0.1:
+            self.alt += self.rng.uniform(-2, 2)
             # Pitch follows altitude changes
             self.pitch = (self.alt - 150) * 0.1
         else:
@@ -111,14 +176,14 @@ class DataSimulator(QThread):
         base_rpm = 3000 + (self.speed / self.max_speed) * 5000
         for i in range(7):
             # Add some variation between motors
-            self.motor_rpms[i] = int(base_rpm + random.uniform(-200, 200))
+            self.motor_rpms[i] = int(base_rpm + self.rng.uniform(-200, 200))
         
         # Update motor temperatures based on RPMs and time
         for i in range(7):
             rpm_factor = self.motor_rpms[i] / 8000  # Normalized RPM
             # Temperature rises with RPM and time, but has a cooling factor
             temp_change = (rpm_factor * 0.5) - 0.1
-            self.motor_temps[i] = min(95, max(ambient_temp(), self.motor_temps[i] + temp_change))
+            self.motor_temps[i] = min(95, max(ambient_temp(self.rng), self.motor_temps[i] + temp_change))
         
         # Battery levels decrease over time when armed
         if self.armed:
@@ -132,16 +197,16 @@ class DataSimulator(QThread):
         else:
             # Batteries cool down when not in use
             for i in range(4):
-                self.battery_temps[i] = max(ambient_temp(), self.battery_temps[i] - 0.1)
+                self.battery_temps[i] = max(ambient_temp(self.rng), self.battery_temps[i] - 0.1)
         
     def _generate_data(self):
         # GPS health improves with time but occasionally degrades
         satellites = min(20, 10 + int(self.time_elapsed / 60))
-        if random.random() < 0.05:
-            satellites = max(6, satellites - random.randint(1, 3))
+        if self.rng.random() < 0.05:
+            satellites = max(6, satellites - self.rng.randint(1, 3))
         
         hdop = max(0.5, 2.0 - (satellites / 20))
-        pdop = hdop + random.uniform(0, 0.5)
+        pdop = hdop + self.rng.uniform(0, 0.5)
         
         return {
             'motor_rpms': self.motor_rpms,
@@ -171,9 +236,9 @@ class DataSimulator(QThread):
     def _update_sensor_health(self):
         # Sensors occasionally fail but can recover
         for sensor in self.sensor_health:
-            if self.sensor_health[sensor] == 1 and random.random() < 0.01:
+            if self.sensor_health[sensor] == 1 and self.rng.random() < 0.01:
                 self.sensor_health[sensor] = 0
-            elif self.sensor_health[sensor] == 0 and random.random() < 0.05:
+            elif self.sensor_health[sensor] == 0 and self.rng.random() < 0.05:
                 self.sensor_health[sensor] = 1
         
         return self.sensor_health
@@ -185,7 +250,7 @@ class DataSimulator(QThread):
         # - Sensors are failing
         
         # Check for motor overheat
-        if any(temp > 90 for temp in self.motor_temps) and random.random() < 0.3:
+        if any(temp > 90 for temp in self.motor_temps) and self.rng.random() < 0.3:
             return {
                 'code': "E101",
                 'desc': "Motor Overheat",
@@ -193,7 +258,7 @@ class DataSimulator(QThread):
             }
         
         # Check for battery issues
-        if any(level < 30 for level in self.battery_levels) and random.random() < 0.3:
+        if any(level < 30 for level in self.battery_levels) and self.rng.random() < 0.3:
             return {
                 'code': "E102",
                 'desc': "Battery Undervoltage",
@@ -201,7 +266,7 @@ class DataSimulator(QThread):
             }
         
         # Check for sensor failures
-        if 0 in self.sensor_health.values() and random.random() < 0.3:
+        if 0 in self.sensor_health.values() and self.rng.random() < 0.3:
             failed_sensor = next(s for s, v in self.sensor_health.items() if v == 0)
             return {
                 'code': f"E{103 + list(self.sensor_health.keys()).index(failed_sensor)}",
@@ -210,16 +275,67 @@ class DataSimulator(QThread):
             }
         
         # Random errors with lower probability
-        if random.random() < self.error_probability:
+        if self.rng.random() < self.error_probability:
             return {
-                'code': f"E{random.randint(101, 199)}",
-                'desc': random.choice([
+                'code': f"E{self.rng.randint(101, 199)}",
+                'desc': self.rng.choice([
                     "Motor Overheat", "Battery Undervoltage", "IMU Failure", "GPS Lost"
                 ]),
-                'source': random.choice(["Motors", "Battery", "Flight Controller"])
+                'source': self.rng.choice(["Motors", "Battery", "Flight Controller"])
             }
         return None
 
-def ambient_temp():
+def ambient_temp(rng=random):
     """Return a realistic ambient temperature"""
-    return random.uniform(25, 30)
+    return rng.uniform(25, 30)
+
+def generate_flights(flights, flight_seconds, interval=1.0, save_dir="logs",
+                     log_format="columnar", start=None, gap_seconds=1800, seed=None,
+                     **logger_options):
+    """Write ``flights`` simulated flights straight to DataLogger sessions.
+
+    Runs on the simulated clock, so a day of flights takes minutes. Sessions
+    are named after their simulated start time (one every
+    ``flight_seconds + gap_seconds`` from ``start``) and returned as paths.
+    With a ``seed``, flight ``n`` is simulated with ``seed + n``.
+    """
+    from utils.logger import DataLogger
+
+    start = start or datetime.now().replace(hour=6, minute=0, second=0, microsecond=0)
+    logger = DataLogger(save_dir=save_dir, log_format=log_format, **logger_options)
+    sessions = []
+    for flight in range(flights):
+        began = start + timedelta(seconds=flight * (flight_seconds + gap_seconds))
+        simulator = DataSimulator(interval, realtime=False, duration=flight_seconds,
+                                  seed=None if seed is None else seed + flight)
+        logger.start(session=f"log_{began.strftime('%Y-%m-%d_%H-%M-%S')}")
+        started = time.monotonic()
+        for data in simulator.frames():
+            logger.log(data, block=True)
+        logger.stop()
+        sessions.append(logger.filepath if not logger.rotating else
+                        os.path.join(save_dir, f"{logger.session}.manifest.json"))
+        print(f"[Simulator] Flight {flight + 1}/{flights}: {logger.written} frames "
+              f"in {time.monotonic() - started:.1f}s")
+    return sessions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate simulated flight logs")
+    parser.add_argument("--flights", type=int, default=12)
+    parser.add_argument("--flight-minutes", type=float, default=120)
+    parser.add_argument("--rate", type=float, default=1.0, help="frames per simulated second")
+    parser.add_argument("--format", choices=["csv", "columnar"], default="columnar")
+    parser.add_argument("--save-dir", default="logs")
+    parser.add_argument("--rotate-mb", type=float, help="split sessions into segments")
+    parser.add_argument("--seed", type=int, help="make the generated flights repeatable")
+    args = parser.parse_args(argv)
+
+    started = time.monotonic()
+    sessions = generate_flights(args.flights, args.flight_minutes * 60, 1.0 / args.rate,
+                                save_dir=args.save_dir, log_format=args.format,
+                                seed=args.seed, rotate_mb=args.rotate_mb)
+    print(f"[Simulator] {len(sessions)} flights written to {args.save_dir} "
+          f"in {time.monotonic() - started:.1f}s")
+
+if __name__ == "__main__":
+    main()
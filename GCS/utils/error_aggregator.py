@@ -0,0 +1,200 @@
+from utils.ring_buffer import RingBuffer
+from bisect import bisect_left
+import time
+
+class ErrorGroup:
+    """One log row: consecutive occurrences of the same error"""
+    __slots__ = ('seq', 'code', 'desc', 'source', 'first_seen', 'last_seen', 'count')
+
+    def __init__(self, seq, code, desc, source, timestamp):
+        self.seq = seq
+        self.code = code
+        self.desc = desc
+        self.source = source
+        self.first_seen = timestamp
+        self.last_seen = timestamp
+        self.count = 1
+
+class ErrorAggregator:
+    """Collapses repeated errors into groups and indexes them for search.
+
+    An error repeating within ``merge_window`` seconds of its group's last
+    occurrence is folded into that group. New groups for the same
+    (code, source) are also rate limited with a token bucket (``burst``
+    rows, refilled at ``rate`` rows per second); when the bucket is empty
+    the occurrence is counted on the latest group instead.
+
+    Groups are kept in a RingBuffer and indexed by code, source and first
+    seen time. Fleet sources ("V3/Motors") are indexed under their last
+    part too, so ``source="Motors"`` finds every vehicle's motors. Index lists hold group sequence numbers in ascending order;
+    entries for groups that have left the ring are skipped on lookup and
+    pruned when they pile up.
+    """
+
+    def __init__(self, capacity=100000, merge_window=5.0, burst=5, rate=0.2):
+        self.groups = RingBuffer(capacity)
+        self.merge_window = merge_window
+        self.burst = burst
+        self.rate = rate
+
+        self.latest = {}    # (code, desc, source) -> latest group
+        self.buckets = {}   # (code, source) -> [tokens, last refill time]
+        self.by_code = {}
+        self.by_source = {}
+        self.first_seen = []  # first_seen of every indexed group, by seq
+        self.first_seq = 0    # seq of first_seen[0]
+        self.total_errors = 0
+
+    def add(self, code, desc, source, timestamp=None):
+        """Record one occurrence; return (group, is_new_group)"""
+        if timestamp is None:
+            timestamp = time.time()
+        self.total_errors += 1
+        key = (code, desc, source)
+        group = self.latest.get(key)
+        if group is not None and self.groups.get(group.seq) is group:
+            within_window = timestamp - group.last_seen <= self.merge_window
+            if within_window or not self._take_token(code, source, timestamp):
+                group.count += 1
+                group.last_seen = timestamp
+                return group, False
+        else:
+            self._take_token(code, source, timestamp)
+
+        seq = self.groups.total
+        group = ErrorGroup(seq, code, desc, source, timestamp)
+        self.groups.append(group)
+        self.latest[key] = group
+        self.by_code.setdefault(code, []).append(seq)
+        for key in _source_keys(source):
+            self.by_source.setdefault(key, []).append(seq)
+        self.first_seen.append(timestamp)
+        if len(self.first_seen) > 2 * self.groups.capacity:
+            self._prune()
+        return group, True
+
+    def _take_token(self, code, source, timestamp):
+        bucket = self.buckets.setdefault((code, source), [float(self.burst), timestamp])
+        bucket[0] = min(self.burst, bucket[0] + (timestamp - bucket[1]) * self.rate)
+        bucket[1] = timestamp
+        if bucket[0] >= 1.0:
+            bucket[0] -= 1.0
+            return True
+        return False
+
+    def _prune(self):
+        """Drop index entries for groups that have left the ring buffer"""
+        oldest = self.groups.oldest
+        for index in (self.by_code, self.by_source):
+            for key in list(index):
+                seqs = index[key][bisect_left(index[key], oldest):]
+                if seqs:
+                    index[key] = seqs
+                else:
+                    del index[key]
+        del self.first_seen[:oldest - self.first_seq]
+        self.first_seq = oldest
+
+    def get(self, seq):
+        return self.groups.get(seq)
+
+    def seq_since(self, timestamp):
+        """First group seq first seen at or after ``timestamp``"""
+        return self.first_seq + bisect_left(self.first_seen, timestamp)
+
+    def query(self, code=None, source=None, since=None, until=None, text=None,
+              last=None, now=None):
+        """Return matching group sequence numbers in ascending order.
+
+        ``last`` is a window in seconds ending at ``now`` (default: the
+        current time), so a stored filter keeps sliding.
+        """
+        since = _window_start(since, last, now)
+        oldest = self.groups.oldest
+        lo, hi = oldest, self.groups.total
+        if since is not None:
+            lo = max(lo, self.seq_since(since))
+        if until is not None:
+            hi = min(hi, self.seq_since(until))
+
+        candidates = None
+        for index, value in ((self.by_code, code), (self.by_source, source)):
+            if value is None:
+                continue
+            seqs = index.get(value, [])
+            seqs = seqs[bisect_left(seqs, lo):bisect_left(seqs, hi)]
+            candidates = seqs if candidates is None else _intersect(candidates, seqs)
+        if candidates is None:
+            candidates = range(lo, hi)
+
+        if text:
+            needle = text.lower()
+            candidates = [seq for seq in candidates
+                          if self._matches_text(self.groups.get(seq), needle)]
+        return list(candidates)
+
+    def matches(self, group, code=None, source=None, since=None, until=None, text=None,
+                last=None, now=None):
+        """Check a single group against the same criteria as ``query``"""
+        since = _window_start(since, last, now)
+        if code is not None and group.code != code:
+            return False
+        if source is not None and source not in _source_keys(group.source):
+            return False
+        if since is not None and group.first_seen < since:
+            return False
+        if until is not None and group.first_seen >= until:
+            return False
+        return not text or self._matches_text(group, text.lower())
+
+    @staticmethod
+    def _matches_text(group, needle):
+        return (needle in str(group.code).lower() or needle in str(group.desc).lower()
+                or needle in str(group.source).lower())
+
+    def clear(self):
+        self.__init__(self.groups.capacity, self.merge_window, self.burst, self.rate)
+
+def _source_keys(source):
+    """Index keys of a source: itself, and the part after the last slash"""
+    if isinstance(source, str) and '/' in source:
+        return (source, source.rsplit('/', 1)[-1])
+    return (source,)
+
+def _window_start(since, last, now):
+    if last is None:
+        return since
+    start = (time.time() if now is None else now) - last
+    return start if since is None else max(since, start)
+
+def _intersect(a, b):
+    """Intersect two ascending sequence lists"""
+    members = set(b)
+    return [seq for seq in a if seq in members]
+
+def parse_filter(text):
+    """Turn filter text into ``query`` keyword arguments.
+
+    Supports ``code:E103``, ``source:Motors`` (underscores for spaces;
+    also matches fleet sources such as ``V3/Motors``), ``last:10m`` /
+    ``last:30s`` / ``last:2h`` (kept as a window relative to each query)
+    and free text, e.g. ``code:E103 last:5m imu``.
+    """
+    criteria = {}
+    words = []
+    units = {'s': 1, 'm': 60, 'h': 3600}
+    for token in text.split():
+        key, sep, value = token.partition(':')
+        key = key.lower()
+        if sep and key == 'code':
+            criteria['code'] = value.upper()
+        elif sep and key == 'source':
+            criteria['source'] = value.replace('_', ' ')
+        elif sep and key == 'last' and value[:-1].replace('.', '', 1).isdigit() \
+                and value[-1:] in units:
+            criteria['last'] = float(value[:-1]) * units[value[-1]]
+        else:
+            words.append(token)
+    if words:
+        criteria['text'] = ' '.join(words)
+    return criteria
@@ -0,0 +1,174 @@
+"""Multi-vehicle telemetry: one simulator process per vehicle.
+
+Each vehicle process writes its latest frame into its own row of a
+shared-memory table. A row is a seqlock counter followed by the binary
+UDP telemetry frame (``utils.udp_telemetry.FRAME``), so there is no
+pickling or queueing between processes. The GUI polls the table at a
+fixed rate and only builds dicts for what it displays: the selected
+vehicle's full frame, every vehicle's position, and new errors.
+"""
+import struct
+import multiprocessing
+from multiprocessing import shared_memory
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from utils.udp_telemetry import FRAME, pack_frame, build_frame
+
+LOCK = struct.Struct("<I")
+ROW_SIZE = (LOCK.size + FRAME.size + 7) // 8 * 8
+
+# Positions inside an unpacked FRAME tuple (see utils.udp_telemetry)
+_FLAGS, _SEQ, _LAT, _LON, _ERROR_CODE = 2, 3, 4, 5, 36
+
+def _attach(name):
+    """Open a block created by the parent process"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 always registers the block, but spawned children
+        # share the parent's resource tracker, so that is harmless; only
+        # the parent's unlink() unregisters it
+        return shared_memory.SharedMemory(name=name)
+
+class VehicleTable:
+    """Latest-state table in shared memory, one row per vehicle.
+
+    Each row has a single writer. Writers bump the row's counter to an
+    odd value, write the frame, then bump it to even; readers retry if
+    the counter was odd or changed while they read.
+    """
+
+    def __init__(self, count, name=None):
+        self.count = count
+        self.owner = name is None
+        if self.owner:
+            self.shm = shared_memory.SharedMemory(create=True, size=count * ROW_SIZE)
+            self.shm.buf[:count * ROW_SIZE] = bytes(count * ROW_SIZE)
+        else:
+            self.shm = _attach(name)
+        self.name = self.shm.name
+        self.buf = self.shm.buf
+
+    def write(self, index, data, seq):
+        offset = index * ROW_SIZE
+        lock = LOCK.unpack_from(self.buf, offset)[0]
+        LOCK.pack_into(self.buf, offset, (lock + 1) & 0xFFFFFFFF)
+        pack_frame(self.buf[offset + LOCK.size:offset + LOCK.size + FRAME.size], data, seq)
+        LOCK.pack_into(self.buf, offset, (lock + 2) & 0xFFFFFFFF)
+
+    def read(self, index, retries=10):
+        """Return the row's FRAME tuple, or None if it has not been written"""
+        offset = index * ROW_SIZE
+        for _ in range(retries):
+            before = LOCK.unpack_from(self.buf, offset)[0]
+            if before == 0:
+                return None
+            if before & 1:
+                continue
+            fields = FRAME.unpack_from(self.buf, offset + LOCK.size)
+            if LOCK.unpack_from(self.buf, offset)[0] == before:
+                return fields
+        return None
+
+    def close(self):
+        self.buf = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+def run_vehicle(table_name, count, index, interval, stop_event, seed=None):
+    """Process entry point: simulate one vehicle into its table row"""
+    from utils.data_simulator import DataSimulator
+
+    table = VehicleTable(count, name=table_name)
+    sim = DataSimulator(interval, seed=None if seed is None else seed + index)
+    # Spread the fleet out around the home position
+    sim.lat += 0.002 * (index % 5)
+    sim.lon += 0.002 * (index // 5)
+    seq = 0
+    try:
+        while not stop_event.is_set():
+            sim._update_flight_dynamics()
+            table.write(index, sim._generate_data(), seq)
+            seq += 1
+            sim.time_elapsed += interval
+            stop_event.wait(interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        table.close()
+
+class FleetSource(QObject):
+    """Runs one simulator process per vehicle and polls their shared state.
+
+    ``data_updated(dict)`` carries the selected vehicle only, exactly like
+    DataSimulator, so the existing views render just that vehicle.
+    ``fleet_updated(list)`` carries ``(index, lat, lon, armed)`` for each
+    vehicle that has reported, and ``vehicle_error(int, dict)`` reports
+    errors from the vehicles that are not selected.
+    """
+    data_updated = pyqtSignal(dict)
+    fleet_updated = pyqtSignal(list)
+    vehicle_error = pyqtSignal(int, dict)
+
+    def __init__(self, count, interval=1.0, poll_ms=50, seed=None):
+        super().__init__()
+        self.count = count
+        self.interval = interval
+        self.seed = seed
+        self.selected = 0
+        self.table = None
+        self.processes = []
+        # Spawn keeps Qt state out of the children
+        self.context = multiprocessing.get_context("spawn")
+        self.stop_event = self.context.Event()
+        self.last_seq = [None] * count
+        self.positions = [None] * count
+
+        self.poll_timer = QTimer(self)
+        self.poll_timer.setInterval(poll_ms)
+        self.poll_timer.timeout.connect(self.poll)
+
+    def start(self):
+        self.table = VehicleTable(self.count)
+        for index in range(self.count):
+            process = self.context.Process(
+                target=run_vehicle, name=f"vehicle-{index + 1}", daemon=True,
+                args=(self.table.name, self.count, index, self.interval, self.stop_event,
+                      self.seed))
+            process.start()
+            self.processes.append(process)
+        self.poll_timer.start()
+        print(f"[Fleet] Started {self.count} vehicle processes")
+
+    def select(self, index):
+        self.selected = index
+        # Force the new selection to refresh on the next poll
+        self.last_seq[index] = None
+
+    def poll(self):
+        changed = False
+        for index in range(self.count):
+            fields = self.table.read(index)
+            if fields is None or fields[_SEQ] == self.last_seq[index]:
+                continue
+            self.last_seq[index] = fields[_SEQ]
+            self.positions[index] = (index, fields[_LAT], fields[_LON], bool(fields[_FLAGS] & 1))
+            changed = True
+            if index == self.selected:
+                self.data_updated.emit(build_frame(fields))
+            elif fields[_ERROR_CODE]:
+                self.vehicle_error.emit(index, build_frame(fields)['errors'])
+        if changed:
+            self.fleet_updated.emit([p for p in self.positions if p is not None])
+
+    def stop(self):
+        self.poll_timer.stop()
+        self.stop_event.set()
+        for process in self.processes:
+            process.join(timeout=2)
+            if process.is_alive():
+                process.terminate()
+        self.processes = []
+        if self.table is not None:
+            self.table.close()
+            self.table = None
@@ -0,0 +1,277 @@
+"""Vectorized flight dynamics for whole fleets.
+
+``FleetDynamics`` implements the DataSimulator model (one ``step`` is one
+DataSimulator frame) for N vehicles x M motors x K batteries as NumPy
+array operations, so a step costs roughly the same for 1 vehicle as for
+a few hundred. Randomness comes from one ``numpy.random.Generator``, so a
+seeded fleet is deterministic.
+
+``KernelFleetSource`` runs the kernel on a worker thread at a fixed step
+rate and offers the same signals as utils.fleet.FleetSource, for swarm
+load tests on a single core::
+
+    python main.py --vehicles 300 --fleet-kernel --fleet-rate 50
+"""
+import math
+import time
+import threading
+import numpy as np
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from utils.udp_telemetry import SENSORS, ERROR_DESCS, ERROR_SOURCES
+
+# Indices into the udp_telemetry error tables
+_DESC = {name: i for i, name in enumerate(ERROR_DESCS)}
+_SOURCE = {name: i for i, name in enumerate(ERROR_SOURCES)}
+_SENSOR_FAILURE_DESC = np.array([_DESC[f"{name} Failure"] for name in SENSORS])
+_RANDOM_DESCS = np.array([_DESC[d] for d in ("Motor Overheat", "Battery Undervoltage",
+                                             "IMU Failure", "GPS Lost")])
+_RANDOM_SOURCES = np.array([_SOURCE[s] for s in ("Motors", "Battery", "Flight Controller")])
+
+class FleetDynamics:
+    """State arrays and one-step update for a fleet of simulated vehicles"""
+
+    MAX_SPEED = 15.0      # m/s
+    ACCELERATION = 0.2    # m/s per step
+    ERROR_PROBABILITY = 0.02
+
+    def __init__(self, vehicles, motors=7, batteries=4, seed=None, interval=1.0,
+                 home=(13.0, 77.6)):
+        self.rng = np.random.default_rng(seed)
+        self.n = n = vehicles
+        self.motors = motors
+        self.batteries = batteries
+        self.interval = interval
+        self.time_elapsed = 0.0
+        self.steps = 0
+
+        # Lay the fleet out on a grid around the home position
+        side = max(1, math.ceil(math.sqrt(n)))
+        index = np.arange(n)
+        self.lat = home[0] + 0.002 * (index % side)
+        self.lon = home[1] + 0.002 * (index // side)
+        self.alt = np.full(n, 150.0)
+        self.heading = self.rng.uniform(0, 360, n)
+        self.speed = np.zeros(n)
+        self.roll = np.zeros(n)
+        self.pitch = np.zeros(n)
+        self.yaw = self.heading.copy()
+        self.armed = np.zeros(n, dtype=bool)
+
+        self.motor_rpms = np.zeros((n, motors), dtype=np.int64)
+        self.motor_temps = self.rng.uniform(25, 30, (n, motors))
+        self.battery_levels = np.full((n, batteries), 100.0)
+        self.battery_temps = self.rng.uniform(25, 30, (n, batteries))
+        self.sensor_health = np.ones((n, len(SENSORS)), dtype=np.uint8)
+
+        self.satellites = np.full(n, 10, dtype=np.int64)
+        self.hdop = np.zeros(n)
+        self.pdop = np.zeros(n)
+        # Latest error per vehicle (code 0 = none) and a running error count
+        self.error_code = np.zeros(n, dtype=np.int64)
+        self.error_desc = np.zeros(n, dtype=np.int64)
+        self.error_source = np.zeros(n, dtype=np.int64)
+        self.error_count = np.zeros(n, dtype=np.int64)
+
+    def step(self):
+        """Advance every vehicle by one frame"""
+        rng = self.rng
+        n = self.n
+
+        # Heading changes with banking, otherwise level out
+        turning = rng.random(n) < 0.1
+        change = rng.uniform(-5, 5, n)
+        self.heading = np.where(turning, (self.heading + change) % 360, self.heading)
+        self.roll = np.where(turning, change * 2, self.roll * 0.9)
+
+        self.armed |= rng.random(n) < 0.05
+        faster = self.armed & (self.speed < self.MAX_SPEED) & (rng.random(n) < 0.7)
+        slower = (self.armed & ~faster & (rng.random(n) < 0.1)) | ~self.armed
+        self.speed = np.where(faster, np.minimum(self.MAX_SPEED, self.speed + self.ACCELERATION),
+                              self.speed)
+        self.speed = np.where(slower, np.maximum(0, self.speed - self.ACCELERATION), self.speed)
+
+        heading_rad = np.radians(self.heading)
+        self.lat += self.speed * np.cos(heading_rad) * 0.00001
+        self.lon += self.speed * np.sin(heading_rad) * 0.00001
+
+        climbing = rng.random(n) < 0.1
+        self.alt = np.where(climbing, self.alt + rng.uniform(-2, 2, n), self.alt)
+        self.pitch = np.where(climbing, (self.alt - 150) * 0.1, self.pitch * 0.9)
+        self.yaw = self.heading
+
+        # Motors: RPM follows speed, temperature follows RPM
+        base_rpm = 3000 + (self.speed / self.MAX_SPEED) * 5000
+        self.motor_rpms = (base_rpm[:, None]
+                           + rng.uniform(-200, 200, (n, self.motors))).astype(np.int64)
+        temp_change = (self.motor_rpms / 8000) * 0.5 - 0.1
+        ambient = rng.uniform(25, 30, (n, self.motors))
+        self.motor_temps = np.minimum(95, np.maximum(ambient, self.motor_temps + temp_change))
+
+        # Batteries drain and warm while armed, cool down otherwise
+        drain = 0.02 * self.motor_rpms.sum(axis=1) / (self.motors * 8000)
+        armed = self.armed[:, None]
+        self.battery_levels = np.where(
+            armed, np.maximum(0, self.battery_levels - drain[:, None]), self.battery_levels)
+        ambient = rng.uniform(25, 30, (n, self.batteries))
+        self.battery_temps = np.where(
+            armed, np.minimum(75, self.battery_temps + 0.05 * drain[:, None]),
+            np.maximum(ambient, self.battery_temps - 0.1))
+
+        self._update_gps()
+        self._update_sensor_health()
+        self._update_errors()
+        self.time_elapsed += self.interval
+        self.steps += 1
+
+    def _update_gps(self):
+        n = self.n
+        satellites = np.full(n, min(20, 10 + int(self.time_elapsed / 60)))
+        degraded = self.rng.random(n) < 0.05
+        lost = self.rng.integers(1, 4, n)
+        self.satellites = np.where(degraded, np.maximum(6, satellites - lost), satellites)
+        self.hdop = np.maximum(0.5, 2.0 - self.satellites / 20)
+        self.pdop = self.hdop + self.rng.uniform(0, 0.5, n)
+
+    def _update_sensor_health(self):
+        roll = self.rng.random(self.sensor_health.shape)
+        healthy = self.sensor_health == 1
+        failing = healthy & (roll < 0.01)
+        recovering = ~healthy & (roll < 0.05)
+        self.sensor_health[failing] = 0
+        self.sensor_health[recovering] = 1
+
+    def _update_errors(self):
+        """Same priority order as DataSimulator._generate_errors"""
+        rng = self.rng
+        n = self.n
+        code = np.zeros(n, dtype=np.int64)
+        desc = np.zeros(n, dtype=np.int64)
+        source = np.zeros(n, dtype=np.int64)
+
+        def assign(mask, new_code, new_desc, new_source):
+            mask &= code == 0
+            code[mask] = new_code[mask] if np.ndim(new_code) else new_code
+            desc[mask] = new_desc[mask] if np.ndim(new_desc) else new_desc
+            source[mask] = new_source
+
+        assign((self.motor_temps > 90).any(axis=1) & (rng.random(n) < 0.3),
+               101, _DESC["Motor Overheat"], _SOURCE["Motors"])
+        assign((self.battery_levels < 30).any(axis=1) & (rng.random(n) < 0.3),
+               102, _DESC["Battery Undervoltage"], _SOURCE["Battery"])
+        failed = self.sensor_health == 0
+        first_failed = failed.argmax(axis=1)
+        assign(failed.any(axis=1) & (rng.random(n) < 0.3),
+               103 + first_failed, _SENSOR_FAILURE_DESC[first_failed], _SOURCE["Flight Controller"])
+        random_source = _RANDOM_SOURCES[rng.integers(0, len(_RANDOM_SOURCES), n)]
+        mask = (rng.random(n) < self.ERROR_PROBABILITY) & (code == 0)
+        code[mask] = rng.integers(101, 200, n)[mask]
+        desc[mask] = _RANDOM_DESCS[rng.integers(0, len(_RANDOM_DESCS), n)][mask]
+        source[mask] = random_source[mask]
+
+        self.error_code = code
+        self.error_desc = desc
+        self.error_source = source
+        self.error_count += code != 0
+
+    def error(self, i):
+        if not self.error_code[i]:
+            return {'code': None, 'desc': None, 'source': None}
+        return {
+            'code': f"E{self.error_code[i]}",
+            'desc': ERROR_DESCS[self.error_desc[i]],
+            'source': ERROR_SOURCES[self.error_source[i]],
+        }
+
+    def frame(self, i):
+        """Vehicle ``i`` as a DataSimulator-style telemetry dict"""
+        return {
+            'motor_rpms': self.motor_rpms[i].tolist(),
+            'motor_temps': self.motor_temps[i].tolist(),
+            'latitude': float(self.lat[i]),
+            'longitude': float(self.lon[i]),
+            'altitude': float(self.alt[i]),
+            'roll': float(self.roll[i]),
+            'pitch': float(self.pitch[i]),
+            'yaw': float(self.yaw[i]),
+            'battery_levels': self.battery_levels[i].tolist(),
+            'battery_temps': self.battery_temps[i].tolist(),
+            'arm_status': bool(self.armed[i]),
+            'gps_health': {
+                'HDOP': round(float(self.hdop[i]), 2),
+                'PDOP': round(float(self.pdop[i]), 2),
+                'satellites': int(self.satellites[i]),
+            },
+            'sensor_health': {name: int(v) for name, v in zip(SENSORS, self.sensor_health[i])},
+            'errors': self.error(i),
+        }
+
+class KernelFleetSource(QObject):
+    """FleetSource-compatible fleet driven by FleetDynamics on one thread"""
+    data_updated = pyqtSignal(dict)
+    fleet_updated = pyqtSignal(list)
+    vehicle_error = pyqtSignal(int, dict)
+
+    def __init__(self, count, interval=1.0, poll_ms=50, seed=None):
+        super().__init__()
+        self.count = count
+        self.interval = interval
+        self.selected = 0
+        self.kernel = FleetDynamics(count, seed=seed, interval=interval)
+        self.lock = threading.Lock()
+        self.running = False
+        self.thread = None
+        self.last_step = -1
+        self.last_errors = np.zeros(count, dtype=np.int64)
+
+        self.poll_timer = QTimer(self)
+        self.poll_timer.setInterval(poll_ms)
+        self.poll_timer.timeout.connect(self.poll)
+
+    def start(self):
+        self.running = True
+        self.thread = threading.Thread(target=self._step_loop, name="FleetDynamics", daemon=True)
+        self.thread.start()
+        self.poll_timer.start()
+        print(f"[Fleet] Simulating {self.count} vehicles at {1 / self.interval:g} Hz on one thread")
+
+    def _step_loop(self):
+        next_step = time.monotonic()
+        while self.running:
+            with self.lock:
+                self.kernel.step()
+            next_step += self.interval
+            delay = next_step - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_step = time.monotonic()  # Fell behind; don't try to catch up
+
+    def select(self, index):
+        self.selected = index
+        self.last_step = -1
+
+    def poll(self):
+        kernel = self.kernel
+        with self.lock:
+            if kernel.steps == self.last_step:
+                return
+            self.last_step = kernel.steps
+            vehicles = list(zip(range(self.count), kernel.lat.tolist(), kernel.lon.tolist(),
+                                kernel.armed.tolist()))
+            selected = kernel.frame(self.selected)
+            new_errors = np.flatnonzero((kernel.error_count != self.last_errors)
+                                        & (kernel.error_code != 0))
+            errors = [(i, kernel.error(i)) for i in new_errors.tolist() if i != self.selected]
+            self.last_errors = kernel.error_count.copy()
+
+        self.data_updated.emit(selected)
+        self.fleet_updated.emit(vehicles)
+        for index, error in errors:
+            self.vehicle_error.emit(index, error)
+
+    def stop(self):
+        self.poll_timer.stop()
+        self.running = False
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
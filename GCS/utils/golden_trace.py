@@ -0,0 +1,199 @@
+"""Golden telemetry traces: recorded simulator output for repeatable runs.
+
+A trace is a 64-byte header followed by the frames in the binary UDP
+layout (``utils.udp_telemetry.FRAME``, 128 bytes each), so an hour at
+1 Hz is about 450 KB. The header stores the frame interval, the seed the
+frames were simulated with and a SHA-256 of the frame bytes.
+
+Replaying a trace yields exactly the same dicts every time, so
+benchmarks and before/after comparisons run on identical input. A
+``TraceDigest`` connected to ``data_updated`` repacks what the GUI
+received and must end up equal to the trace's digest. From the GCS
+directory::
+
+    python -m utils.golden_trace record golden.gtrace --frames 3600 --seed 1
+    python -m utils.golden_trace verify golden.gtrace
+    python main.py --replay golden.gtrace
+"""
+import sys
+import time
+import struct
+import hashlib
+import argparse
+from PyQt5.QtCore import QThread, pyqtSignal
+from utils.udp_telemetry import FRAME, pack_frame, build_frame
+
+MAGIC = b"GCSTRACE"
+VERSION = 1
+# magic, version, frame size, interval, seed (-1 = unseeded), frames, SHA-256 of frames
+HEADER = struct.Struct("<8sHHdqI32s")
+_ERROR_CODE = 36
+
+class TraceError(ValueError):
+    pass
+
+def simulate_trace(frames, interval=1.0, seed=0):
+    """Frame bytes of a seeded DataSimulator run"""
+    from utils.data_simulator import DataSimulator
+
+    simulator = DataSimulator(interval, realtime=False, seed=seed)
+    data = bytearray(frames * FRAME.size)
+    view = memoryview(data)
+    for seq, frame in enumerate(simulator.frames(frames)):
+        pack_frame(view[seq * FRAME.size:(seq + 1) * FRAME.size], frame, seq)
+    return data
+
+def record_trace(path, frames, interval=1.0, seed=0):
+    """Simulate ``frames`` frames with a seeded DataSimulator and save them"""
+    data = simulate_trace(frames, interval, seed)
+    digest = hashlib.sha256(data).digest()
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, FRAME.size, interval,
+                            -1 if seed is None else seed, frames, digest))
+        f.write(data)
+    return {'frames': frames, 'interval': interval, 'seed': seed, 'digest': digest.hex()}
+
+def load_trace(path, verify=True):
+    """Return ``(info, frame_bytes)``; raise TraceError if the file is bad"""
+    with open(path, 'rb') as f:
+        header = f.read(HEADER.size)
+        if len(header) != HEADER.size:
+            raise TraceError(f"{path}: truncated header")
+        magic, version, frame_size, interval, seed, frames, digest = HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION or frame_size != FRAME.size:
+            raise TraceError(f"{path}: not a version {VERSION} telemetry trace")
+        data = f.read()
+    if len(data) != frames * FRAME.size:
+        raise TraceError(f"{path}: expected {frames} frames, found {len(data) / FRAME.size:g}")
+    if verify and hashlib.sha256(data).digest() != digest:
+        raise TraceError(f"{path}: frame data does not match the recorded digest")
+    info = {'frames': frames, 'interval': interval, 'seed': None if seed < 0 else seed,
+            'digest': digest.hex()}
+    return info, data
+
+def read_trace(path):
+    """All frames of a trace as GCS telemetry dicts"""
+    _, data = load_trace(path)
+    return [build_frame(fields) for fields in FRAME.iter_unpack(data)]
+
+class TraceDigest:
+    """SHA-256 of frames as a consumer received them, in trace byte form"""
+
+    def __init__(self):
+        self.hash = hashlib.sha256()
+        self.buffer = bytearray(FRAME.size)
+        self.frames = 0
+
+    def update(self, data):
+        pack_frame(self.buffer, data, self.frames)
+        self.hash.update(self.buffer)
+        self.frames += 1
+
+    def hexdigest(self):
+        return self.hash.hexdigest()
+
+class TracePlan:
+    """ReplaySource plan for trace rows (unpacked FRAME tuples)"""
+
+    def build(self, values, convert=False):
+        return build_frame(values)
+
+    def has_error(self, values):
+        return values[_ERROR_CODE] != 0
+
+class TraceSegment:
+    """A golden trace as a ReplaySource segment"""
+    is_text = False
+
+    def __init__(self, path):
+        self.path = path
+        self.plan = TracePlan()
+        self.data = None
+        self.rows = None
+        with open(path, 'rb') as f:
+            header = HEADER.unpack(f.read(HEADER.size))
+        self.interval = header[3]
+
+    def build_index(self):
+        _, self.data = load_trace(self.path)
+        self.rows = len(self.data) // FRAME.size
+
+    def iter_rows(self, start=0):
+        return FRAME.iter_unpack(memoryview(self.data)[start * FRAME.size:])
+
+class TracePlayer(QThread):
+    """Emits every frame of a trace, in order, at a fixed rate.
+
+    Unlike ReplaySource no frame is ever skipped, so consumers see the
+    whole trace. ``rate`` is frames per second (default: the trace's own
+    interval); ``rate=0`` emits as fast as the receivers keep up.
+    """
+    data_updated = pyqtSignal(dict)
+    finished_playback = pyqtSignal()
+
+    def __init__(self, path, rate=None, loops=1):
+        super().__init__()
+        self.info, data = load_trace(path)
+        self.rows = list(FRAME.iter_unpack(data))
+        self.rate = 1.0 / self.info['interval'] if rate is None else rate
+        self.loops = loops
+        self.running = True
+        self.emitted = 0
+
+    def stop(self):
+        self.running = False
+        self.wait()
+
+    def run(self):
+        start = time.monotonic()
+        for _ in range(self.loops):
+            for fields in self.rows:
+                if not self.running:
+                    return
+                if self.rate:
+                    delay = start + self.emitted / self.rate - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+                # A fresh dict per emit, so slots that modify it can't alter later loops
+                self.data_updated.emit(build_frame(fields))
+                self.emitted += 1
+        self.finished_playback.emit()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Record and check golden telemetry traces")
+    sub = parser.add_subparsers(dest="command", required=True)
+    record_parser = sub.add_parser("record", help="record a seeded simulator run")
+    record_parser.add_argument("path")
+    record_parser.add_argument("--frames", type=int, default=3600)
+    record_parser.add_argument("--interval", type=float, default=1.0, help="simulated seconds per frame")
+    record_parser.add_argument("--seed", type=int, default=0)
+    verify_parser = sub.add_parser("verify", help="check a trace's digest and round trip")
+    verify_parser.add_argument("path")
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        info = record_trace(args.path, args.frames, args.interval, args.seed)
+        print(f"[Trace] {info['frames']} frames written to {args.path} (sha256 {info['digest'][:16]})")
+        return 0
+
+    try:
+        info, _ = load_trace(args.path)
+    except TraceError as e:
+        print(f"[Trace] {e}")
+        return 1
+    digest = TraceDigest()
+    for frame in read_trace(args.path):
+        digest.update(frame)
+    round_trip = digest.hexdigest() == info['digest']
+    print(f"[Trace] {info['frames']} frames, interval {info['interval']}s, seed {info['seed']}, "
+          f"round trip {'ok' if round_trip else 'MISMATCH'}")
+    if info['seed'] is not None:
+        # Catches simulator changes that would silently alter benchmark input
+        fresh = simulate_trace(info['frames'], info['interval'], info['seed'])
+        same = hashlib.sha256(fresh).hexdigest() == info['digest']
+        print(f"[Trace] Re-simulated with seed {info['seed']}: {'identical' if same else 'DIFFERENT'}")
+        round_trip = round_trip and same
+    return 0 if round_trip else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
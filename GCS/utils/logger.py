@@ -1,56 +1,439 @@
 import os
 import csv
+import gzip
+import json
+import time
+import shutil
+import queue
+import threading
 from datetime import datetime
+from utils.telemetry_log import ColumnarLogWriter, kind_of
+
+LOG_FORMATS = {
+    # format: (file extension, file mode)
+    "csv": (".csv", "w"),
+    "columnar": (".gtl", "wb"),
+}
+
+class FlattenPlan:
+    """Precompiled mapping from a telemetry frame to a flat CSV row.
+
+    Built from the first frame: every column becomes a (key, sub) accessor
+    where ``sub`` is None, a list index or a dict key. Applying the plan is
+    a single list comprehension with no intermediate dicts. Passing the
+    previous plan as ``base`` keeps its columns first and appends any new
+    ones, which is how channels added mid-flight are picked up.
+    """
+
+    def __init__(self, frame, base=None):
+        self.fields = list(base.fields) if base else []
+        self.accessors = list(base.accessors) if base else []
+        self.kinds = list(base.kinds) if base else []
+        known = set(self.fields)
+        for key, value in frame.items():
+            if isinstance(value, dict):
+                columns = [(f"{key}_{subkey}", subkey, subvalue)
+                           for subkey, subvalue in value.items()]
+            elif isinstance(value, list):
+                columns = [(f"{key}_{i}", i, item) for i, item in enumerate(value)]
+            else:
+                columns = [(key, None, value)]
+            for field, sub, sample in columns:
+                if field not in known:
+                    self.fields.append(field)
+                    self.accessors.append((key, sub))
+                    self.kinds.append(kind_of(sample))
+
+        # Cheap shape check used to spot frames with new channels
+        self.shape = {key: len(value) if isinstance(value, (dict, list)) else None
+                      for key, value in frame.items()}
+
+    def covers(self, frame):
+        """True if the frame has no channels beyond this plan's columns"""
+        shape = self.shape
+        if len(frame) > len(shape):
+            return False
+        for key, value in frame.items():
+            size = shape.get(key, -1)
+            if size is None:
+                continue
+            if size == -1 or len(value) > size:
+                return False
+        return True
+
+    def apply(self, frame):
+        try:
+            return [frame[key] if sub is None else frame[key][sub]
+                    for key, sub in self.accessors]
+        except (KeyError, IndexError, TypeError):
+            return self._apply_lenient(frame)
+
+    def _apply_lenient(self, frame):
+        # A frame that doesn't match the schema; missing values become None
+        row = []
+        for key, sub in self.accessors:
+            value = frame.get(key)
+            if sub is not None:
+                try:
+                    value = value[sub]
+                except (KeyError, IndexError, TypeError):
+                    value = None
+            row.append(value)
+        return row
+
+class SchemaChange:
+    """Queue marker: rows after this one use a new column set"""
+    __slots__ = ('fields', 'kinds')
+
+    def __init__(self, fields, kinds):
+        self.fields = list(fields)
+        self.kinds = list(kinds)
+
+class CsvLogWriter:
+    """Plain CSV output; the header is fixed by the first schema"""
+
+    def __init__(self, file):
+        self.file = file
+        self.writer = csv.writer(file)
+        self.width = None
+
+    def set_schema(self, fields, kinds):
+        # CSV can't grow columns without rewriting the file, so new
+        # channels after the first schema are dropped
+        if self.width is None:
+            self.width = len(fields)
+            self.writer.writerow(fields)
+
+    def write_rows(self, rows):
+        width = self.width
+        self.writer.writerows(row if len(row) == width else row[:width] for row in rows)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+class SessionManifest:
+    """JSON manifest tying the rotated segments of one session together.
+
+    Each segment entry records its file name, row count, wall-clock span
+    and status ("active", "closed" while it waits to be gzipped,
+    "complete" or "deleted"). Readers can safely use any "complete"
+    segment while logging continues: its file is final and is not removed
+    until retention marks it "deleted". The file is replaced atomically on
+    every update, and updates come from both the writer and the compressor
+    thread, hence the lock.
+    """
+
+    def __init__(self, path, session, log_format):
+        self.path = path
+        self.lock = threading.Lock()
+        self.data = {
+            "session": session,
+            "format": log_format,
+            "started": time.time(),
+            "ended": None,
+            "segments": [],
+        }
+
+    def add_segment(self, filename):
+        with self.lock:
+            self.data["segments"].append({
+                "file": filename, "rows": 0, "bytes": 0, "status": "active",
+                "started": time.time(), "ended": None, "compressed": False,
+            })
+            self._save()
+
+    def update_segment(self, index, **fields):
+        with self.lock:
+            self.data["segments"][index].update(fields)
+            self._save()
+
+    def expire(self, keep):
+        """Mark all but the newest ``keep`` complete segments deleted.
+
+        Returns their file names; the caller removes the files afterwards.
+        """
+        with self.lock:
+            complete = [seg for seg in self.data["segments"] if seg["status"] == "complete"]
+            expired = complete[:max(0, len(complete) - keep)]
+            if not expired:
+                return []
+            for seg in expired:
+                seg["status"] = "deleted"
+            self._save()
+            return [seg["file"] for seg in expired]
+
+    def finish(self):
+        with self.lock:
+            self.data["ended"] = time.time()
+            self._save()
+
+    def _save(self):
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.data, f, indent=2)
+        os.replace(tmp, self.path)
+
+def load_manifest(path):
+    """Return a session manifest with absolute paths for completed segments"""
+    with open(path) as f:
+        manifest = json.load(f)
+    directory = os.path.dirname(os.path.abspath(path))
+    manifest["complete_files"] = [
+        os.path.join(directory, seg["file"]) for seg in manifest["segments"]
+        if seg["status"] == "complete"
+    ]
+    return manifest
 
 class DataLogger:
-    def __init__(self, save_dir="logs"):
+    """Telemetry logger with the file I/O on a background thread.
+
+    ``log_format`` is "csv" or "columnar" (see utils.telemetry_log; typed,
+    compressed columns that also record channels added mid-flight).
+
+    ``log`` only applies the flatten plan and queues the row, so the GUI
+    thread never touches the file. The writer thread drains the queue in
+    batches, flushes after each batch and fsyncs every ``fsync_interval``
+    seconds. If the writer falls behind and the queue fills up, frames are
+    dropped (and counted) rather than blocking the caller.
+
+    With ``rotate_mb`` and/or ``rotate_minutes`` the session is split into
+    ``log_<timestamp>_partNNN`` segments listed in
+    ``log_<timestamp>.manifest.json``. Finished CSV segments are gzipped
+    by a compressor thread and only then marked complete; ``max_segments``
+    optionally deletes the oldest complete segments to keep disk usage
+    bounded.
+    """
+
+    def __init__(self, save_dir="logs", log_format="csv", queue_size=10000,
+                 batch_size=256, fsync_interval=5.0, rotate_mb=None,
+                 rotate_minutes=None, compress=True, max_segments=None):
         self.save_dir = save_dir
         os.makedirs(save_dir, exist_ok=True)
+        if log_format not in LOG_FORMATS:
+            raise ValueError(f"Unknown log format: {log_format}")
+        self.log_format = log_format
         self.file = None
         self.writer = None
+        self.plan = None
+        self.pending_schema = None
         self.fields = []
         self.logging = False
 
-    def start(self):
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.fsync_interval = fsync_interval
+        self.queue = None
+        self.writer_thread = None
+        self.dropped = 0
+        self.written = 0
+
+        self.rotate_bytes = int(rotate_mb * 1024 * 1024) if rotate_mb else None
+        self.rotate_seconds = rotate_minutes * 60 if rotate_minutes else None
+        self.rotating = bool(self.rotate_bytes or self.rotate_seconds)
+        # Columnar blocks are already compressed
+        self.compress = compress and log_format == "csv"
+        self.max_segments = max_segments
+        self.manifest = None
+        self.compress_queue = None
+        self.compress_thread = None
+
+    def start(self, session=None):
+        """Open a new session; ``session`` overrides the timestamped name"""
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        self.filepath = os.path.join(self.save_dir, f"log_{timestamp}.csv")
-        self.file = open(self.filepath, mode='w', newline='')
-        self.writer = None
+        self.session = session or f"log_{timestamp}"
+        self.segment_index = -1
+        self.schema = None
+        self.manifest = None
+        if self.rotating:
+            self.manifest = SessionManifest(
+                os.path.join(self.save_dir, f"{self.session}.manifest.json"),
+                self.session, self.log_format)
+            self.compress_queue = queue.Queue()
+            self.compress_thread = threading.Thread(
+                target=self._compress_loop, name="DataLoggerCompressor", daemon=True)
+            self.compress_thread.start()
+        self._open_segment()
+
+        self.plan = None
+        self.pending_schema = None
+        self.dropped = 0
+        self.written = 0
+        self.queue = queue.Queue(maxsize=self.queue_size)
+        self.writer_thread = threading.Thread(
+            target=self._write_loop, args=(self.queue,),
+            name="DataLoggerWriter", daemon=True)
+        self.writer_thread.start()
         self.logging = True
         print(f"[Logger] Started logging to {self.filepath}")
 
     def stop(self):
         self.logging = False
+        if self.writer_thread is not None:
+            # Sentinel: the writer drains everything queued before it
+            self.queue.put(None)
+            self.writer_thread.join()
+            self.writer_thread = None
         if self.file:
-            self.file.close()
-            print(f"[Logger] Stopped logging.")
+            self._close_segment()
+            if self.compress_thread is not None:
+                self.compress_queue.put(None)
+                self.compress_thread.join()
+                self.compress_thread = None
+            if self.manifest is not None:
+                self.manifest.finish()
+            print(f"[Logger] Stopped logging ({self.written} frames written, {self.dropped} dropped).")
 
-    def log(self, data: dict):
-        if not self.logging or self.file is None:
+    def log(self, data: dict, block=False):
+        # self.file is swapped by the writer thread during rotation, so only
+        # the logging flag is checked here
+        if not self.logging:
             return
 
-        flat_data = self._flatten(data)
+        if self.plan is None or not self.plan.covers(data):
+            self.plan = FlattenPlan(data, base=self.plan)
+            self.fields = self.plan.fields
+            # Queued ahead of the next row that fits, never blocking here
+            self.pending_schema = SchemaChange(self.plan.fields, self.plan.kinds)
 
-        if self.writer is None:
-            self.fields = list(flat_data.keys())
-            self.writer = csv.DictWriter(self.file, fieldnames=self.fields)
-            self.writer.writeheader()
+        row = self.plan.apply(data)
+        if block:
+            # Offline producers (e.g. simulated-clock runs) wait for the writer
+            if self.pending_schema is not None:
+                self.queue.put(self.pending_schema)
+                self.pending_schema = None
+            self.queue.put(row)
+            return
+        try:
+            if self.pending_schema is not None:
+                self.queue.put_nowait(self.pending_schema)
+                self.pending_schema = None
+            self.queue.put_nowait(row)
+        except queue.Full:
+            self.dropped += 1
 
-        # consistent headers
-        for key in self.fields:
-            flat_data.setdefault(key, None)
+    def _open_segment(self):
+        self.segment_index += 1
+        extension, mode = LOG_FORMATS[self.log_format]
+        if self.rotating:
+            filename = f"{self.session}_part{self.segment_index:03d}{extension}"
+        else:
+            filename = f"{self.session}{extension}"
+        self.filepath = os.path.join(self.save_dir, filename)
+        if self.log_format == "columnar":
+            self.file = open(self.filepath, mode=mode)
+            self.writer = ColumnarLogWriter(self.file)
+        else:
+            self.file = open(self.filepath, mode=mode, newline='')
+            self.writer = CsvLogWriter(self.file)
+        # Every segment is self-contained, so it starts with the schema
+        if self.schema is not None:
+            self.writer.set_schema(self.schema.fields, self.schema.kinds)
+        self.segment_rows = 0
+        self.segment_started = time.monotonic()
+        if self.manifest is not None:
+            self.manifest.add_segment(filename)
 
-        self.writer.writerow(flat_data)
+    def _close_segment(self):
+        self.writer.close()
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.file.close()
+        self.file = None
+        if self.manifest is not None:
+            # A segment to be gzipped is only complete once the .gz is in place
+            self.manifest.update_segment(
+                self.segment_index, rows=self.segment_rows,
+                bytes=os.path.getsize(self.filepath), ended=time.time(),
+                status="closed" if self.compress else "complete")
+            if self.compress:
+                self.compress_queue.put((self.segment_index, self.filepath))
+            else:
+                self._enforce_retention()
 
-    def _flatten(self, data):
-        flat = {}
-        for key, value in data.items():
-            if isinstance(value, dict):
-                for subkey, subvalue in value.items():
-                    flat[f"{key}_{subkey}"] = subvalue
-            elif isinstance(value, list):
-                for i, item in enumerate(value):
-                    flat[f"{key}_{i}"] = item
+    def _segment_full(self):
+        if self.rotate_bytes and os.fstat(self.file.fileno()).st_size >= self.rotate_bytes:
+            return True
+        if self.rotate_seconds and time.monotonic() - self.segment_started >= self.rotate_seconds:
+            return True
+        return False
+
+    def _write_rows(self, rows):
+        self.writer.write_rows(rows)
+        self.written += len(rows)
+        self.segment_rows += len(rows)
+
+    def _write_loop(self, rows):
+        last_sync = time.monotonic()
+        while True:
+            batch = [rows.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(rows.get_nowait())
+                except queue.Empty:
+                    break
+
+            done = batch[-1] is None
+            if done:
+                batch.pop()
+
+            # Schema changes are in-band so they apply at the right row
+            rows_start = 0
+            for i, item in enumerate(batch):
+                if isinstance(item, SchemaChange):
+                    self._write_rows(batch[rows_start:i])
+                    self.schema = item
+                    self.writer.set_schema(item.fields, item.kinds)
+                    rows_start = i + 1
+            self._write_rows(batch[rows_start:])
+            if done:
+                # stop() closes the last segment once this thread has exited
+                return
+            self.file.flush()
+
+            now = time.monotonic()
+            if now - last_sync >= self.fsync_interval:
+                os.fsync(self.file.fileno())
+                last_sync = now
+            if self.rotating and self._segment_full():
+                self._close_segment()
+                self._open_segment()
+                last_sync = now
+
+    def _compress_loop(self):
+        while True:
+            item = self.compress_queue.get()
+            if item is None:
+                return
+            index, path = item
+            try:
+                with open(path, "rb") as src, gzip.open(path + ".gz", "wb", compresslevel=6) as dst:
+                    shutil.copyfileobj(src, dst, 1024 * 1024)
+            except OSError as e:
+                print(f"[Logger] Could not compress {path}: {e}")
+                # Keep the plain segment
+                self.manifest.update_segment(index, status="complete")
             else:
-                flat[key] = value
-        return flat
+                # Point readers at the .gz before the plain file goes away
+                self.manifest.update_segment(
+                    index, file=os.path.basename(path) + ".gz",
+                    bytes=os.path.getsize(path + ".gz"), compressed=True,
+                    status="complete")
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._enforce_retention()
+
+    def _enforce_retention(self):
+        # Runs on the writer thread, or on the compressor when compressing;
+        # the manifest lock makes picking and marking the victims atomic
+        if not self.max_segments:
+            return
+        for filename in self.manifest.expire(self.max_segments):
+            try:
+                os.remove(os.path.join(self.save_dir, filename))
+            except OSError:
+                pass
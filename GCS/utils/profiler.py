@@ -0,0 +1,243 @@
+"""Slot profiling and a live performance overlay.
+
+Slots decorated with ``@profiled`` record their call count, total and
+max time and a histogram of call times. A ``Heartbeat`` timer measures
+how late the event loop services it, which is the lag the operator
+feels. ``ProfilerOverlay`` shows the top offenders on top of the window
+(toggle with F12) and can dump everything to ``profiles/`` as JSON.
+
+Recording costs well under a microsecond per call, so the hooks are
+always on; the overlay only decides whether anyone looks at them.
+
+``thrust_stand_app/utils/profiler.py`` is a copy of this file: change it
+here first, then copy it across so the two stay in step.
+"""
+import os
+import json
+import time
+import threading
+import functools
+from collections import deque
+from datetime import datetime
+from PyQt5.QtWidgets import QFrame, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QShortcut
+from PyQt5.QtCore import Qt, QObject, QTimer, QEvent
+from PyQt5.QtGui import QKeySequence
+
+# Histogram bucket upper edges in microseconds; the last bucket is open-ended
+BUCKET_EDGES_US = (10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 20000, 50000, 100000)
+
+class TimingStats:
+    """Call count, total/max time and a log-spaced histogram"""
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(BUCKET_EDGES_US) + 1)
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        micros = seconds * 1e6
+        index = 0
+        for edge in BUCKET_EDGES_US:
+            if micros < edge:
+                break
+            index += 1
+        self.buckets[index] += 1
+
+    def percentile(self, fraction):
+        """Upper bucket edge below which ``fraction`` of calls fall, in ms"""
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets[:-1]):
+            seen += count
+            if seen >= target:
+                return min(BUCKET_EDGES_US[index] / 1000, self.max * 1000)
+        return self.max * 1000
+
+    def summary(self):
+        return {
+            'calls': self.count,
+            'total_ms': round(self.total * 1000, 3),
+            'mean_ms': round(self.total * 1000 / self.count, 4) if self.count else 0.0,
+            'p50_ms': self.percentile(0.5),
+            'p99_ms': self.percentile(0.99),
+            'max_ms': round(self.max * 1000, 3),
+            'histogram': dict(zip([f"<{edge}us" for edge in BUCKET_EDGES_US] + ["more"], self.buckets)),
+        }
+
+class Profiler:
+    """Process-wide registry of slot timings"""
+
+    def __init__(self):
+        self.slots = {}
+        self.heartbeat = TimingStats()
+        self.main_thread = threading.get_ident()
+        # Slots currently running on the main thread, outermost first
+        self.active = []
+        # Main-thread stalls reported by utils.watchdog, newest last
+        self.stalls = deque(maxlen=50)
+        self.started = time.monotonic()
+
+    def slot(self, label):
+        stats = self.slots.get(label)
+        if stats is None:
+            stats = self.slots[label] = TimingStats()
+        return stats
+
+    def reset(self):
+        for stats in self.slots.values():
+            stats.clear()
+        self.heartbeat.clear()
+        self.started = time.monotonic()
+
+    def top(self, count=8):
+        ranked = sorted(self.slots.items(), key=lambda item: item[1].total, reverse=True)
+        return [(label, stats) for label, stats in ranked[:count] if stats.count]
+
+    def snapshot(self):
+        return {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'seconds': round(time.monotonic() - self.started, 3),
+            'heartbeat_lag': self.heartbeat.summary(),
+            'stalls': list(self.stalls),
+            'slots': {label: stats.summary() for label, stats in self.top(len(self.slots))},
+        }
+
+    def dump(self, directory="profiles"):
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"profile_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.json")
+        with open(path, 'w') as f:
+            json.dump(self.snapshot(), f, indent=2)
+        print(f"[Profiler] Profile written to {path}")
+        return path
+
+PROFILER = Profiler()
+
+def profiled(func=None, label=None):
+    """Decorator that records every call of a slot in PROFILER"""
+    if func is None:
+        return lambda f: profiled(f, label)
+    label = label or func.__qualname__
+    stats = PROFILER.slot(label)
+    active = PROFILER.active
+    main_thread = PROFILER.main_thread
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        on_main = threading.get_ident() == main_thread
+        if on_main:
+            active.append(label)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stats.add(time.perf_counter() - start)
+            if on_main:
+                active.pop()
+    return wrapper
+
+class Heartbeat(QObject):
+    """Main-thread timer whose lateness is the event-loop lag"""
+
+    def __init__(self, interval_ms=50, parent=None):
+        super().__init__(parent)
+        self.interval = interval_ms / 1000
+        self.last_beat = time.monotonic()
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self.beat)
+        self.timer.start()
+
+    def beat(self):
+        now = time.monotonic()
+        PROFILER.heartbeat.add(max(0.0, now - self.last_beat - self.interval))
+        self.last_beat = now
+
+class ProfilerOverlay(QFrame):
+    """Floating top-offenders table in the window's top-right corner.
+
+    Styled by the application theme (``ProfilerOverlay`` rules).
+    """
+
+    def __init__(self, window, rows=8):
+        super().__init__(window)
+        self.target = window
+        self.rows = rows
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(8, 6, 8, 6)
+        self.table = QLabel()
+        self.table.setTextFormat(Qt.PlainText)
+        layout.addWidget(self.table)
+        buttons = QHBoxLayout()
+        reset_button = QPushButton("Reset")
+        reset_button.clicked.connect(lambda: PROFILER.reset())
+        dump_button = QPushButton("Dump")
+        dump_button.clicked.connect(self.dump)
+        self.status = QLabel("F12 to hide")
+        buttons.addWidget(self.status)
+        buttons.addStretch(1)
+        buttons.addWidget(reset_button)
+        buttons.addWidget(dump_button)
+        layout.addLayout(buttons)
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(500)
+        self.refresh_timer.timeout.connect(self.refresh)
+        window.installEventFilter(self)
+        self.hide()
+
+    def toggle(self):
+        # isHidden, not isVisible: the window itself may not be shown yet
+        self.setHidden(not self.isHidden())
+        if not self.isHidden():
+            self.refresh()
+            self.refresh_timer.start()
+            self.raise_()
+        else:
+            self.refresh_timer.stop()
+
+    def dump(self):
+        path = PROFILER.dump()
+        self.status.setText(f"Saved {os.path.basename(path)}")
+
+    def refresh(self):
+        elapsed = max(1e-6, time.monotonic() - PROFILER.started)
+        lag = PROFILER.heartbeat
+        lines = [f"event loop lag  p50 {lag.percentile(0.5):6.1f}  p99 {lag.percentile(0.99):6.1f}"
+                 f"  max {lag.max * 1000:6.1f} ms  stalls {len(PROFILER.stalls)}",
+                 f"{'slot':<34}{'calls/s':>8}{'mean':>8}{'p99':>8}{'max':>8}{'%time':>7}"]
+        for label, stats in PROFILER.top(self.rows):
+            lines.append(f"{label[-34:]:<34}{stats.count / elapsed:8.1f}"
+                         f"{stats.total * 1000 / stats.count:8.2f}{stats.percentile(0.99):8.1f}"
+                         f"{stats.max * 1000:8.1f}{100 * stats.total / elapsed:6.1f}%")
+        self.table.setText("\n".join(lines))
+        self.adjustSize()
+        self._place()
+
+    def _place(self):
+        self.move(self.target.width() - self.width() - 12, 12)
+
+    def eventFilter(self, obj, event):
+        if obj is self.target and event.type() == QEvent.Resize and not self.isHidden():
+            self._place()
+        return False
+
+def install_overlay(window, show=False):
+    """Add the heartbeat, the overlay and its F12 shortcut to ``window``"""
+    window.heartbeat = Heartbeat(parent=window)
+    window.profiler_overlay = ProfilerOverlay(window)
+    shortcut = QShortcut(QKeySequence("F12"), window)
+    shortcut.activated.connect(window.profiler_overlay.toggle)
+    if show:
+        window.profiler_overlay.toggle()
+    return window.profiler_overlay
@@ -0,0 +1,337 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+from utils.logger import load_manifest
+from utils.telemetry_log import ColumnarLogReader
+from utils.golden_trace import TraceSegment
+import re
+import csv
+import gzip
+import time
+import threading
+from bisect import bisect_right
+
+# Nested dicts in a DataSimulator frame; everything ending in _<n> is a list
+DICT_KEYS = ('gps_health', 'sensor_health', 'errors')
+LIST_FIELD = re.compile(r'^(.+)_(\d+)$')
+
+# Rows between entries of the seek index
+INDEX_STRIDE = 1000
+
+def _convert(text):
+    """Turn a CSV cell back into the value DataLogger wrote"""
+    if text == '':
+        return None
+    if text == 'True':
+        return True
+    if text == 'False':
+        return False
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        return text
+
+class UnflattenPlan:
+    """Rebuilds nested telemetry frames from DataLogger's flat columns.
+
+    ``motor_rpms_0..6`` become the ``motor_rpms`` list and
+    ``gps_health_HDOP`` etc. become the ``gps_health`` dict, the inverse
+    of logger.FlattenPlan.
+    """
+
+    def __init__(self, fields):
+        self.fields = list(fields)
+        self.accessors = []
+        self.list_sizes = {}
+        self.dict_keys = []
+        for field in self.fields:
+            prefix = next((k for k in DICT_KEYS if field.startswith(k + '_')), None)
+            match = LIST_FIELD.match(field)
+            if prefix is not None:
+                self.accessors.append((prefix, field[len(prefix) + 1:]))
+                if prefix not in self.dict_keys:
+                    self.dict_keys.append(prefix)
+            elif match:
+                key, index = match.group(1), int(match.group(2))
+                self.accessors.append((key, index))
+                self.list_sizes[key] = max(self.list_sizes.get(key, 0), index + 1)
+            else:
+                self.accessors.append((field, None))
+        self.error_column = self.fields.index('errors_code') if 'errors_code' in self.fields else None
+
+    def build(self, values, convert=True):
+        frame = {key: [None] * size for key, size in self.list_sizes.items()}
+        for key in self.dict_keys:
+            frame[key] = {}
+        for (key, sub), value in zip(self.accessors, values):
+            if convert:
+                value = _convert(value)
+            if sub is None:
+                frame[key] = value
+            else:
+                frame[key][sub] = value
+        return frame
+
+    def has_error(self, values):
+        """Cheap check on a raw row, without building the frame"""
+        return self.error_column is not None and values[self.error_column] not in ('', None)
+
+class CsvSegment:
+    """A CSV (or gzipped CSV) log file read row by row with a sparse seek index"""
+
+    # Rows are lists of strings that still need converting
+    is_text = True
+
+    def __init__(self, path):
+        self.path = path
+        self.compressed = path.endswith('.gz')
+        with self._open_binary() as f:
+            self.fields = next(csv.reader([f.readline().decode()]))
+        self.plan = UnflattenPlan(self.fields)
+        self.offsets = None
+        self.rows = None
+
+    def _open_binary(self):
+        return gzip.open(self.path, 'rb') if self.compressed else open(self.path, 'rb')
+
+    def build_index(self):
+        """Count rows and record a byte offset every INDEX_STRIDE rows"""
+        offsets = []
+        rows = 0
+        with self._open_binary() as f:
+            f.readline()
+            offset = f.tell()
+            for line in f:
+                if rows % INDEX_STRIDE == 0:
+                    offsets.append(offset)
+                offset += len(line)
+                rows += 1
+        self.offsets = offsets
+        self.rows = rows
+
+    def iter_rows(self, start=0):
+        """Yield raw rows (lists of strings) from row ``start`` onward"""
+        with self._open_binary() as f:
+            f.readline()
+            skip = start
+            if self.offsets and not self.compressed:
+                block = min(start // INDEX_STRIDE, len(self.offsets) - 1)
+                f.seek(self.offsets[block])
+                skip = start - block * INDEX_STRIDE
+            lines = (line.decode() for line in f)
+            for values in csv.reader(lines):
+                if skip:
+                    skip -= 1
+                    continue
+                if values:
+                    yield values
+
+class ColumnarSegment:
+    """A .gtl log read one block at a time; the seek index is the block list"""
+    is_text = False
+
+    def __init__(self, path):
+        self.path = path
+        self.reader = None
+        self.fields = None
+        self.plan = None
+        self.rows = None
+        self.block_starts = None
+
+    def build_index(self):
+        """Index block offsets and row counts; no block is decompressed"""
+        self.reader = ColumnarLogReader(self.path)
+        self.fields = [name for name, _ in self.reader.columns]
+        self.plan = UnflattenPlan(self.fields)
+        self.rows = self.reader.rows
+        self.block_starts = []
+        first = 0
+        for _, _, rows in self.reader.blocks:
+            self.block_starts.append(first)
+            first += rows
+
+    def iter_rows(self, start=0):
+        if not self.block_starts:
+            return
+        block = max(0, bisect_right(self.block_starts, start) - 1)
+        skip = start - self.block_starts[block]
+        for columns in self.reader.iter_blocks(block):
+            arrays = [columns[name] for name in self.fields]
+            for i in range(skip, len(arrays[0]) if arrays else 0):
+                yield [_native(array[i]) for array in arrays]
+            skip = 0
+
+def _native(value):
+    if hasattr(value, 'item'):
+        value = value.item()
+    if isinstance(value, float):
+        if value != value:
+            return None
+        # .gtl stores every number as a float; give counts back as ints, like CSV
+        if value.is_integer():
+            return int(value)
+    return value
+
+def open_segments(path):
+    """Return the segments of a log file, golden trace, or session manifest"""
+    if path.endswith('.gtrace'):
+        return [TraceSegment(path)]
+    if path.endswith('.manifest.json'):
+        files = load_manifest(path)['complete_files']
+    else:
+        files = [path]
+    return [ColumnarSegment(f) if f.endswith('.gtl') else CsvSegment(f) for f in files]
+
+class ReplaySource(QThread):
+    """Plays a DataLogger session back through the simulator's signal.
+
+    Emits ``data_updated(dict)`` exactly like DataSimulator, so it can be
+    connected to MainWindow.handle_data_update in its place. Rows are
+    streamed from disk; only a sparse seek index is kept in memory.
+
+    DataLogger files carry no timestamps, so frames are assumed to be
+    ``frame_interval`` seconds apart. At high speeds the GUI is updated at
+    most ``max_emit_rate`` times per second: intermediate frames are
+    skipped unless they carry an error, so the error log stays complete.
+    """
+    data_updated = pyqtSignal(dict)
+    position_changed = pyqtSignal(int, int)  # current frame, total frames
+    finished_replay = pyqtSignal()
+
+    def __init__(self, path, speed=1.0, frame_interval=1.0, max_emit_rate=60):
+        super().__init__()
+        self.path = path
+        self.speed = speed
+        self.frame_interval = frame_interval
+        self.max_emit_rate = max_emit_rate
+        self.running = True
+        self.paused = False
+        self.segments = open_segments(path)
+        # Golden traces record their own frame interval
+        self.frame_interval = getattr(self.segments[0], 'interval', frame_interval)
+        self.segment_starts = []
+        self.total_frames = 0
+        self.position = 0
+        self.lock = threading.Lock()
+        self.seek_request = None
+
+    # Control methods are safe to call from the GUI thread
+    def set_speed(self, speed):
+        self.speed = max(0.01, float(speed))
+
+    def set_paused(self, paused):
+        self.paused = paused
+
+    def seek(self, frame):
+        with self.lock:
+            self.seek_request = max(0, int(frame))
+
+    def stop(self):
+        self.running = False
+        self.quit()
+        self.wait()
+
+    def run(self):
+        for segment in self.segments:
+            self.segment_starts.append(self.total_frames)
+            segment.build_index()
+            self.total_frames += segment.rows
+        self.position_changed.emit(0, self.total_frames)
+
+        start = 0
+        while self.running:
+            restart = self._play_from(start)
+            if restart is None:
+                # Stay alive at the end so the operator can still seek back
+                self.finished_replay.emit()
+                restart = self._wait_for_seek()
+                if restart is None:
+                    break
+            start = restart
+
+    def _wait_for_seek(self):
+        while self.running:
+            request = self._take_seek()
+            if request is not None:
+                return request
+            self.msleep(50)
+        return None
+
+    def _take_seek(self):
+        with self.lock:
+            request, self.seek_request = self.seek_request, None
+        return request
+
+    def _play_from(self, start):
+        """Play from frame ``start``; return a seek target or None when done"""
+        start = min(start, max(0, self.total_frames - 1))
+        clock_start = time.monotonic()
+        frame_start = start
+        speed = self.speed
+        last_emit = 0.0
+        frame = start
+        last_values = None
+        last_segment = None
+
+        for index, segment in enumerate(self.segments):
+            seg_start = self.segment_starts[index]
+            if seg_start + segment.rows <= start:
+                continue
+            for values in segment.iter_rows(max(0, start - seg_start)):
+                if not self.running:
+                    return None
+                request = self._take_seek()
+                if request is not None:
+                    return request
+                while self.paused and self.running:
+                    self.msleep(50)
+                    request = self._take_seek()
+                    if request is not None:
+                        return request
+                    clock_start = time.monotonic()
+                    frame_start = frame
+
+                # Wait until this frame is due at the current speed
+                if self.speed != speed:
+                    speed = self.speed
+                    clock_start = time.monotonic()
+                    frame_start = frame
+                due = clock_start + (frame - frame_start) * self.frame_interval / speed
+                now = time.monotonic()
+                if due > now and last_values is not None:
+                    self._emit(last_segment, last_values, frame - 1)
+                    last_values = None
+                while due > now:
+                    # Sleep in short steps so seeks and stops stay responsive
+                    self.msleep(max(1, min(50, int((due - now) * 1000))))
+                    if not self.running:
+                        return None
+                    request = self._take_seek()
+                    if request is not None:
+                        return request
+                    if self.speed != speed or self.paused:
+                        break
+                    now = time.monotonic()
+
+                if segment.plan.has_error(values):
+                    self._emit(segment, values, frame)
+                    last_values = None
+                elif now - last_emit >= 1.0 / self.max_emit_rate:
+                    self._emit(segment, values, frame)
+                    last_emit = now
+                    last_values = None
+                else:
+                    last_values, last_segment = values, segment
+                frame += 1
+
+        if last_values is not None:
+            self._emit(last_segment, last_values, frame - 1)
+        self.position = frame
+        return None
+
+    def _emit(self, segment, values, frame):
+        self.position = frame
+        self.data_updated.emit(segment.plan.build(values, convert=segment.is_text))
+        self.position_changed.emit(frame, self.total_frames)
@@ -0,0 +1,40 @@
+class RingBuffer:
+    """Fixed-capacity buffer addressed by a monotonically increasing sequence.
+
+    Every appended item gets a sequence number (0, 1, 2, ...). Once the
+    buffer is full the oldest items are overwritten; ``get`` returns None
+    for sequences that have already been dropped. Storage is preallocated,
+    so appending never allocates or shifts anything.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.items = [None] * capacity
+        self.total = 0  # number of items ever appended
+
+    def __len__(self):
+        return min(self.total, self.capacity)
+
+    def append(self, item):
+        self.items[self.total % self.capacity] = item
+        self.total += 1
+        return self.total - 1
+
+    @property
+    def oldest(self):
+        """Sequence number of the oldest item still held"""
+        return max(0, self.total - self.capacity)
+
+    def get(self, seq):
+        if seq < self.oldest or seq >= self.total:
+            return None
+        return self.items[seq % self.capacity]
+
+    def __iter__(self):
+        """Iterate from oldest to newest"""
+        for seq in range(self.oldest, self.total):
+            yield self.items[seq % self.capacity]
+
+    def clear(self):
+        self.items = [None] * self.capacity
+        self.total = 0
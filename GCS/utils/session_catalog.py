@@ -0,0 +1,281 @@
+"""SQLite catalog of recorded telemetry sessions.
+
+Log directories are scanned incrementally: a session is only read again
+when its mtime or size changed, so rescanning thousands of sessions costs
+one ``stat`` each. Per-session metadata (rows, duration, channels, error
+count) and per-channel min/max/mean are extracted once and kept in
+``logs/catalog.db``, which makes browsing and filtering instant.
+
+Usage (from the GCS directory)::
+
+    python -m utils.session_catalog logs --where "max temp > 80 and errors > 0"
+"""
+import os
+import re
+import json
+import time
+import sqlite3
+import argparse
+import threading
+import numpy as np
+import pandas as pd
+from utils.analytics import iter_chunks, session_files
+
+DEFAULT_CATALOG_PATH = os.path.join("logs", "catalog.db")
+LOG_SUFFIXES = (".csv", ".csv.gz", ".gtl", ".manifest.json")
+
+SESSION_FIELDS = {"rows", "duration", "errors", "size"}
+STAT_FIELDS = {"min", "max", "mean"}
+OPERATORS = {">", ">=", "<", "<=", "=", "!="}
+CLAUSE = re.compile(r"^(\w+)\s+(?:(\S+)\s+)?(>=|<=|!=|>|<|=)\s*(-?[\d.]+)$")
+
+def extract_session(path, frame_interval=1.0, chunksize=100000):
+    """Read a log once and return its summary and per-channel stats"""
+    rows = 0
+    errors = 0
+    channels = []
+    stats = {}
+    first_time = last_time = None
+    for chunk in iter_chunks(path, chunksize):
+        rows += len(chunk)
+        channels += [c for c in chunk.columns if c not in channels]
+        if "errors_code" in chunk:
+            codes = chunk["errors_code"].dropna()
+            errors += int((codes.astype(str) != "").sum())
+        if "timestamp" in chunk and len(chunk):
+            times = pd.to_datetime(chunk["timestamp"], errors="coerce").dropna()
+            if len(times):
+                first_time = times.iloc[0] if first_time is None else first_time
+                last_time = times.iloc[-1]
+
+        numeric = chunk.select_dtypes(include=[np.number, bool]).astype(float)
+        for name, low, high, total, count in zip(
+                numeric.columns, numeric.min(), numeric.max(), numeric.sum(), numeric.count()):
+            if count == 0:
+                continue
+            if name in stats:
+                old = stats[name]
+                stats[name] = [min(old[0], low), max(old[1], high), old[2] + total, old[3] + count]
+            else:
+                stats[name] = [low, high, total, count]
+
+    if first_time is not None:
+        duration = (last_time - first_time).total_seconds()
+    else:
+        duration = rows * frame_interval
+    return {
+        "rows": rows,
+        "duration": duration,
+        "errors": errors,
+        "channels": channels,
+        "stats": {name: (float(low), float(high), float(total / count))
+                  for name, (low, high, total, count) in stats.items()},
+    }
+
+def parse_query(text):
+    """Turn "max temp > 80 and errors > 0" into a list of filter clauses.
+
+    Clauses are ``<min|max|mean> <channel> <op> <number>`` (the channel
+    matches as a substring, or as a glob when it contains ``*``),
+    ``<rows|duration|errors|size> <op> <number>``, or free text matched
+    against the session name.
+    """
+    clauses = []
+    for part in re.split(r"\s+and\s+", text.strip(), flags=re.IGNORECASE):
+        part = part.strip()
+        if not part:
+            continue
+        match = CLAUSE.match(part)
+        if match:
+            field, channel, op, value = match.groups()
+            field = field.lower()
+            if channel and field in STAT_FIELDS:
+                clauses.append((field, channel, op, float(value)))
+                continue
+            if not channel and field in SESSION_FIELDS:
+                clauses.append((field, None, op, float(value)))
+                continue
+        clauses.append(("name", part, "like", None))
+    return clauses
+
+class SessionCatalog:
+    """Session metadata and channel stats cached in SQLite"""
+
+    def __init__(self, path=DEFAULT_CATALOG_PATH, frame_interval=1.0):
+        self.path = path
+        self.frame_interval = frame_interval
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS sessions (
+                id INTEGER PRIMARY KEY, path TEXT UNIQUE, name TEXT,
+                mtime REAL, size INTEGER, rows INTEGER, duration REAL,
+                errors INTEGER, channels TEXT, scanned REAL
+            );
+            CREATE TABLE IF NOT EXISTS channel_stats (
+                session_id INTEGER, channel TEXT,
+                min REAL, max REAL, mean REAL,
+                PRIMARY KEY (session_id, channel)
+            );
+            CREATE INDEX IF NOT EXISTS channel_stats_max ON channel_stats (channel, max);
+            CREATE INDEX IF NOT EXISTS sessions_mtime ON sessions (mtime);
+        """)
+        self.conn.commit()
+
+    def find_sessions(self, directories):
+        """Return {path: (mtime, size)} for every session in the directories.
+
+        A rotated session is represented by its manifest; the segment
+        files it lists are not catalogued separately.
+        """
+        found = {}
+        segments = set()
+        for directory in directories:
+            if not os.path.isdir(directory):
+                continue
+            for entry in os.scandir(directory):
+                if not entry.is_file() or not entry.name.endswith(LOG_SUFFIXES):
+                    continue
+                path = os.path.abspath(entry.path)
+                info = entry.stat()
+                size = info.st_size
+                mtime = info.st_mtime
+                if entry.name.endswith(".manifest.json"):
+                    try:
+                        files = session_files(path)
+                    except (OSError, ValueError):
+                        continue
+                    segments.update(os.path.abspath(f) for f in files)
+                    # A session changes when segments complete, not only the manifest
+                    for f in files:
+                        if os.path.exists(f):
+                            stat = os.stat(f)
+                            size += stat.st_size
+                            mtime = max(mtime, stat.st_mtime)
+                found[path] = (mtime, size)
+        for path in segments:
+            found.pop(path, None)
+        return found
+
+    def scan(self, directories, progress=None):
+        """Bring the catalog up to date; return (added/updated, removed)"""
+        found = self.find_sessions(directories)
+        roots = [os.path.abspath(d) for d in directories]
+        with self.lock:
+            known = {path: (mtime, size) for path, mtime, size in self.conn.execute(
+                "SELECT path, mtime, size FROM sessions")}
+
+        changed = [path for path, signature in found.items() if known.get(path) != signature]
+        removed = [path for path in known if path not in found
+                   and any(path.startswith(root + os.sep) for root in roots)]
+
+        for i, path in enumerate(changed, 1):
+            try:
+                summary = extract_session(path, self.frame_interval)
+            except Exception as e:
+                print(f"[Catalog] Skipping {path}: {e}")
+                continue
+            self._store(path, found[path], summary)
+            if progress:
+                progress(i, len(changed), path)
+
+        with self.lock:
+            for path in removed:
+                self._delete(path)
+            self.conn.commit()
+        return len(changed), len(removed)
+
+    def _store(self, path, signature, summary):
+        name = os.path.basename(path)
+        for suffix in LOG_SUFFIXES:
+            if name.endswith(suffix):
+                name = name[:-len(suffix)]
+                break
+        mtime, size = signature
+        with self.lock:
+            self._delete(path)
+            cursor = self.conn.execute(
+                "INSERT INTO sessions (path, name, mtime, size, rows, duration, errors, channels, scanned)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (path, name, mtime, size, summary["rows"], summary["duration"],
+                 summary["errors"], json.dumps(summary["channels"]), time.time()))
+            self.conn.executemany(
+                "INSERT INTO channel_stats VALUES (?, ?, ?, ?, ?)",
+                [(cursor.lastrowid, channel) + values for channel, values in summary["stats"].items()])
+            self.conn.commit()
+
+    def _delete(self, path):
+        row = self.conn.execute("SELECT id FROM sessions WHERE path=?", (path,)).fetchone()
+        if row:
+            self.conn.execute("DELETE FROM channel_stats WHERE session_id=?", row)
+            self.conn.execute("DELETE FROM sessions WHERE id=?", row)
+
+    def query(self, where="", limit=None):
+        """Return matching sessions, newest first, as dicts"""
+        clauses = parse_query(where) if isinstance(where, str) else where
+        conditions = []
+        params = []
+        for field, channel, op, value in clauses:
+            if field == "name":
+                conditions.append("s.name LIKE ?")
+                params.append(f"%{channel}%")
+                continue
+            if op not in OPERATORS:
+                raise ValueError(f"Unsupported operator {op!r}")
+            if channel is None:
+                conditions.append(f"s.{field} {op} ?")
+                params.append(value)
+            else:
+                match = "c.channel GLOB ?" if "*" in channel or "?" in channel else "c.channel LIKE ?"
+                conditions.append(
+                    "EXISTS (SELECT 1 FROM channel_stats c WHERE c.session_id = s.id"
+                    f" AND {match} AND c.{field} {op} ?)")
+                params += [channel if "GLOB" in match else f"%{channel}%", value]
+
+        sql = "SELECT s.path, s.name, s.mtime, s.size, s.rows, s.duration, s.errors FROM sessions s"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY s.mtime DESC"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        keys = ("path", "name", "mtime", "size", "rows", "duration", "errors")
+        with self.lock:
+            return [dict(zip(keys, row)) for row in self.conn.execute(sql, params)]
+
+    def channel_stats(self, path):
+        """Return {channel: (min, max, mean)} for one catalogued session"""
+        with self.lock:
+            return {channel: (low, high, mean) for channel, low, high, mean in self.conn.execute(
+                "SELECT c.channel, c.min, c.max, c.mean FROM channel_stats c"
+                " JOIN sessions s ON s.id = c.session_id WHERE s.path=?",
+                (os.path.abspath(path),))}
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Index and search GCS telemetry logs")
+    parser.add_argument("directories", nargs="*", default=["logs"])
+    parser.add_argument("--catalog", default=DEFAULT_CATALOG_PATH)
+    parser.add_argument("--where", default="", help='e.g. "max temp > 80 and errors > 0"')
+    parser.add_argument("--no-scan", action="store_true", help="query the existing catalog only")
+    args = parser.parse_args(argv)
+
+    catalog = SessionCatalog(args.catalog)
+    if not args.no_scan:
+        start = time.monotonic()
+        changed, removed = catalog.scan(args.directories)
+        print(f"[Catalog] {changed} updated, {removed} removed in {time.monotonic() - start:.2f}s")
+    for session in catalog.query(args.where):
+        print(f"{session['name']:<40} {session['rows']:>9} rows "
+              f"{session['duration']:>9.0f}s {session['errors']:>6} errors")
+    catalog.close()
+
+if __name__ == "__main__":
+    main()
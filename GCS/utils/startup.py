@@ -0,0 +1,55 @@
+"""Startup timeline: milestones in milliseconds since launch.
+
+``LAUNCHED`` is taken when this module is first imported, so ``main.py``
+imports it before anything heavy. ``StartupTimer`` records marks, emits
+``first_paint`` once the window has painted (deferred construction hangs
+off that) and prints the timeline and emits ``finished`` when startup is
+complete.
+
+``thrust_stand_app/utils/startup.py`` is a copy of this file: change it
+here first, then copy it across so the two stay in step.
+"""
+import time
+
+LAUNCHED = time.perf_counter()
+
+from PyQt5.QtCore import QObject, QEvent, QTimer, pyqtSignal
+
+class StartupTimer(QObject):
+    """Records startup milestones relative to ``LAUNCHED``"""
+    first_paint = pyqtSignal()
+    finished = pyqtSignal()
+
+    def __init__(self, window, started=LAUNCHED):
+        super().__init__(window)
+        self.window = window
+        self.started = started
+        self.marks = []
+        self.painted = False
+        window.installEventFilter(self)
+
+    def mark(self, label):
+        ms = (time.perf_counter() - self.started) * 1000
+        self.marks.append((label, round(ms, 1)))
+        return ms
+
+    def elapsed(self, label):
+        return dict(self.marks).get(label)
+
+    def eventFilter(self, obj, event):
+        if obj is self.window and event.type() == QEvent.Paint and not self.painted:
+            self.painted = True
+            self.mark("first paint")
+            self.window.removeEventFilter(self)
+            # Let the paint reach the screen before the deferred work starts
+            QTimer.singleShot(0, self.first_paint.emit)
+        return False
+
+    def finish(self, label="interactive"):
+        """Mark the end of startup once the event loop is free again"""
+        QTimer.singleShot(0, lambda: self._finish(label))
+
+    def _finish(self, label):
+        self.mark(label)
+        print("[Startup] " + ", ".join(f"{name} {ms:.0f} ms" for name, ms in self.marks))
+        self.finished.emit()
@@ -0,0 +1,231 @@
+"""Columnar telemetry log (.gtl) used by DataLogger.
+
+A file is a magic header followed by tagged records (4-byte tag, uint32
+little-endian payload length, payload):
+
+    SCHM  JSON {"version": n, "columns": [{"name", "kind"}, ...]}
+    DICT  JSON {"column": ["new string", ...]} appended to that column's
+          dictionary (code 0 is reserved for None)
+    BLCK  uint32 version, uint32 rows, uint32 columns, then per column a
+          uint32 length and the zlib-compressed little-endian array
+
+Schemas only ever append columns, so a new channel mid-flight just writes
+a new SCHM record; earlier blocks stay as they are. Column kinds map to
+fixed NumPy dtypes, so loading a block is decompress + ``np.frombuffer``.
+Numbers are always written as float64: a channel that starts out as an
+int (a capped motor temperature) must not truncate the floats after it.
+"""
+import os
+import json
+import struct
+import zlib
+import numpy as np
+
+MAGIC = b"GTLOG\x00\x01\x00"
+RECORD = struct.Struct("<4sI")
+BLOCK_HEADER = struct.Struct("<III")
+LENGTH = struct.Struct("<I")
+
+DTYPES = {
+    "bool": np.dtype("<u1"),
+    "int": np.dtype("<i8"),
+    "float": np.dtype("<f8"),
+    "dict": np.dtype("<u4"),
+}
+# Value used for a column in blocks written before it existed
+MISSING = {"bool": 0, "int": 0, "float": np.nan, "dict": 0}
+
+def kind_of(value):
+    """Map a sample value to a column kind.
+
+    Ints are stored as floats; the "int" kind is only read, from older logs.
+    """
+    if isinstance(value, (bool, np.bool_)):
+        return "bool"
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        return "float"
+    return "dict"
+
+class ColumnarLogWriter:
+    """Buffers rows and writes them as compressed column blocks"""
+
+    def __init__(self, file, block_rows=1024, level=1):
+        self.file = file
+        self.block_rows = block_rows
+        self.level = level
+        self.version = 0
+        self.columns = []
+        self.dictionaries = {}
+        self.rows = []
+        self.file.write(MAGIC)
+
+    def set_schema(self, fields, kinds):
+        """Switch to a new schema; existing columns must keep their order"""
+        self.flush()
+        known = {name for name, _ in self.columns}
+        self.columns += [(name, kind) for name, kind in zip(fields, kinds) if name not in known]
+        for name, kind in self.columns:
+            if kind == "dict":
+                self.dictionaries.setdefault(name, {None: 0, "": 0})
+        self.version += 1
+        self._record(b"SCHM", json.dumps({
+            "version": self.version,
+            "columns": [{"name": name, "kind": kind} for name, kind in self.columns],
+        }).encode())
+
+    def write_rows(self, rows):
+        self.rows.extend(rows)
+        if len(self.rows) >= self.block_rows:
+            self.flush()
+
+    def flush(self):
+        if not self.rows:
+            return
+        width = len(self.columns)
+        # Rows from an older, narrower plan are padded with None
+        columns = list(zip(*(row + [None] * (width - len(row)) if len(row) < width else row
+                             for row in self.rows)))
+        new_entries = {}
+        chunks = []
+        for (name, kind), values in zip(self.columns, columns):
+            if kind == "dict":
+                array = self._encode_dict(name, values, new_entries)
+            else:
+                array = _to_array(values, kind)
+            chunks.append(zlib.compress(array.tobytes(), self.level))
+
+        if new_entries:
+            self._record(b"DICT", json.dumps(new_entries).encode())
+        payload = [BLOCK_HEADER.pack(self.version, len(self.rows), width)]
+        for chunk in chunks:
+            payload.append(LENGTH.pack(len(chunk)))
+            payload.append(chunk)
+        self._record(b"BLCK", b"".join(payload))
+        self.rows = []
+
+    def _encode_dict(self, name, values, new_entries):
+        dictionary = self.dictionaries[name]
+        codes = np.empty(len(values), dtype=DTYPES["dict"])
+        for i, value in enumerate(values):
+            code = dictionary.get(value)
+            if code is None:
+                code = len(dictionary) - 1  # None and "" share code 0
+                dictionary[value] = code
+                new_entries.setdefault(name, []).append(str(value))
+            codes[i] = code
+        return codes
+
+    def _record(self, tag, payload):
+        self.file.write(RECORD.pack(tag, len(payload)))
+        self.file.write(payload)
+
+    def close(self):
+        self.flush()
+
+def _to_array(values, kind):
+    dtype = DTYPES[kind]
+    try:
+        return np.asarray(values, dtype=dtype)
+    except (TypeError, ValueError):
+        missing = MISSING[kind]
+        return np.asarray([missing if v is None else v for v in values], dtype=dtype)
+
+class ColumnarLogReader:
+    """Reads a .gtl file one block at a time.
+
+    Opening it scans the record headers once: schemas and dictionaries are
+    loaded, blocks are only indexed (offset, length, rows). Reading a block
+    decompresses just that block, so memory stays at one block however
+    long the log is. ``columns`` is the final schema; blocks written before
+    a column existed are back-filled like in ``load_columnar_log``.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.schemas = {}
+        self.blocks = []
+        self.rows = 0
+        dictionaries = {}
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not a columnar telemetry log")
+            size = os.fstat(f.fileno()).st_size
+            offset = len(MAGIC)
+            while offset + RECORD.size <= size:
+                f.seek(offset)
+                tag, length = RECORD.unpack(f.read(RECORD.size))
+                offset += RECORD.size
+                if offset + length > size:
+                    break  # Truncated tail from a crash; everything before it is valid
+                if tag == b"BLCK":
+                    _, rows, _ = BLOCK_HEADER.unpack(f.read(BLOCK_HEADER.size))
+                    self.blocks.append((offset, length, rows))
+                    self.rows += rows
+                elif tag == b"SCHM":
+                    schema = json.loads(f.read(length))
+                    self.schemas[schema["version"]] = [(c["name"], c["kind"]) for c in schema["columns"]]
+                elif tag == b"DICT":
+                    for name, entries in json.loads(f.read(length)).items():
+                        dictionaries.setdefault(name, [None]).extend(entries)
+                offset += length
+        self.columns = self.schemas[max(self.schemas)] if self.schemas else []
+        self.dictionaries = {name: np.asarray(dictionaries.get(name, [None]), dtype=object)
+                             for name, kind in self.columns if kind == "dict"}
+
+    def iter_blocks(self, start=0, decode=True):
+        """Yield ``{column name: numpy array}`` for each block from ``start``"""
+        with open(self.path, "rb") as f:
+            for offset, length, _ in self.blocks[start:]:
+                f.seek(offset)
+                yield self._assemble(*_decode_block(f.read(length), self.schemas), decode)
+
+    def _assemble(self, block_columns, rows, decode):
+        result = {}
+        for name, kind in self.columns:
+            array = block_columns[name] if name in block_columns else _missing(kind, rows)
+            if kind == "dict" and decode:
+                array = self.dictionaries[name][array]
+            result[name] = array
+        return result
+
+def load_columnar_log(path, decode=True):
+    """Load a .gtl file as ``{column name: numpy array}``.
+
+    Columns added mid-flight are back-filled (NaN for floats, 0 for ints,
+    False for bools, None for strings). With ``decode=False`` string
+    columns are returned as uint32 codes plus a ``"<name>__dictionary"``
+    object array. Use ``ColumnarLogReader`` to go block by block instead.
+    """
+    reader = ColumnarLogReader(path)
+    blocks = list(reader.iter_blocks(decode=False))
+    result = {}
+    for name, kind in reader.columns:
+        parts = [block[name] for block in blocks]
+        array = np.concatenate(parts) if parts else _missing(kind, 0)
+        if kind == "dict":
+            lookup = reader.dictionaries[name]
+            if decode:
+                array = lookup[array]
+            else:
+                result[f"{name}__dictionary"] = lookup
+        result[name] = array
+    return result
+
+def _decode_block(payload, schemas):
+    version, rows, width = BLOCK_HEADER.unpack_from(payload, 0)
+    offset = BLOCK_HEADER.size
+    block_columns = {}
+    for name, kind in schemas[version][:width]:
+        (length,) = LENGTH.unpack_from(payload, offset)
+        offset += LENGTH.size
+        raw = zlib.decompress(payload[offset:offset + length])
+        offset += length
+        block_columns[name] = _as_loaded(np.frombuffer(raw, dtype=DTYPES[kind]), kind)
+    return block_columns, rows
+
+def _as_loaded(array, kind):
+    # Bools are stored as uint8 but read back as bool
+    return array.view(np.bool_) if kind == "bool" else array
+
+def _missing(kind, rows):
+    return _as_loaded(np.full(rows, MISSING[kind], dtype=DTYPES[kind]), kind)
@@ -1,3 +1,10 @@
+"""Application-wide dark theme.
+
+Every widget is styled from ``DarkTheme.STYLESHEET``, which ``app.py``
+applies once to the QApplication. Widgets pick their rules with object
+names and dynamic properties instead of local stylesheets; state changes
+go through ``set_variant``.
+"""
 class DarkTheme:
     COLORS = {
         "primary": "#1E1E1E",       # Darker background for better contrast
@@ -81,8 +88,227 @@ class DarkTheme:
     MotorWidget, BatteryWidget, GPSWidget {{
         qproperty-alignment: AlignCenter;
     }}
-    
-    SensorWidget {{
-        border-color: {COLORS["accent"]};
+
+    /* Top bar (MainWindow) */
+    QLabel#modeLabel {{
+        font-size: 18px;
+        font-weight: bold;
+        color: #FFFFFF;
+    }}
+
+    QLabel#statusLabel {{
+        color: #FFA500;
+        font: bold 14px;
+    }}
+
+    QLabel#statusLabel[level="ok"] {{
+        color: #4CAF50;
+    }}
+
+    QLabel#statusLabel[level="critical"] {{
+        color: #F44336;
+    }}
+
+    QPushButton#armButton, QPushButton#modeButton, QPushButton#loggingButton,
+    QPushButton#emergencyButton, QPushButton#viewToggleButton {{
+        min-width: 130px;
+        min-height: 40px;
+        padding: 8px;
+        border-radius: 5px;
+        font: bold 12px;
+        margin: 0px 5px;
+        color: white;
+    }}
+
+    QPushButton#armButton {{ background-color: #4CAF50; }}
+    QPushButton#modeButton {{ background-color: #2196F3; }}
+    QPushButton#loggingButton {{ background-color: #9C27B0; }}
+    QPushButton#loggingButton[logging="true"] {{ background-color: #FF9800; }}
+    QPushButton#emergencyButton {{ background-color: #F44336; }}
+    QPushButton#viewToggleButton {{ background-color: {COLORS["accent"]}; }}
+
+    QComboBox#vehicleSelector {{
+        min-width: 90px;
+        min-height: 36px;
+        font: bold 12px;
+    }}
+
+    QWidget#separator {{
+        background-color: #555555;
+    }}
+
+    /* Status rows (BatteryWidget, MotorWidget, GPSWidget) */
+    BatteryWidget QLabel, MotorWidget QLabel, GPSWidget QLabel, MapWidget QLabel {{
+        font: bold 12px;
+    }}
+
+    QLabel#sectionTitle {{
+        font-size: 16px;
+        font-weight: bold;
+        color: #D4D4D4;
+    }}
+
+    QLabel#satelliteLabel {{
+        color: #D4D4D4;
+    }}
+
+    QFrame#statusRow, QFrame#statusRow * {{
+        background-color: #f9f9f9;
+        border-radius: 8px;
+        padding: 6px;
+    }}
+
+    QFrame#statusRow QProgressBar {{
+        border-radius: 8px;
+        text-align: center;
+        font-weight: bold;
+    }}
+
+    QFrame#statusRow QProgressBar::chunk {{
+        background-color: #4caf50;
+        border-radius: 8px;
+    }}
+
+    QFrame#statusRow QProgressBar[level="warning"]::chunk {{ background-color: #ff9800; }}
+    QFrame#statusRow QProgressBar[level="critical"]::chunk {{ background-color: #f44336; }}
+    MotorWidget QFrame#statusRow QProgressBar[level="ok"]::chunk {{ background-color: #2196f3; }}
+    MotorWidget QFrame#statusRow QProgressBar[level="warning"]::chunk {{ background-color: #fb8c00; }}
+    MotorWidget QFrame#statusRow QProgressBar[level="critical"]::chunk {{ background-color: #e53935; }}
+
+    QFrame#statusRow QLabel[level="ok"] {{ color: green; }}
+    QFrame#statusRow QLabel[level="warning"] {{ color: orange; }}
+    QFrame#statusRow QLabel[level="critical"] {{ color: red; }}
+
+    /* Blue-framed panels */
+    AttitudeWidget, SystemWidget {{
+        border: 2px solid #1E90FF;
+        border-radius: 5px;
+    }}
+
+    AttitudeWidget QLabel {{
+        font: bold 12px;
+        color: #FFFFFF;
+    }}
+
+    SystemWidget QLabel {{
+        font: bold 12px;
+        color: #FFFFFF;
+    }}
+
+    SystemWidget StatusIndicator {{
+        background-color: #3c3c3c;
+        color: #AAAAAA;
+        border-radius: 4px;
+        padding: 3px;
+        font: bold 12px;
+    }}
+
+    SystemWidget StatusIndicator[level="ok"] {{ background-color: #00ff00; color: black; }}
+    SystemWidget StatusIndicator[level="warning"] {{ background-color: #ffa500; color: black; }}
+    SystemWidget StatusIndicator[level="critical"] {{ background-color: #ff0000; color: black; }}
+    SystemWidget StatusIndicator[level="info"] {{ background-color: #00ffff; color: black; }}
+
+    SensorWidget, ErrorLogWidget {{
+        font: bold 14px;
+        color: #1E90FF;
+        border: 2px solid #1E90FF;
+        border-radius: 5px;
+        margin-top: 10px;
+    }}
+
+    ErrorLogWidget QListView {{
+        background-color: #1E1E1E;
+        color: #FFFFFF;
+        font: 10pt Monospace;
+        border: none;
+    }}
+
+    PositionWidget {{
+        border: 2px solid #1E90FF;
+        border-radius: 5px;
+        margin-top: 1ex;
+        font-weight: bold;
+        color: #1E90FF;
+    }}
+
+    PositionWidget::title {{
+        subcontrol-origin: margin;
+        subcontrol-position: top center;
+        padding: 0 5px;
+        background-color: #0A1520;
+    }}
+
+    PositionWidget QLabel {{
+        font: bold 12px;
+        color: #D4D4D4;
+    }}
+
+    PositionWidget QLabel.unit {{
+        color: #888888;
+        font-size: 10px;
+        font-style: italic;
+    }}
+
+    ValueLabel QFrame {{
+        background-color: rgba(0, 20, 40, 0.3);
+        border-radius: 3px;
+        padding: 2px;
+    }}
+
+    ValueLabel QLabel {{
+        color: #FFFFFF;
+    }}
+
+    QWidget#positionIndicator {{
+        background-color: rgba(0, 20, 40, 0.3);
+        border-radius: 3px;
+    }}
+
+    /* Replay controls */
+    ReplayBar QLabel {{
+        font: bold 12px;
+        color: #D4D4D4;
+    }}
+
+    QPushButton#playButton {{
+        background-color: {COLORS["accent"]};
+        color: white;
+        font: bold 12px;
+        padding: 6px;
+    }}
+
+    /* Profiler overlay (F12) */
+    ProfilerOverlay {{
+        background-color: rgba(20, 20, 20, 215);
+        border: 1px solid {COLORS["accent"]};
+        border-radius: 4px;
+    }}
+
+    ProfilerOverlay QLabel {{
+        color: #E0E0E0;
+        font: 11px "DejaVu Sans Mono", monospace;
+        background: transparent;
+        border: none;
+    }}
+
+    ProfilerOverlay QPushButton {{
+        color: white;
+        background-color: {COLORS["accent"]};
+        border: none;
+        padding: 3px 10px;
+        font: bold 11px;
     }}
-    """
\ No newline at end of file
+    """
+
+def set_variant(widget, name, value):
+    """Switch a style variant (a dynamic property the theme selects on).
+
+    The widget is only re-polished when the value actually changes, so this
+    is cheap enough to call on every telemetry update.
+    """
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
\ No newline at end of file
@@ -0,0 +1,318 @@
+import os
+import sys
+import math
+import time
+import sqlite3
+import argparse
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+# Next to the GCS package, wherever the app is started from
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(__file__), "..", "cache", "tiles.mbtiles")
+DEFAULT_TILE_SOURCE = "https://tile.openstreetmap.org/{z}/{x}/{y}.png"
+LEAFLET_CDN = "https://unpkg.com/leaflet@1.9.4/dist/"
+# Everything map.html needs from Leaflet, relative to LEAFLET_CDN
+LEAFLET_ASSETS = ["leaflet.js", "leaflet.css", "images/marker-icon.png",
+                  "images/marker-icon-2x.png", "images/marker-shadow.png"]
+DEFAULT_QUOTA_MB = 512
+USER_AGENT = "GCS-TileCache/1.0"
+
+def deg_to_tile(lat, lon, zoom):
+    """Return the (x, y) slippy-map tile containing a coordinate"""
+    lat = max(-85.0511, min(85.0511, lat))
+    n = 2 ** zoom
+    x = int((lon + 180.0) / 360.0 * n)
+    lat_rad = math.radians(lat)
+    y = int((1.0 - math.asinh(math.tan(lat_rad)) / math.pi) / 2.0 * n)
+    return min(n - 1, max(0, x)), min(n - 1, max(0, y))
+
+def tiles_in_bbox(south, west, north, east, min_zoom, max_zoom):
+    """Yield every (z, x, y) covering a bounding box across a zoom range"""
+    for zoom in range(min_zoom, max_zoom + 1):
+        x0, y0 = deg_to_tile(north, west, zoom)
+        x1, y1 = deg_to_tile(south, east, zoom)
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                yield zoom, x, y
+
+class TileSource:
+    """Upstream tiles: a URL template or a local {z}/{x}/{y}.png directory.
+
+    Leaflet comes from unpkg for a URL source, or from the ``leaflet/``
+    subdirectory (laid out like Leaflet's ``dist/``) of a local one.
+    """
+
+    def __init__(self, source=DEFAULT_TILE_SOURCE, timeout=10):
+        self.source = source
+        self.timeout = timeout
+        self.is_local = "://" not in source
+
+    def fetch(self, zoom, x, y, raise_outage=False):
+        """Return the tile bytes, or None if it is unavailable.
+
+        With ``raise_outage`` the OSError is re-raised when the upstream
+        itself is unreachable (see ``is_outage``), not just missing the tile.
+        """
+        if self.is_local:
+            path = os.path.join(self.source, str(zoom), str(x), f"{y}.png")
+            if not os.path.exists(path):
+                return None
+            with open(path, "rb") as f:
+                return f.read()
+
+        return self._download(self.source.format(z=zoom, x=x, y=y, s="a"), raise_outage)
+
+    def fetch_asset(self, name, raise_outage=False):
+        """Return a Leaflet file (see LEAFLET_ASSETS), or None"""
+        if self.is_local:
+            path = os.path.join(self.source, "leaflet", *name.split("/"))
+            if not os.path.exists(path):
+                return None
+            with open(path, "rb") as f:
+                return f.read()
+        return self._download(LEAFLET_CDN + name, raise_outage)
+
+    def _download(self, url, raise_outage):
+        request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return response.read()
+        except OSError as e:
+            # No network (or the server refused); callers fall back to the cache
+            if raise_outage and is_outage(e):
+                raise
+            return None
+
+def is_outage(error):
+    """True if a fetch error means the upstream is down or unreachable.
+
+    4xx answers (a tile the server does not have) only miss that tile;
+    connection errors, timeouts, 429 and 5xx answers mean back off.
+    """
+    if isinstance(error, urllib.error.HTTPError):
+        return error.code >= 500 or error.code == 429
+    return True
+
+class TileCache:
+    """MBTiles (SQLite) tile store with LRU eviction under a disk quota.
+
+    Tiles are stored in the standard MBTiles ``tiles`` table (TMS row
+    order) so the file can be opened by other tools. Access times live in a
+    side table and are written in batches to keep reads cheap. The file uses
+    incremental auto-vacuum, so pages freed by eviction are returned to the
+    filesystem and the quota bounds disk use, not just the tile total.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, quota_mb=DEFAULT_QUOTA_MB):
+        self.path = path
+        self.quota_bytes = int(quota_mb * 1024 * 1024)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        # Must precede the first table; older caches are converted once by VACUUM
+        self.conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        if self.conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+            self.conn.execute("VACUUM")
+        self.conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS metadata (name TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS tiles (
+                zoom_level INTEGER, tile_column INTEGER, tile_row INTEGER,
+                tile_data BLOB,
+                PRIMARY KEY (zoom_level, tile_column, tile_row)
+            );
+            CREATE TABLE IF NOT EXISTS tile_access (
+                zoom_level INTEGER, tile_column INTEGER, tile_row INTEGER,
+                last_access REAL, size INTEGER,
+                PRIMARY KEY (zoom_level, tile_column, tile_row)
+            );
+            CREATE INDEX IF NOT EXISTS tile_access_lru ON tile_access (last_access);
+            CREATE TABLE IF NOT EXISTS assets (name TEXT PRIMARY KEY, data BLOB);
+        """)
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO metadata (name, value) VALUES (?, ?)",
+            [("name", "GCS tile cache"), ("format", "png")]
+        )
+        self.conn.commit()
+        self.total_bytes = self.conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM tile_access").fetchone()[0]
+        self.pending_access = {}
+
+    @staticmethod
+    def _key(zoom, x, y):
+        # MBTiles uses TMS rows, flipped relative to slippy-map y
+        return zoom, x, (2 ** zoom - 1) - y
+
+    def get(self, zoom, x, y):
+        key = self._key(zoom, x, y)
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT tile_data FROM tiles WHERE zoom_level=? AND tile_column=? AND tile_row=?",
+                key).fetchone()
+            if row is None:
+                return None
+            self.pending_access[key] = time.time()
+            if len(self.pending_access) >= 64:
+                self._flush_access()
+            return row[0]
+
+    def contains(self, zoom, x, y):
+        with self.lock:
+            return self.conn.execute(
+                "SELECT 1 FROM tiles WHERE zoom_level=? AND tile_column=? AND tile_row=?",
+                self._key(zoom, x, y)).fetchone() is not None
+
+    def put(self, zoom, x, y, data):
+        key = self._key(zoom, x, y)
+        with self.lock:
+            old = self.conn.execute(
+                "SELECT size FROM tile_access WHERE zoom_level=? AND tile_column=? AND tile_row=?",
+                key).fetchone()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO tiles VALUES (?, ?, ?, ?)", key + (data,))
+            self.conn.execute(
+                "INSERT OR REPLACE INTO tile_access VALUES (?, ?, ?, ?, ?)",
+                key + (time.time(), len(data)))
+            self.pending_access.pop(key, None)
+            self.total_bytes += len(data) - (old[0] if old else 0)
+            evicted = self.total_bytes > self.quota_bytes
+            if evicted:
+                self._evict()
+            self.conn.commit()
+            if evicted:
+                self._shrink()
+
+    def _flush_access(self):
+        self.conn.executemany(
+            "UPDATE tile_access SET last_access=? WHERE zoom_level=? AND tile_column=? AND tile_row=?",
+            [(ts,) + key for key, ts in self.pending_access.items()])
+        self.conn.commit()
+        self.pending_access = {}
+
+    def _evict(self):
+        """Drop least recently used tiles until 90% of the quota is free"""
+        self._flush_access()
+        target = int(self.quota_bytes * 0.9)
+        rows = self.conn.execute(
+            "SELECT zoom_level, tile_column, tile_row, size FROM tile_access ORDER BY last_access")
+        victims = []
+        for zoom, col, row, size in rows:
+            if self.total_bytes <= target:
+                break
+            victims.append((zoom, col, row))
+            self.total_bytes -= size
+        self.conn.executemany(
+            "DELETE FROM tiles WHERE zoom_level=? AND tile_column=? AND tile_row=?", victims)
+        self.conn.executemany(
+            "DELETE FROM tile_access WHERE zoom_level=? AND tile_column=? AND tile_row=?", victims)
+
+    def _shrink(self):
+        """Hand the pages freed by eviction back to the filesystem"""
+        self.conn.execute("PRAGMA incremental_vacuum").fetchall()
+        # In WAL mode the main file only shrinks once the log is checkpointed
+        self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+
+    def get_asset(self, name):
+        with self.lock:
+            row = self.conn.execute("SELECT data FROM assets WHERE name=?", (name,)).fetchone()
+            return row[0] if row else None
+
+    def put_asset(self, name, data):
+        with self.lock:
+            self.conn.execute("INSERT OR REPLACE INTO assets VALUES (?, ?)", (name, data))
+            self.conn.commit()
+
+    def close(self):
+        with self.lock:
+            self._flush_access()
+            self.conn.close()
+
+def prefetch_assets(cache, source):
+    """Store the Leaflet files map.html needs; returns the names still missing"""
+    missing = []
+    for name in LEAFLET_ASSETS:
+        if cache.get_asset(name) is not None:
+            continue
+        data = source.fetch_asset(name)
+        if data is None:
+            missing.append(name)
+        else:
+            cache.put_asset(name, data)
+    return missing
+
+def prefetch(cache, source, south, west, north, east, min_zoom, max_zoom,
+             workers=2, progress=None):
+    """Fill the cache with Leaflet and the tiles for a bounding box and zoom range.
+
+    Tiles already cached are skipped. Returns (fetched, skipped, failed).
+    Raises RuntimeError if Leaflet cannot be stored: without it the map
+    page does not load offline, however many tiles are cached.
+    Keep ``workers`` low when prefetching from public tile servers.
+    """
+    missing = prefetch_assets(cache, source)
+    if missing:
+        raise RuntimeError(f"could not fetch Leaflet ({', '.join(missing)}) from {source.source}")
+    todo = [t for t in tiles_in_bbox(south, west, north, east, min_zoom, max_zoom)
+            if not cache.contains(*t)]
+    total = len(todo)
+    fetched = failed = 0
+
+    def fetch(tile):
+        return tile, source.fetch(*tile)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for done, (tile, data) in enumerate(pool.map(fetch, todo), 1):
+            if data is None:
+                failed += 1
+            else:
+                cache.put(*tile, data)
+                fetched += 1
+            if progress:
+                progress(done, total)
+
+    skipped = sum(1 for _ in tiles_in_bbox(south, west, north, east, min_zoom, max_zoom)) - total
+    return fetched, skipped, failed
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="GCS offline tile cache")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    pre = sub.add_parser("prefetch", help="Download tiles for a bounding box")
+    pre.add_argument("--bbox", required=True,
+                     help="south,west,north,east in degrees")
+    pre.add_argument("--zoom", default="10-16", help="zoom range, e.g. 10-16")
+    pre.add_argument("--cache", default=DEFAULT_CACHE_PATH)
+    pre.add_argument("--source", default=DEFAULT_TILE_SOURCE,
+                     help="tile URL template or local {z}/{x}/{y}.png directory")
+    pre.add_argument("--quota-mb", type=float, default=DEFAULT_QUOTA_MB)
+    pre.add_argument("--workers", type=int, default=2)
+
+    args = parser.parse_args(argv)
+    south, west, north, east = (float(v) for v in args.bbox.split(","))
+    min_zoom, _, max_zoom = args.zoom.partition("-")
+    min_zoom = int(min_zoom)
+    max_zoom = int(max_zoom or min_zoom)
+
+    cache = TileCache(args.cache, quota_mb=args.quota_mb)
+
+    def progress(done, total):
+        if done == total or done % 100 == 0:
+            print(f"[TileCache] {done}/{total} tiles", file=sys.stderr)
+
+    try:
+        fetched, skipped, failed = prefetch(
+            cache, TileSource(args.source), south, west, north, east,
+            min_zoom, max_zoom, workers=args.workers, progress=progress)
+    except RuntimeError as e:
+        cache.close()
+        sys.exit(f"[TileCache] {e}; the map cannot load offline without it")
+    cache.close()
+    print(f"[TileCache] fetched {fetched}, already cached {skipped}, failed {failed}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+import os
+import re
+import time
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from utils.tile_cache import TileCache, TileSource
+
+MAP_PAGE = os.path.join(os.path.dirname(__file__), "..", "widgets", "leaflet_map.html")
+
+# Seconds to stop trying upstream after it was unreachable
+OFFLINE_BACKOFF = 30
+
+CONTENT_TYPES = {
+    ".png": "image/png",
+    ".js": "application/javascript",
+    ".css": "text/css",
+    ".html": "text/html; charset=utf-8",
+}
+
+TILE_PATH = re.compile(r"^/tiles/(\d+)/(\d+)/(\d+)\.png$")
+
+class TileServer:
+    """Local HTTP server for the map page, its Leaflet assets and tiles.
+
+    Everything goes through the TileCache: tiles and Leaflet files are
+    fetched upstream on the first miss and served from SQLite afterwards,
+    so once the cache is warm the map loads with no network at all.
+    """
+
+    def __init__(self, cache=None, source=None, host="127.0.0.1", port=0):
+        self.cache = cache if cache is not None else TileCache()
+        self.source = source if source is not None else TileSource(
+            os.environ.get("GCS_TILE_SOURCE", TileSource().source), timeout=5)
+        self.offline_until = 0.0
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def port(self):
+        return self.httpd.server_address[1]
+
+    def url(self, path=""):
+        return f"http://127.0.0.1:{self.port}/{path}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        print(f"[TileServer] Serving on {self.url()}")
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.cache.close()
+
+    def _upstream_available(self):
+        return time.time() >= self.offline_until
+
+    def _mark_offline(self):
+        self.offline_until = time.time() + OFFLINE_BACKOFF
+
+    def get_tile(self, zoom, x, y):
+        data = self.cache.get(zoom, x, y)
+        if data is None and (self.source.is_local or self._upstream_available()):
+            try:
+                # A tile the upstream lacks (4xx) is just a miss
+                data = self.source.fetch(zoom, x, y, raise_outage=True)
+            except OSError:
+                self._mark_offline()
+            if data is not None:
+                self.cache.put(zoom, x, y, data)
+        return data
+
+    def get_asset(self, name):
+        data = self.cache.get_asset(name)
+        if data is None and (self.source.is_local or self._upstream_available()):
+            try:
+                data = self.source.fetch_asset(name, raise_outage=True)
+            except OSError:
+                self._mark_offline()
+            if data is not None:
+                self.cache.put_asset(name, data)
+        return data
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.split("?", 1)[0]
+                match = TILE_PATH.match(path)
+                if match:
+                    data = server.get_tile(*(int(v) for v in match.groups()))
+                elif path == "/map.html":
+                    with open(MAP_PAGE, "rb") as f:
+                        data = f.read()
+                elif path.startswith("/leaflet/") and ".." not in path:
+                    data = server.get_asset(path[len("/leaflet/"):])
+                else:
+                    data = None
+
+                if data is None:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type",
+                                 CONTENT_TYPES.get(os.path.splitext(path)[1], "application/octet-stream"))
+                self.send_header("Content-Length", str(len(data)))
+                if match:
+                    self.send_header("Cache-Control", "max-age=86400")
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                # Tile requests are far too frequent to print
+                pass
+
+        return Handler
@@ -0,0 +1,180 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+from array import array
+import numpy as np
+import queue
+import math
+
+# Zoom levels the map keeps a simplified track for
+MIN_ZOOM = 10
+MAX_ZOOM = 19
+
+# Allowed deviation in screen pixels at each zoom level
+PIXEL_TOLERANCE = 1.5
+
+def tolerance_for_zoom(zoom, pixels=PIXEL_TOLERANCE):
+    """Return the simplification tolerance in degrees for a zoom level"""
+    # A 256px Web Mercator tile spans 360 / 2**zoom degrees of longitude
+    return pixels * 360.0 / (256 * 2 ** zoom)
+
+def douglas_peucker(points, tolerance):
+    """Return the indices of the vertices kept by Douglas-Peucker.
+
+    ``points`` is an (N, 2) array of (lat, lon). Longitudes are scaled by
+    cos(lat) so the tolerance is roughly isotropic.
+    """
+    n = len(points)
+    if n < 3:
+        return list(range(n))
+
+    xy = np.empty((n, 2))
+    xy[:, 0] = points[:, 1] * math.cos(math.radians(points[0, 0]))
+    xy[:, 1] = points[:, 0]
+
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        seg = xy[end] - xy[start]
+        rel = xy[start + 1:end] - xy[start]
+        seg_len = math.hypot(seg[0], seg[1])
+        if seg_len == 0.0:
+            dist = np.hypot(rel[:, 0], rel[:, 1])
+        else:
+            dist = np.abs(seg[0] * rel[:, 1] - seg[1] * rel[:, 0]) / seg_len
+        i = int(np.argmax(dist))
+        if dist[i] > tolerance:
+            mid = start + 1 + i
+            keep[mid] = True
+            stack.append((start, mid))
+            stack.append((mid, end))
+    return np.flatnonzero(keep).tolist()
+
+class TrackLevel:
+    """Streaming Douglas-Peucker state for one zoom level.
+
+    Points accumulate in a raw tail; once the tail reaches ``chunk_size``
+    it is simplified and its kept vertices are committed. Only the tail is
+    ever re-simplified, so the cost per point stays bounded however long
+    the flight gets.
+    """
+
+    def __init__(self, tolerance, chunk_size=256):
+        self.tolerance = tolerance
+        self.chunk_size = chunk_size
+        self.committed = array('d')
+        self.new_committed = array('d')
+        self.tail = []
+
+    def add_point(self, lat, lon):
+        if not self.tail and not self.committed:
+            self._commit([(lat, lon)])
+        self.tail.append((lat, lon))
+        if len(self.tail) >= self.chunk_size:
+            self._flush_tail()
+
+    def _flush_tail(self):
+        # The tail starts at the last committed vertex, so it is skipped
+        points = np.asarray(self.tail)
+        kept = douglas_peucker(points, self.tolerance)
+        self._commit(self.tail[i] for i in kept[1:])
+        self.tail = [self.tail[-1]]
+
+    def _commit(self, points):
+        for lat, lon in points:
+            self.committed.extend((lat, lon))
+            self.new_committed.extend((lat, lon))
+
+    def take_update(self):
+        """Return (new committed vertices, simplified tail) and reset the former"""
+        new = self.new_committed
+        self.new_committed = array('d')
+        tail = array('d')
+        for i in self._simplified_tail():
+            tail.extend(self.tail[i])
+        return new, tail
+
+    def vertex_count(self):
+        return len(self.committed) // 2 + len(self._simplified_tail())
+
+    def _simplified_tail(self):
+        if len(self.tail) < 2:
+            return []
+        return douglas_peucker(np.asarray(self.tail), self.tolerance)[1:]
+
+class TrackSimplifier:
+    """Keeps one simplified track per zoom level"""
+
+    def __init__(self, min_zoom=MIN_ZOOM, max_zoom=MAX_ZOOM):
+        self.levels = {
+            # Coarser levels use longer chunks so chunk boundaries don't
+            # dominate their vertex count
+            zoom: TrackLevel(tolerance_for_zoom(zoom),
+                             chunk_size=min(4096, 256 << (max_zoom - zoom)))
+            for zoom in range(min_zoom, max_zoom + 1)
+        }
+        self.point_count = 0
+
+    def add_point(self, lat, lon):
+        self.point_count += 1
+        for level in self.levels.values():
+            level.add_point(lat, lon)
+
+    def take_updates(self):
+        return {zoom: level.take_update() for zoom, level in self.levels.items()}
+
+    def vertex_count(self, zoom):
+        return self.levels[zoom].vertex_count()
+
+class TrackSimplifierThread(QThread):
+    """Runs TrackSimplifier off the GUI thread.
+
+    Positions are queued with ``add_point``; every ``interval`` seconds the
+    per-zoom changes are emitted as ``{zoom: (new_vertices, tail)}`` where
+    both entries are flat ``array('d')`` of (lat, lon) pairs.
+    """
+    track_updated = pyqtSignal(dict)
+    # Emitted in order with track_updated once a reset() has taken effect
+    track_reset = pyqtSignal()
+
+    def __init__(self, interval=0.25):
+        super().__init__()
+        self.running = True
+        self.interval = interval
+        self.points = queue.Queue()
+        self.simplifier = TrackSimplifier()
+
+    def add_point(self, lat, lon):
+        self.points.put((lat, lon))
+
+    def reset(self):
+        """Start a new track; points queued before this call are discarded"""
+        self.points.put(None)
+
+    def run(self):
+        while self.running:
+            changed = False
+            try:
+                point = self.points.get(timeout=self.interval)
+                while True:
+                    if point is None:
+                        self.simplifier = TrackSimplifier()
+                        self.track_reset.emit()
+                        changed = False
+                    else:
+                        self.simplifier.add_point(*point)
+                        changed = True
+                    # Drain whatever else arrived without blocking
+                    point = self.points.get_nowait()
+            except queue.Empty:
+                pass
+            if changed:
+                self.track_updated.emit(self.simplifier.take_updates())
+                self.msleep(int(self.interval * 1000))
+
+    def stop(self):
+        self.running = False
+        self.quit()
+        self.wait()
@@ -0,0 +1,312 @@
+"""Binary UDP telemetry link.
+
+Each datagram is one fixed-layout little-endian frame (``FRAME``, 128
+bytes). ``UdpTelemetrySource`` receives into a preallocated buffer and
+unpacks it in place with ``struct.unpack_from``, counting dropped,
+out-of-order and malformed frames from the sequence number. It emits
+``data_updated(dict)`` like DataSimulator, so MainWindow can use either.
+
+A loopback stand-in for a real autopilot (from the GCS directory)::
+
+    python -m utils.udp_telemetry send --rate 1000
+    python main.py --udp 14560
+"""
+import sys
+import time
+import socket
+import struct
+import random
+import argparse
+from PyQt5.QtCore import QThread, pyqtSignal
+
+DEFAULT_PORT = 14560
+MAGIC = b"GT"
+VERSION = 1
+
+FRAME = struct.Struct(
+    "<2sBB"    # magic, version, flags (bit 0 = armed)
+    "I"        # sequence number
+    "dd"       # latitude, longitude
+    "f"        # altitude
+    "fff"      # roll, pitch, yaw
+    "7H"       # motor rpms
+    "7f"       # motor temps
+    "4f"       # battery levels
+    "4f"       # battery temps
+    "ffBB"     # HDOP, PDOP, satellites, sensor health bits
+    "HBB"      # error code number (0 = none), desc index, source index
+)
+
+SENSORS = ('IMU', 'Altimeter', 'Magnetometer', 'PitotTube')
+# Index 0 means "no error"; strings not in the tables are sent as 0
+ERROR_DESCS = (None, "Motor Overheat", "Battery Undervoltage", "IMU Failure", "GPS Lost",
+               "Altimeter Failure", "Magnetometer Failure", "PitotTube Failure")
+ERROR_SOURCES = (None, "Motors", "Battery", "Flight Controller")
+UNKNOWN_CODE = 0xFFFF
+
+# Positions of each group inside the unpacked tuple
+_SEQ = 3
+_RPMS = slice(10, 17)
+_MOTOR_TEMPS = slice(17, 24)
+_BATTERY_LEVELS = slice(24, 28)
+_BATTERY_TEMPS = slice(28, 32)
+_ERROR_CODE = 36
+
+def _table_index(table, value):
+    try:
+        return table.index(value)
+    except ValueError:
+        return 0
+
+def pack_frame(buffer, data, seq):
+    """Pack a DataSimulator-style frame into ``buffer`` (FRAME.size bytes)"""
+    errors = data['errors']
+    code = 0
+    if errors['code'] is not None:
+        try:
+            code = int(str(errors['code']).lstrip('E'))
+        except ValueError:
+            code = UNKNOWN_CODE
+    health = data['sensor_health']
+    sensor_bits = sum(1 << i for i, name in enumerate(SENSORS) if health.get(name))
+    gps = data['gps_health']
+    FRAME.pack_into(
+        buffer, 0, MAGIC, VERSION, 1 if data['arm_status'] else 0, seq & 0xFFFFFFFF,
+        data['latitude'], data['longitude'], data['altitude'],
+        data['roll'], data['pitch'], data['yaw'],
+        *(max(0, min(0xFFFF, int(rpm))) for rpm in data['motor_rpms']),
+        *data['motor_temps'], *data['battery_levels'], *data['battery_temps'],
+        gps['HDOP'], gps['PDOP'], min(255, gps['satellites']), sensor_bits,
+        min(code, UNKNOWN_CODE), _table_index(ERROR_DESCS, errors['desc']),
+        _table_index(ERROR_SOURCES, errors['source']),
+    )
+
+def build_frame(fields):
+    """Turn an unpacked FRAME tuple into the GCS telemetry dict"""
+    code = fields[_ERROR_CODE]
+    if code == 0:
+        errors = {'code': None, 'desc': None, 'source': None}
+    else:
+        errors = {
+            'code': "E?" if code == UNKNOWN_CODE else f"E{code}",
+            'desc': ERROR_DESCS[fields[37]] if fields[37] < len(ERROR_DESCS) else None,
+            'source': ERROR_SOURCES[fields[38]] if fields[38] < len(ERROR_SOURCES) else None,
+        }
+    sensor_bits = fields[35]
+    return {
+        'motor_rpms': list(fields[_RPMS]),
+        'motor_temps': list(fields[_MOTOR_TEMPS]),
+        'latitude': fields[4],
+        'longitude': fields[5],
+        'altitude': fields[6],
+        'roll': fields[7],
+        'pitch': fields[8],
+        'yaw': fields[9],
+        'battery_levels': list(fields[_BATTERY_LEVELS]),
+        'battery_temps': list(fields[_BATTERY_TEMPS]),
+        'arm_status': bool(fields[2] & 1),
+        'gps_health': {
+            'HDOP': round(fields[32], 2),
+            'PDOP': round(fields[33], 2),
+            'satellites': fields[34],
+        },
+        'sensor_health': {name: (sensor_bits >> i) & 1 for i, name in enumerate(SENSORS)},
+        'errors': errors,
+    }
+
+class UdpReceiver:
+    """Socket plus sequence bookkeeping; returns raw unpacked frames"""
+
+    def __init__(self, host="0.0.0.0", port=DEFAULT_PORT, timeout=0.1):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+        self.sock.bind((host, port))
+        self.sock.settimeout(timeout)
+        self.buffer = bytearray(2048)
+        self.view = memoryview(self.buffer)
+        self.expected = None
+
+        self.received = 0
+        self.dropped = 0
+        self.out_of_order = 0
+        self.malformed = 0
+
+    def receive(self):
+        """Return the next in-order frame tuple, or None on timeout/bad/late frames"""
+        try:
+            size = self.sock.recv_into(self.buffer)
+        except socket.timeout:
+            return None
+        if size != FRAME.size or self.view[:2] != MAGIC or self.buffer[2] != VERSION:
+            self.malformed += 1
+            return None
+        fields = FRAME.unpack_from(self.buffer, 0)
+        self.received += 1
+
+        seq = fields[_SEQ]
+        if self.expected is not None:
+            gap = (seq - self.expected) & 0xFFFFFFFF
+            if gap >= 0x80000000:
+                # Older than what we already passed on; it was counted as a drop
+                self.out_of_order += 1
+                self.dropped = max(0, self.dropped - 1)
+                return None
+            self.dropped += gap
+        self.expected = (seq + 1) & 0xFFFFFFFF
+        return fields
+
+    def stats(self):
+        return {
+            'received': self.received,
+            'dropped': self.dropped,
+            'out_of_order': self.out_of_order,
+            'malformed': self.malformed,
+        }
+
+    def close(self):
+        self.sock.close()
+
+class UdpTelemetrySource(QThread):
+    """Receives binary telemetry over UDP and emits it like DataSimulator.
+
+    Links can run at 1000+ frames/s, far faster than the views need, so
+    at most ``max_emit_rate`` frames per second are turned into dicts and
+    emitted; the rest are skipped unless they carry an error, so the
+    error log stays complete.
+    """
+    data_updated = pyqtSignal(dict)
+
+    def __init__(self, host="0.0.0.0", port=DEFAULT_PORT, max_emit_rate=60):
+        super().__init__()
+        self.host = host
+        self.port = port
+        self.min_interval = 1.0 / max_emit_rate
+        self.running = True
+        self.receiver = UdpReceiver(host, port, timeout=self.min_interval)
+        self.emitted = 0
+
+    def stop(self):
+        self.running = False
+        self.quit()
+        self.wait()
+        self.receiver.close()
+        print(f"[UDP] Link closed: {self.stats()}")
+
+    def stats(self):
+        stats = self.receiver.stats()
+        stats['emitted'] = self.emitted
+        return stats
+
+    def run(self):
+        print(f"[UDP] Listening for telemetry on {self.host}:{self.port}")
+        last_emit = 0.0
+        pending = None
+        while self.running:
+            fields = self.receiver.receive()
+            now = time.monotonic()
+            if fields is None:
+                # Quiet link: deliver the frame held back by the rate limit
+                if pending is not None and now - last_emit >= self.min_interval:
+                    self._emit(pending)
+                    pending = None
+                    last_emit = now
+                continue
+            if fields[_ERROR_CODE] != 0 or now - last_emit >= self.min_interval:
+                self._emit(fields)
+                pending = None
+                last_emit = now
+            else:
+                pending = fields
+
+    def _emit(self, fields):
+        self.emitted += 1
+        self.data_updated.emit(build_frame(fields))
+
+def send(host, port, rate, duration=None, loss=0.0, reorder=0.0):
+    """Stream the simulator to ``host:port`` at ``rate`` frames/s.
+
+    ``loss`` and ``reorder`` drop or swap that fraction of frames to
+    exercise the receiver's counters.
+    """
+    from utils.data_simulator import DataSimulator
+
+    sim = DataSimulator()
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    buffer = bytearray(FRAME.size)
+    held = None
+    seq = 0
+    sent = 0
+    start = time.monotonic()
+    report = start + 1.0
+    print(f"[UDP] Sending {rate} frames/s to {host}:{port}")
+    try:
+        while duration is None or time.monotonic() - start < duration:
+            sim._update_flight_dynamics()
+            sim.time_elapsed += 1.0 / rate
+            pack_frame(buffer, sim._generate_data(), seq)
+            seq += 1
+            if random.random() < loss:
+                pass
+            elif held is None and random.random() < reorder:
+                held = bytes(buffer)
+            else:
+                sock.sendto(buffer, (host, port))
+                sent += 1
+                if held is not None:
+                    sock.sendto(held, (host, port))
+                    sent += 1
+                    held = None
+
+            due = start + seq / rate
+            now = time.monotonic()
+            if due > now:
+                time.sleep(due - now)
+            if now >= report:
+                print(f"[UDP] {sent} frames sent", file=sys.stderr)
+                report += 1.0
+    except KeyboardInterrupt:
+        pass
+    sock.close()
+    return sent
+
+def listen(host, port, duration=None):
+    """Receive without a GUI and print link statistics every second"""
+    receiver = UdpReceiver(host, port)
+    start = time.monotonic()
+    report = start + 1.0
+    try:
+        while duration is None or time.monotonic() - start < duration:
+            receiver.receive()
+            if time.monotonic() >= report:
+                print(f"[UDP] {receiver.stats()}")
+                report += 1.0
+    except KeyboardInterrupt:
+        pass
+    receiver.close()
+    return receiver.stats()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="GCS binary UDP telemetry tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    send_parser = sub.add_parser("send", help="replay the simulator over UDP")
+    send_parser.add_argument("--host", default="127.0.0.1")
+    send_parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    send_parser.add_argument("--rate", type=float, default=50.0, help="frames per second")
+    send_parser.add_argument("--duration", type=float, help="seconds (default: forever)")
+    send_parser.add_argument("--loss", type=float, default=0.0, help="fraction of frames to drop")
+    send_parser.add_argument("--reorder", type=float, default=0.0, help="fraction of frames to delay")
+
+    listen_parser = sub.add_parser("listen", help="print link statistics without the GUI")
+    listen_parser.add_argument("--host", default="0.0.0.0")
+    listen_parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    listen_parser.add_argument("--duration", type=float)
+
+    args = parser.parse_args(argv)
+    if args.command == "send":
+        send(args.host, args.port, args.rate, args.duration, args.loss, args.reorder)
+    else:
+        listen(args.host, args.port, args.duration)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,398 @@
+"""Offscreen benchmark of the GCS UI pipeline.
+
+Starts MainWindow on the ``offscreen`` Qt platform with a stub web view
+in place of QtWebEngine: map JavaScript calls are counted and sized but
+never run. A golden trace (or a seeded in-memory one) is pushed straight
+into ``MainWindow.handle_data_update`` at each requested rate. For every
+rate the harness reports:
+
+* per-frame handler time and latency (due time to handler done, and to
+  the next finished paint), as percentiles in milliseconds
+* event-loop lag, from a 10 ms probe timer
+* paints per second, and time spent per widget class in paint, style,
+  layout, timer and queued-call events
+* time spent in each panel's ``update_*`` methods
+* map JS calls and bytes, error log inserts
+* RSS over time
+
+Results are written as JSON, for tracking across versions. From the GCS
+directory::
+
+    python -m utils.ui_benchmark --rates 1,10,50,100,200,500 --duration 10 --out bench.json
+"""
+import os
+import sys
+import json
+import time
+import types
+import hashlib
+import platform
+import argparse
+import functools
+import subprocess
+import numpy as np
+
+# Must be set before the QApplication is created
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import (Qt, QEvent, QEventLoop, QTimer, QObject, pyqtSignal,
+                          PYQT_VERSION_STR, QT_VERSION_STR)
+from PyQt5.QtWidgets import QApplication, QWidget
+
+# Events timed per receiver class; timers are attributed to their owner
+TIMED_EVENTS = {
+    QEvent.Paint: "paint",
+    QEvent.UpdateRequest: "update_request",
+    QEvent.StyleChange: "style_change",
+    QEvent.Polish: "polish",
+    QEvent.LayoutRequest: "layout",
+    QEvent.Timer: "timer",
+    QEvent.MetaCall: "queued_call",
+}
+PANELS = ('attitude', 'system', 'motors', 'batteries', 'position', 'sensors', 'gps', 'map')
+PROBE_INTERVAL_MS = 10
+
+class _StubPage:
+    def __init__(self, stats):
+        self.stats = stats
+
+    def runJavaScript(self, code, *args):
+        self.stats['calls'] += 1
+        self.stats['bytes'] += len(code)
+
+class StubWebEngineView(QWidget):
+    """Stands in for QWebEngineView: loads instantly, records JS calls"""
+    loadFinished = pyqtSignal(bool)
+    js_stats = {'calls': 0, 'bytes': 0}
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self._page = _StubPage(StubWebEngineView.js_stats)
+
+    def page(self):
+        return self._page
+
+    def load(self, url):
+        QTimer.singleShot(0, lambda: self.loadFinished.emit(True))
+
+    def setUrl(self, url):
+        self.load(url)
+
+def install_stub_map():
+    module = types.ModuleType("PyQt5.QtWebEngineWidgets")
+    module.QWebEngineView = StubWebEngineView
+    sys.modules["PyQt5.QtWebEngineWidgets"] = module
+
+def percentiles(values):
+    if not len(values):
+        return None
+    values = np.asarray(values) * 1000.0
+    p50, p90, p99 = np.percentile(values, [50, 90, 99])
+    return {'p50': round(float(p50), 3), 'p90': round(float(p90), 3), 'p99': round(float(p99), 3),
+            'max': round(float(values.max()), 3), 'mean': round(float(values.mean()), 3)}
+
+def rss_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+    except (OSError, ValueError):
+        import resource
+        # Peak rather than current RSS, but still shows growth
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3
+
+class BenchmarkApplication(QApplication):
+    """QApplication that times selected events per receiver class"""
+
+    def __init__(self, argv):
+        super().__init__(argv)
+        self.event_stats = {}
+        self.paints = 0
+        self.on_paint = None
+
+    def reset_stats(self):
+        self.event_stats = {}
+        self.paints = 0
+
+    def notify(self, receiver, event):
+        kind = TIMED_EVENTS.get(event.type())
+        if kind is None:
+            return super().notify(receiver, event)
+        # Resolve the key first: single-shot timers are gone after delivery
+        owner = receiver.parent() if kind == "timer" else None
+        key = f"{kind}:{type(owner if owner is not None else receiver).__name__}"
+        start = time.perf_counter()
+        result = super().notify(receiver, event)
+        elapsed = time.perf_counter() - start
+        stats = self.event_stats.get(key)
+        if stats is None:
+            stats = self.event_stats[key] = [0, 0.0]
+        stats[0] += 1
+        stats[1] += elapsed
+        if kind == "paint":
+            self.paints += 1
+            if self.on_paint is not None:
+                self.on_paint()
+        return result
+
+class MethodTimer:
+    """Wraps bound methods of live widgets and accumulates their call times"""
+
+    def __init__(self):
+        self.samples = {}
+
+    def wrap(self, obj, method_name, label):
+        method = getattr(obj, method_name)
+        samples = self.samples.setdefault(label, [])
+
+        @functools.wraps(method)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                samples.append(time.perf_counter() - start)
+        setattr(obj, method_name, timed)
+
+    def reset(self):
+        for samples in self.samples.values():
+            samples.clear()
+
+    def report(self, seconds):
+        return {label: dict(calls=len(samples), total_ms=round(sum(samples) * 1000, 3),
+                            ms_per_s=round(sum(samples) * 1000 / seconds, 3),
+                            **(percentiles(samples) or {}))
+                for label, samples in sorted(self.samples.items()) if samples}
+
+def instrument(window, timer):
+    """Wrap the panel update methods both views call, and the error log"""
+    for view_name, view in (("ground", window.ground_view), ("flight", window.flight_view)):
+        for panel in PANELS:
+            widget = getattr(view, panel, None)
+            if widget is None:
+                continue
+            for name in dir(type(widget)):
+                if name.startswith("update_") and callable(getattr(widget, name)):
+                    # The map is shared; label it once
+                    prefix = "map" if panel == "map" else f"{view_name}.{panel}"
+                    if prefix == "map" and view_name == "flight":
+                        continue
+                    timer.wrap(widget, name, f"{prefix}.{name}")
+    timer.wrap(window.error_log, "add_entry", "error_log.add_entry")
+
+def load_frames(trace=None, frames=3600, seed=1):
+    """Unpacked FRAME tuples from a trace file, or simulated with ``seed``"""
+    from utils.udp_telemetry import FRAME
+    from utils.golden_trace import load_trace, simulate_trace
+    if trace:
+        info, data = load_trace(trace)
+        source = {'trace': os.path.basename(trace), 'digest': info['digest'], 'seed': info['seed']}
+    else:
+        data = simulate_trace(frames, 1.0, seed)
+        source = {'trace': None, 'digest': hashlib.sha256(data).hexdigest(), 'seed': seed}
+    return list(FRAME.iter_unpack(data)), source
+
+def _git_revision():
+    try:
+        return subprocess.run(["git", "describe", "--always", "--dirty"], capture_output=True,
+                              text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+class BenchmarkRun(QObject):
+    """Pushes frames at one rate and collects the measurements"""
+
+    def __init__(self, app, window, timer, rows, rate, duration):
+        super().__init__()
+        from utils.udp_telemetry import build_frame
+        self.build_frame = build_frame
+        self.app = app
+        self.window = window
+        self.timer = timer
+        self.rows = rows
+        self.rate = rate
+        self.duration = duration
+        self.total = max(1, int(rate * duration))
+
+        self.sent = 0
+        self.first_push = None
+        self.last_push = None
+        self.handler_times = []
+        self.latencies = []
+        self.paint_latencies = []
+        self.unpainted = []
+        self.loop_lag = []
+        self.rss = []
+
+        self.push_timer = QTimer(self)
+        self.push_timer.setTimerType(Qt.PreciseTimer)
+        self.push_timer.setInterval(max(1, int(1000 / rate)))
+        self.push_timer.timeout.connect(self.push)
+        self.probe = QTimer(self)
+        self.probe.setTimerType(Qt.PreciseTimer)
+        self.probe.setInterval(PROBE_INTERVAL_MS)
+        self.probe.timeout.connect(self.on_probe)
+        self.rss_timer = QTimer(self)
+        self.rss_timer.setInterval(1000)
+        self.rss_timer.timeout.connect(self.sample_rss)
+
+    def run(self):
+        self.app.reset_stats()
+        self.timer.reset()
+        StubWebEngineView.js_stats.update(calls=0, bytes=0)
+        self.app.on_paint = self.on_paint
+        self.loop = QEventLoop()
+        self.start = time.perf_counter()
+        self.last_probe = self.start
+        self.sample_rss()
+        self.push_timer.start()
+        self.probe.start()
+        self.rss_timer.start()
+        # In case the last frame never paints
+        self.timed_out = False
+        QTimer.singleShot(int((self.duration + 2) * 1000), self.give_up)
+        self.loop.exec_()
+        elapsed = time.perf_counter() - self.start
+        for t in (self.push_timer, self.probe, self.rss_timer):
+            t.stop()
+        self.app.on_paint = None
+        self.sample_rss()
+        return self.report(elapsed)
+
+    def give_up(self):
+        if self.loop.isRunning():
+            self.timed_out = True
+            self.loop.quit()
+
+    def push(self):
+        due = self.start + self.sent / self.rate
+        frame = self.build_frame(self.rows[self.sent % len(self.rows)])
+        began = time.perf_counter()
+        if self.first_push is None:
+            self.first_push = began
+        self.last_push = began
+        self.window.handle_data_update(frame)
+        done = time.perf_counter()
+        self.handler_times.append(done - began)
+        self.latencies.append(done - min(due, began))
+        self.unpainted.append(min(due, began))
+        self.sent += 1
+        if self.sent >= self.total:
+            self.push_timer.stop()
+
+    def on_paint(self):
+        if self.unpainted:
+            now = time.perf_counter()
+            self.paint_latencies.extend(now - due for due in self.unpainted)
+            self.unpainted = []
+            if self.sent >= self.total:
+                # Every frame has reached the screen
+                self.loop.quit()
+
+    def on_probe(self):
+        now = time.perf_counter()
+        self.loop_lag.append(max(0.0, now - self.last_probe - PROBE_INTERVAL_MS / 1000))
+        self.last_probe = now
+
+    def sample_rss(self):
+        self.rss.append((round(time.perf_counter() - self.start, 2), round(rss_mb(), 2)))
+
+    def report(self, elapsed):
+        # Rates are over the push window only, not the wait for the last paint
+        span = (self.last_push - self.first_push) if self.sent > 1 else 0.0
+        window = (self.last_push - self.start) + 1 / self.rate if self.sent else elapsed
+        events = {key: {'count': count, 'total_ms': round(total * 1000, 3),
+                        'ms_per_s': round(total * 1000 / window, 3)}
+                  for key, (count, total) in sorted(self.app.event_stats.items())}
+        return {
+            'rate_hz': self.rate,
+            'frames': self.sent,
+            'seconds': round(elapsed, 3),
+            'push_seconds': round(span, 3),
+            'achieved_hz': round((self.sent - 1) / span, 2) if span else None,
+            # Time after the last push spent waiting for it to paint
+            'drain_seconds': round(elapsed - (window - 1 / self.rate), 3) if self.sent else None,
+            'last_paint_timed_out': self.timed_out,
+            'handler_ms': percentiles(self.handler_times),
+            'latency_ms': percentiles(self.latencies),
+            'paint_latency_ms': percentiles(self.paint_latencies),
+            'loop_lag_ms': percentiles(self.loop_lag),
+            'paints_per_s': round(self.app.paints / window, 2),
+            'events': events,
+            'widgets': self.timer.report(window),
+            'map_js': dict(StubWebEngineView.js_stats),
+            'rss_mb': {'start': self.rss[0][1], 'end': self.rss[-1][1],
+                       'growth': round(self.rss[-1][1] - self.rss[0][1], 2), 'timeline': self.rss},
+        }
+
+def run_benchmark(rates, duration=10.0, trace=None, frames=3600, seed=1, view="ground"):
+    """Run every rate in one GCS window and return the JSON-ready result"""
+    install_stub_map()
+    app = QApplication.instance() or BenchmarkApplication(sys.argv)
+    if not isinstance(app, BenchmarkApplication):
+        raise RuntimeError("run_benchmark times events through BenchmarkApplication; "
+                           "create one instead of a plain QApplication")
+    from utils.theme import DarkTheme
+    from views.main_window import MainWindow
+    app.setStyleSheet(DarkTheme.STYLESHEET)
+
+    rows, source = load_frames(trace, frames, seed)
+    window = MainWindow()
+    window._detach_simulator()
+    if view == "flight":
+        window.toggle_view()
+    window.resize(1400, 900)
+    window.show()
+    timer = MethodTimer()
+    instrument(window, timer)
+    # Let startup (map load, first layout and paint) settle
+    settle = QEventLoop()
+    QTimer.singleShot(1000, settle.quit)
+    settle.exec_()
+
+    result = {
+        'benchmark': 'gcs-ui',
+        'revision': _git_revision(),
+        'created': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        'platform': {'python': platform.python_version(), 'qt': QT_VERSION_STR,
+                     'pyqt': PYQT_VERSION_STR, 'machine': platform.machine(),
+                     'qpa': os.environ.get("QT_QPA_PLATFORM")},
+        'input': source,
+        'view': view,
+        'duration_s': duration,
+        'runs': [],
+    }
+    for rate in rates:
+        print(f"[Benchmark] {rate} Hz for {duration}s", file=sys.stderr)
+        result['runs'].append(BenchmarkRun(app, window, timer, rows, rate, duration).run())
+    window.close()
+    return result
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offscreen GCS UI benchmark")
+    parser.add_argument("--rates", default="1,10,50,100,200,500",
+                        help="comma-separated frame rates in Hz (1-500)")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per rate")
+    parser.add_argument("--trace", help="golden trace to push (default: seeded simulation)")
+    parser.add_argument("--frames", type=int, default=3600, help="frames to simulate without --trace")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--view", choices=["ground", "flight"], default="ground")
+    parser.add_argument("--out", help="write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    rates = [min(500.0, max(1.0, float(r))) for r in args.rates.split(",")]
+    result = run_benchmark(rates, args.duration, args.trace, args.frames, args.seed, args.view)
+    text = json.dumps(result, indent=2)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text)
+        print(f"[Benchmark] Results written to {args.out}", file=sys.stderr)
+    else:
+        print(text)
+    for run in result['runs']:
+        print(f"[Benchmark] {run['rate_hz']:g} Hz (achieved {run['achieved_hz']}): handler p50 {run['handler_ms']['p50']} ms, "
+              f"p99 {run['handler_ms']['p99']} ms, loop lag p99 {run['loop_lag_ms']['p99']} ms, "
+              f"{run['paints_per_s']} paints/s", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,10 +7,16 @@ from widgets.map_widget import MapWidget
 from widgets.gps_widget import GPSWidget
 from widgets.sensor_widget import SensorWidget
 from widgets.position_widget import PositionWidget
+from utils.profiler import profiled
 
 class FlightView(QWidget):
-    def __init__(self):
+    # Grid slot (row, col, rowspan, colspan) the shared map occupies
+    MAP_SLOT = (2, 0, 1, 2)
+
+    def __init__(self, map_widget=None):
         super().__init__()
+        # The map is owned by MainWindow and shared with the other view
+        self.map = map_widget if map_widget is not None else MapWidget()
         self.initUI()
         
     def initUI(self):
@@ -35,8 +41,7 @@ class FlightView(QWidget):
         self.grid.addWidget(self.sensors, 1, 1)
         
         # Row 2: Map (Important for navigation)
-        self.map = MapWidget()
-        self.grid.addWidget(self.map, 2, 0, 1, 2)  # Span full width
+        self.attach_map()
         
         # Row 3: Power Systems (Monitoring during flight)
         self.batteries = BatteryWidget()
@@ -60,6 +65,11 @@ class FlightView(QWidget):
         main_layout.addWidget(scroll)
         self.setLayout(main_layout)
     
+    def attach_map(self):
+        """Reparent the shared map into this view's grid"""
+        self.grid.addWidget(self.map, *self.MAP_SLOT)
+
+    @profiled
     def update_data(self, data):
         # Update all components with new telemetry data
         self.attitude.update_attitude(
@@ -7,10 +7,16 @@ from widgets.map_widget import MapWidget
 from widgets.gps_widget import GPSWidget
 from widgets.sensor_widget import SensorWidget
 from widgets.position_widget import PositionWidget
+from utils.profiler import profiled
 
 class GroundView(QWidget):
-    def __init__(self):
+    # Grid slot (row, col, rowspan, colspan) the shared map occupies
+    MAP_SLOT = (0, 0, 1, 2)
+
+    def __init__(self, map_widget=None):
         super().__init__()
+        # The map is owned by MainWindow and shared with the other view
+        self.map = map_widget if map_widget is not None else MapWidget()
         self.initUI()
         
     def initUI(self):
@@ -23,8 +29,7 @@ class GroundView(QWidget):
         self.grid = QGridLayout(content)
         
         # Row 0: Map (Top priority position)
-        self.map = MapWidget()
-        self.grid.addWidget(self.map, 0, 0, 1, 2)  # Span full width
+        self.attach_map()
 
         # Row 1: Flight Instruments
         self.attitude = AttitudeWidget()
@@ -60,6 +65,11 @@ class GroundView(QWidget):
         main_layout.addWidget(scroll)
         self.setLayout(main_layout)
 
+    def attach_map(self):
+        """Reparent the shared map into this view's grid"""
+        self.grid.addWidget(self.map, *self.MAP_SLOT)
+
+    @profiled
     def update_data(self, data):
         # Update all components with new telemetry data
         self.attitude.update_attitude(
@@ -78,4 +88,4 @@ class GroundView(QWidget):
         self.position.update_data(data['latitude'], data['longitude'], data['altitude'])
         self.sensors.update_status(data['sensor_health'])
         self.gps.update_data(data['gps_health'])
-        self.map.update_position(data['latitude'], data['longitude'])
\ No newline at end of file
+        self.map.update_position(data['latitude'], data['longitude'])
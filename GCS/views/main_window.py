@@ -1,5 +1,5 @@
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                            QPushButton, QLabel, QStackedLayout, QDockWidget)
+                            QPushButton, QLabel, QStackedLayout, QDockWidget, QComboBox)
 from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QPixmap
 from views.ground_view import GroundView
@@ -7,31 +7,51 @@ from views.flight_view import FlightView
 from utils.data_simulator import DataSimulator
 from utils.logger import DataLogger
 from widgets.error_log import ErrorLogWidget
+from widgets.map_widget import MapWidget
+from widgets.replay_bar import ReplayBar
+from utils.replay import ReplaySource
+from utils.udp_telemetry import UdpTelemetrySource
+from utils.fleet import FleetSource
+from utils.fleet_dynamics import KernelFleetSource
+from utils.profiler import profiled, install_overlay, PROFILER
+from utils.watchdog import StallWatchdog
+from utils.startup import StartupTimer
+from utils.theme import set_variant
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, headless_map=False, seed=None, profile=False):
         super().__init__()
+        self.startup = StartupTimer(self)
+        self.startup.mark("imports")
         self.setWindowTitle("Ground Control Station")
         self.setGeometry(100, 100, 1400, 900)
         self.current_mode = "GROUND"
-        
+        self.headless_map = headless_map
         
         # Initialize core components
-        self.data_simulator = DataSimulator()
+        self.data_simulator = DataSimulator(seed=seed)
         self.logger = DataLogger()
+        self.replay_source = None
+        self.udp_source = None
+        self.fleet = None
+        self.profile = profile
         self.init_ui()
         self.connect_signals()
+        # F12 toggles the slot profiler overlay
+        install_overlay(self, show=profile)
+        # Reports main-thread stalls (with the stuck stack) to the error log.
+        # Armed once startup is over, so construction is not reported as a stall
+        self.watchdog = StallWatchdog(self.heartbeat, parent=self)
+        self.watchdog.stall_detected.connect(self.handle_stall)
+        self.startup.finished.connect(self.watchdog.start)
+        self.startup.mark("widgets built")
+        # Chromium is the slowest thing to start, so the map waits for the first paint
+        self.telemetry_shown = False
+        self.startup.first_paint.connect(self.load_map)
 
     def init_ui(self):
         # Central widget setup
         
-        self.mode_label = QLabel("Ground Control Station")
-        self.mode_label.setStyleSheet("""
-            font-size: 18px; 
-            font-weight: bold;
-            color: #FFFFFF;
-        """)
-        
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         self.main_layout = QVBoxLayout(central_widget)
@@ -51,18 +71,10 @@ class MainWindow(QMainWindow):
         title_section = QVBoxLayout()
         
         self.mode_label = QLabel("Ground Control Station")
-        self.mode_label.setStyleSheet("""
-            font-size: 18px; 
-            font-weight: bold;
-            color: #FFFFFF;
-        """)
+        self.mode_label.setObjectName("modeLabel")
         
         self.status_label = QLabel("SYSTEM: INITIALIZING")
-        self.status_label.setStyleSheet("""
-            color: #FFA500;
-            font: bold 14px;
-            margin-top: 2px;
-        """)
+        self.status_label.setObjectName("statusLabel")
         
         title_section.addWidget(self.mode_label)
         title_section.addWidget(self.status_label)
@@ -71,53 +83,39 @@ class MainWindow(QMainWindow):
         # Center spacer
         top_bar.addStretch(1)
         
-        # Right section - Control buttons with consistent styling
-        button_style = """
-            QPushButton {
-                min-width: 130px;
-                min-height: 40px;
-                padding: 8px;
-                border-radius: 5px;
-                font: bold 12px;
-                margin: 0px 5px;
-            }
-            QPushButton:hover {
-                opacity: 0.8;
-            }
-        """
-        
+        # Right section - Control buttons, styled by object name in the theme
         # Control buttons with descriptive tooltips
         self.btn_arm = QPushButton("ARM DRONE")
         self.btn_arm.setToolTip("Arm or disarm the drone's motors")
-        self.btn_arm.setStyleSheet(button_style + "background-color: #4CAF50; color: white;")
+        self.btn_arm.setObjectName("armButton")
         
         self.btn_mode = QPushButton("MODE: MANUAL")
         self.btn_mode.setToolTip("Switch between manual and autonomous flight modes")
-        self.btn_mode.setStyleSheet(button_style + "background-color: #2196F3; color: white;")
+        self.btn_mode.setObjectName("modeButton")
         
         self.btn_logging = QPushButton("START LOGGING")
         self.btn_logging.setToolTip("Begin or end data logging for this session")
-        self.btn_logging.setStyleSheet(button_style + "background-color: #9C27B0; color: white;")
+        self.btn_logging.setObjectName("loggingButton")
         
         self.btn_emergency = QPushButton("EMERGENCY STOP")
         self.btn_emergency.setToolTip("Immediately halt all drone operations")
-        self.btn_emergency.setStyleSheet(button_style + "background-color: #F44336; color: white;")
+        self.btn_emergency.setObjectName("emergencyButton")
         
         self.view_toggle_btn = QPushButton("SWITCH TO FLIGHT VIEW")
         self.view_toggle_btn.setToolTip("Toggle between ground station and flight views")
-        self.view_toggle_btn.setStyleSheet(button_style + "background-color: #007ACC; color: white;")
+        self.view_toggle_btn.setObjectName("viewToggleButton")
         self.view_toggle_btn.clicked.connect(self.toggle_view)
         
         # Add buttons to top bar
-        control_section = QHBoxLayout()
-        control_section.setSpacing(8)
-        control_section.addWidget(self.btn_arm)
-        control_section.addWidget(self.btn_mode)
-        control_section.addWidget(self.btn_logging)
-        control_section.addWidget(self.btn_emergency)
-        control_section.addWidget(self.view_toggle_btn)
+        self.control_section = QHBoxLayout()
+        self.control_section.setSpacing(8)
+        self.control_section.addWidget(self.btn_arm)
+        self.control_section.addWidget(self.btn_mode)
+        self.control_section.addWidget(self.btn_logging)
+        self.control_section.addWidget(self.btn_emergency)
+        self.control_section.addWidget(self.view_toggle_btn)
         
-        top_bar.addLayout(control_section)
+        top_bar.addLayout(self.control_section)
         
         # Add the completed top bar to main layout
         self.main_layout.addLayout(top_bar)
@@ -128,14 +126,17 @@ class MainWindow(QMainWindow):
         # Fix: Use Qt.SizePolicy instead of QWidget.Policy
         from PyQt5.QtWidgets import QSizePolicy
         separator.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        separator.setStyleSheet("background-color: #555555;")
+        separator.setObjectName("separator")
         self.main_layout.addWidget(separator)
 
     def create_view_stack(self):
         """Create the view switcher"""
         self.view_stack = QStackedLayout()
-        self.ground_view = GroundView()
-        self.flight_view = FlightView()
+        # One map (and one Chromium renderer) shared by both views
+        self.map_widget = MapWidget(headless=self.headless_map)
+        self.ground_view = GroundView(self.map_widget)
+        self.flight_view = FlightView(self.map_widget)
+        self.ground_view.attach_map()
         
         self.view_stack.addWidget(self.ground_view)
         self.view_stack.addWidget(self.flight_view)
@@ -146,10 +147,12 @@ class MainWindow(QMainWindow):
         if self.current_mode == "GROUND":
             self.current_mode = "FLIGHT"
             self.view_toggle_btn.setText("Ground View")
+            self.flight_view.attach_map()
             self.view_stack.setCurrentWidget(self.flight_view)
         else:
             self.current_mode = "GROUND"
             self.view_toggle_btn.setText("Flight View")
+            self.ground_view.attach_map()
             self.view_stack.setCurrentWidget(self.ground_view)
         self.update()
 
@@ -160,6 +163,19 @@ class MainWindow(QMainWindow):
         error_dock.setWidget(self.error_log)
         self.addDockWidget(Qt.BottomDockWidgetArea, error_dock)
 
+    def load_map(self):
+        if self.headless_map:
+            self.startup.finish("ready")
+            return
+        self.map_widget.loaded.connect(
+            lambda ok: self.startup.finish("map ready" if ok else "map failed"))
+        self.map_widget.load()
+        if self.map_widget.view is None:
+            # QtWebEngine could not be loaded; the map stays a placeholder
+            self.startup.finish("ready")
+        else:
+            self.startup.mark("map view created")
+
     def connect_signals(self):
         """Connect data signals"""
         self.data_simulator.data_updated.connect(self.handle_data_update)
@@ -167,6 +183,7 @@ class MainWindow(QMainWindow):
         self.btn_logging.clicked.connect(self.toggle_logging)
         self.data_simulator.start()
 
+    @profiled
     def handle_data_update(self, data):
         """Handle incoming telemetry data"""
         current_view = self.ground_view if self.view_stack.currentIndex() == 0 else self.flight_view
@@ -178,14 +195,98 @@ class MainWindow(QMainWindow):
         
         # Update status label
         status_text = "ARMED" if data['arm_status'] else "DISARMED"
-        status_color = "#4CAF50" if data['arm_status'] else "#F44336"
         self.status_label.setText(f"STATUS: {status_text}")
-        self.status_label.setStyleSheet(f"color: {status_color}; font: bold 14px;")
+        set_variant(self.status_label, "level", "ok" if data['arm_status'] else "critical")
         
         # Log data
         if self.logger.logging:
             self.logger.log(data)
 
+        if not self.telemetry_shown:
+            self.telemetry_shown = True
+            self.startup.mark("first telemetry")
+
+    def start_replay(self, path, speed=1.0):
+        """Replace the live simulator with playback of a DataLogger session.
+
+        ``path`` is a log file (.csv, .csv.gz, .gtl) or a session manifest.
+        """
+        self._detach_simulator()
+        if self.replay_source is not None:
+            self.replay_source.stop()
+
+        self.replay_source = ReplaySource(path, speed=speed)
+        self.replay_source.data_updated.connect(self.handle_data_update)
+        replay_dock = QDockWidget("Replay", self)
+        replay_dock.setWidget(ReplayBar(self.replay_source))
+        self.addDockWidget(Qt.TopDockWidgetArea, replay_dock)
+        self.btn_arm.setEnabled(False)
+        self.replay_source.start()
+
+    def start_udp(self, port, host="0.0.0.0"):
+        """Replace the simulator with binary telemetry received over UDP"""
+        self._detach_simulator()
+        if self.udp_source is not None:
+            self.udp_source.stop()
+
+        self.udp_source = UdpTelemetrySource(host, port)
+        self.udp_source.data_updated.connect(self.handle_data_update)
+        # Arming has to go through the autopilot; there is no uplink yet
+        self.btn_arm.setEnabled(False)
+        self.udp_source.start()
+
+    def start_fleet(self, count, interval=1.0, kernel=False, seed=None):
+        """Simulate ``count`` vehicles, each in its own process, or all of
+        them in one vectorized kernel when ``kernel`` is set.
+
+        All vehicles are drawn on the map; the panels show the vehicle
+        picked in the top bar selector.
+        """
+        self._detach_simulator()
+        if kernel:
+            self.fleet = KernelFleetSource(count, interval, seed=seed)
+        else:
+            self.fleet = FleetSource(count, interval, seed=seed)
+        self.fleet.data_updated.connect(self.handle_data_update)
+        self.fleet.fleet_updated.connect(
+            lambda vehicles: self.map_widget.update_fleet(vehicles, self.fleet.selected))
+        self.fleet.vehicle_error.connect(self.handle_vehicle_error)
+
+        self.vehicle_selector = QComboBox()
+        self.vehicle_selector.setToolTip("Vehicle shown in the telemetry panels")
+        self.vehicle_selector.setObjectName("vehicleSelector")
+        self.vehicle_selector.addItems([f"V{i + 1}" for i in range(count)])
+        self.vehicle_selector.currentIndexChanged.connect(self.select_vehicle)
+        self.control_section.insertWidget(0, self.vehicle_selector)
+        self.btn_arm.setEnabled(False)
+        self.fleet.start()
+
+    def select_vehicle(self, index):
+        self.fleet.select(index)
+        self.map_widget.reset_track()
+        self.mode_label.setText(f"Ground Control Station - V{index + 1}")
+
+    @profiled
+    def handle_vehicle_error(self, index, error):
+        """Errors from vehicles other than the selected one"""
+        error = dict(error)
+        error['source'] = f"V{index + 1}/{error['source'] or ''}"
+        self.error_log.add_entry(error)
+
+    def handle_stall(self, stall):
+        """Main-thread stall reported by the watchdog"""
+        self.error_log.add_entry({
+            'code': 'STALL',
+            'desc': f"UI stalled {stall['duration_ms']:.0f} ms in {stall['slot']}",
+            'source': 'Watchdog',
+        })
+
+    def _detach_simulator(self):
+        """Stop the built-in simulator before another source takes over"""
+        if self.data_simulator.isRunning():
+            self.data_simulator.data_updated.disconnect(self.handle_data_update)
+            self.data_simulator.stop()
+
     def toggle_arm_state(self):
         """Toggle drone arm state"""
         current_state = self.data_simulator.armed
@@ -197,32 +298,23 @@ class MainWindow(QMainWindow):
         if self.logger.logging:
             self.logger.stop()
             self.btn_logging.setText("START LOGGING")
-            self.btn_logging.setStyleSheet("""
-                QPushButton {
-                    min-width: 120px;
-                    padding: 8px;
-                    border-radius: 5px;
-                    font: bold 12px;
-                    background-color: #9C27B0;
-                    color: white;
-                }
-            """)
         else:
             self.logger.start()
             self.btn_logging.setText("STOP LOGGING")
-            self.btn_logging.setStyleSheet("""
-                QPushButton {
-                    min-width: 120px;
-                    padding: 8px;
-                    border-radius: 5px;
-                    font: bold 12px;
-                    background-color: #FF9800;
-                    color: white;
-                }
-            """)
+        set_variant(self.btn_logging, "logging", self.logger.logging)
 
     def closeEvent(self, event):
         """Cleanup on window close"""
+        self.watchdog.stop()
         self.data_simulator.stop()
+        if self.replay_source is not None:
+            self.replay_source.stop()
+        if self.udp_source is not None:
+            self.udp_source.stop()
+        if self.fleet is not None:
+            self.fleet.stop()
+        self.map_widget.shutdown()
         self.logger.stop()
+        if self.profile:
+            PROFILER.dump()
         event.accept()
@@ -1,20 +1,13 @@
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar, QFrame
 from PyQt5.QtCore import Qt,QSize
+from utils.profiler import profiled
+from utils.theme import set_variant
 
 class BatteryWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.layout = QVBoxLayout()
         self.setLayout(self.layout)
-        self.setStyleSheet("""
-            QGroupBox {
-                border: 1px solid #252526;
-                margin-top: 15px;
-            }
-            QLabel {
-                font: bold 12px;
-            }
-        """)
 
         self.layout.addWidget(self._section_title("Battery Status"))
 
@@ -23,7 +16,7 @@ class BatteryWidget(QWidget):
         for i in range(4):  # 4 batteries
             container = QFrame()
             container.setFrameShape(QFrame.StyledPanel)
-            container.setStyleSheet("""background-color: #f9f9f9; border-radius: 8px; padding: 6px;""")
+            container.setObjectName("statusRow")
             hbox = QHBoxLayout(container)
 
             name_label = QLabel(f"Battery {i+1}")
@@ -33,17 +26,6 @@ class BatteryWidget(QWidget):
             progress.setMaximum(100)
             progress.setFormat("%p%")
             progress.setFixedHeight(30)
-            progress.setStyleSheet("""
-                                QProgressBar{ 
-                                    border-radius: 8px; 
-                                    text-align: center;
-                                    font-weight: bold;
-                                }
-                                QProgressBar::chunk {
-                                    background-color: #4caf50;
-                                    border-radius: 8px;
-                                }
-                                """)
             progress.setAlignment(Qt.AlignCenter)
 
             temp_label = QLabel("Temp: 0°C")
@@ -59,11 +41,10 @@ class BatteryWidget(QWidget):
 
     def _section_title(self, text):
         label = QLabel(f"<b>{text}</b>")
-        label.setStyleSheet("""font-size: 16px;
-                            color: #D4D4D4;
-                            """)
+        label.setObjectName("sectionTitle")
         return label
 
+    @profiled
     def update_data(self, levels, temps):
         for i in range(4):
             charge = int(levels[i])
@@ -72,31 +53,19 @@ class BatteryWidget(QWidget):
             progress, temp_label = self.battery_widgets[i]
             progress.setValue(charge)
 
-            # Style progress chunk color based on charge
+            # Chunk color follows the charge
             if charge < 30:
-                chunk_color = "#f44336"  # red
+                set_variant(progress, "level", "critical")
             elif charge < 60:
-                chunk_color = "#ff9800"  # orange
+                set_variant(progress, "level", "warning")
             else:
-                chunk_color = "#4caf50"  # green
-
-            progress.setStyleSheet(f"""
-                QProgressBar {{
-                    border-radius: 8px;
-                    text-align: center;
-                    font-weight: bold;
-                }}
-                QProgressBar::chunk {{
-                    background-color: {chunk_color};
-                    border-radius: 8px;
-                }}
-            """)
+                set_variant(progress, "level", "ok")
 
             # Update temperature label
             temp_label.setText(f"Temp: {temp:.1f}°C")
             if temp > 65:
-                temp_label.setStyleSheet("color: red;")
+                set_variant(temp_label, "level", "critical")
             elif temp > 50:
-                temp_label.setStyleSheet("color: orange;")
+                set_variant(temp_label, "level", "warning")
             else:
-                temp_label.setStyleSheet("color: green;")
+                set_variant(temp_label, "level", "ok")
@@ -1,67 +1,237 @@
-from PyQt5.QtWidgets import QGroupBox, QVBoxLayout, QListWidget, QListWidgetItem
+from PyQt5.QtWidgets import QGroupBox, QVBoxLayout, QHBoxLayout, QListView, QLineEdit, QLabel
 from PyQt5.QtGui import QColor
-from PyQt5.QtCore import Qt, QDateTime
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QTimer
+from utils.error_aggregator import ErrorAggregator, parse_filter
+from bisect import bisect_left
+import time
+from utils.profiler import profiled
+
+ERROR_COLORS = {
+    'Motors': QColor(255, 100, 100),     # Red
+    'Battery': QColor(255, 200, 100),    # Orange
+    'Flight Controller': QColor(100, 200, 255),  # Blue
+    'Sensors': QColor(200, 100, 255)     # Purple
+}
+DEFAULT_COLOR = QColor(255, 255, 255)
+
+def source_color(source):
+    # Fleet errors are tagged "V3/Motors"; colour by the part after the slash
+    return ERROR_COLORS.get((source or '').rsplit('/', 1)[-1], DEFAULT_COLOR)
+
+def _clock(timestamp):
+    return time.strftime("%H:%M:%S", time.localtime(timestamp))
+
+class ErrorLogModel(QAbstractListModel):
+    """Newest-first list model over the groups of an ErrorAggregator.
+
+    Each row is one ErrorGroup (repeats are collapsed into a count) and is
+    only formatted when the view asks for a visible row. Changes are
+    published to views in batches on a short timer, so a burst of errors
+    costs one rowsInserted/dataChanged notification instead of one per
+    error. ``set_filter`` narrows the rows using the aggregator's index.
+    """
+
+    def __init__(self, capacity=100000, flush_interval_ms=100, parent=None):
+        super().__init__(parent)
+        self.aggregator = ErrorAggregator(capacity)
+
+        # State the attached views currently know about
+        self.published_total = 0
+        self.published_count = 0
+        self.changed = set()
+
+        # Ascending group seqs shown while a filter is active
+        self.filter = None
+        self.filter_seqs = None
+
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(flush_interval_ms)
+        self.flush_timer.timeout.connect(self.flush)
+        # A last:5m filter slides: rows leaving the window drop once a second
+        self.window_timer = QTimer(self)
+        self.window_timer.setInterval(1000)
+        self.window_timer.timeout.connect(self.flush)
+
+    @property
+    def groups(self):
+        return self.aggregator.groups
+
+    def append(self, error_data, timestamp=None):
+        group, is_new = self.aggregator.add(
+            error_data['code'], error_data['desc'], error_data['source'], timestamp)
+        if not is_new:
+            self.changed.add(group.seq)
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+    @profiled
+    def flush(self):
+        if self.filter_seqs is not None:
+            self._flush_filtered()
+        else:
+            self._flush_all()
+        self._emit_changed()
+
+    def _flush_all(self):
+        new = self.groups.total - self.published_total
+        if new <= 0:
+            return
+        capacity = self.groups.capacity
+        if new >= capacity:
+            # The whole buffer turned over since the last flush
+            self.beginResetModel()
+            self.published_total = self.groups.total
+            self.published_count = len(self.groups)
+            self.endResetModel()
+            return
+
+        # Drop rows that fell off the end of the ring, then add the new ones
+        overflow = self.published_count + new - capacity
+        if overflow > 0:
+            first = self.published_count - overflow
+            self.beginRemoveRows(QModelIndex(), first, self.published_count - 1)
+            self.published_count -= overflow
+            self.endRemoveRows()
+
+        self.beginInsertRows(QModelIndex(), 0, new - 1)
+        self.published_total = self.groups.total
+        self.published_count += new
+        self.endInsertRows()
+
+    def _flush_filtered(self):
+        # Groups that arrived and were evicted between two flushes are skipped
+        start = max(self.published_total, self.groups.oldest)
+        new = [seq for seq in range(start, self.groups.total)
+               if self.aggregator.matches(self.groups.get(seq), **self.filter)]
+        self.published_total = self.groups.total
+        # Rows whose group has left the ring or the last: window are at the
+        # bottom (oldest)
+        cutoff = self.groups.oldest
+        if self.filter.get('last') is not None:
+            cutoff = max(cutoff, self.aggregator.seq_since(time.time() - self.filter['last']))
+        dropped = bisect_left(self.filter_seqs, cutoff)
+        if dropped:
+            count = len(self.filter_seqs)
+            self.beginRemoveRows(QModelIndex(), count - dropped, count - 1)
+            del self.filter_seqs[:dropped]
+            self.endRemoveRows()
+        if new:
+            self.beginInsertRows(QModelIndex(), 0, len(new) - 1)
+            self.filter_seqs.extend(new)
+            self.endInsertRows()
+
+    def _emit_changed(self):
+        rows = [row for row in map(self.row_for_seq, self.changed) if row is not None]
+        self.changed.clear()
+        if rows:
+            self.dataChanged.emit(self.index(min(rows)), self.index(max(rows)),
+                                  [Qt.DisplayRole])
+
+    def row_for_seq(self, seq):
+        if self.filter_seqs is None:
+            row = self.published_total - 1 - seq
+            return row if 0 <= row < self.published_count else None
+        i = bisect_left(self.filter_seqs, seq)
+        if i < len(self.filter_seqs) and self.filter_seqs[i] == seq:
+            return len(self.filter_seqs) - 1 - i
+        return None
+
+    def set_filter(self, text):
+        """Show only groups matching ``text`` (see parse_filter); '' clears it"""
+        self.flush_timer.stop()
+        self.beginResetModel()
+        self.published_total = self.groups.total
+        self.published_count = len(self.groups)
+        self.changed.clear()
+        criteria = parse_filter(text) if text.strip() else None
+        self.filter = criteria
+        self.filter_seqs = self.aggregator.query(**criteria) if criteria else None
+        self.endResetModel()
+        if criteria and criteria.get('last') is not None:
+            self.window_timer.start()
+        else:
+            self.window_timer.stop()
+
+    def group(self, row):
+        """Return the ErrorGroup shown at a row (row 0 is the newest)"""
+        if self.filter_seqs is not None:
+            if not 0 <= row < len(self.filter_seqs):
+                return None
+            return self.groups.get(self.filter_seqs[len(self.filter_seqs) - 1 - row])
+        return self.groups.get(self.published_total - 1 - row)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        if self.filter_seqs is not None:
+            return len(self.filter_seqs)
+        return self.published_count
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        group = self.group(index.row())
+        if group is None:
+            return None
+        if role == Qt.DisplayRole:
+            text = f"[{_clock(group.last_seen)}] {group.code}: {group.desc} ({group.source})"
+            if group.count > 1:
+                text += f"  x{group.count} since {_clock(group.first_seen)}"
+            return text
+        if role == Qt.ForegroundRole:
+            return source_color(group.source)
+        return None
+
+    def clear(self):
+        self.beginResetModel()
+        self.aggregator.clear()
+        self.published_total = 0
+        self.published_count = 0
+        self.changed.clear()
+        if self.filter_seqs is not None:
+            self.filter_seqs = []
+        self.endResetModel()
 
 class ErrorLogWidget(QGroupBox):
-    def __init__(self):
+    def __init__(self, max_entries=100000):
         super().__init__("Error Log")
-        self.setStyleSheet("""
-            QGroupBox {
-                border: 1px solid #252526;
-                margin-top: 15px;
-            }
-            QLabel {
-                font: bold 12px;
-            }
-        """)
-        self.max_entries = 100
+        self.max_entries = max_entries
+        self.model = ErrorLogModel(capacity=max_entries, parent=self)
         self.initUI()
 
     def initUI(self):
         layout = QVBoxLayout()
-        self.list_widget = QListWidget()
-        self.list_widget.setStyleSheet("""
-            QListWidget {
-                background-color: #1E1E1E;
-                color: #FFFFFF;
-                font: 10pt Monospace;
-                border: none;
-            }
-        """)
-        
-        layout.addWidget(self.list_widget)
+
+        filter_bar = QHBoxLayout()
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText("Filter: code:E103 source:Motors last:5m or any text")
+        self.filter_edit.setClearButtonEnabled(True)
+        self.filter_edit.textChanged.connect(self.model.set_filter)
+        self.summary_label = QLabel()
+        filter_bar.addWidget(self.filter_edit, 1)
+        filter_bar.addWidget(self.summary_label)
+
+        self.list_view = QListView()
+        self.list_view.setModel(self.model)
+        # Every row is one line, so the view can skip per-row size queries
+        self.list_view.setUniformItemSizes(True)
+        self.model.rowsInserted.connect(self.update_summary)
+        self.model.modelReset.connect(self.update_summary)
+        self.model.dataChanged.connect(self.update_summary)
+
+        layout.addLayout(filter_bar)
+        layout.addWidget(self.list_view)
         self.setLayout(layout)
-        self.setStyleSheet("""
-            QGroupBox {
-                font: bold 14px;
-                color: #1E90FF;
-                border: 2px solid #1E90FF;
-                border-radius: 5px;
-                margin-top: 10px;
-            }
-        """)
+        self.update_summary()
+
+    def update_summary(self, *args):
+        aggregator = self.model.aggregator
+        self.summary_label.setText(
+            f"{self.model.rowCount()} rows / {aggregator.total_errors} errors")
 
+    @profiled
     def add_entry(self, error_data):
         if not error_data or not error_data.get('code'):
             return
-            
-        timestamp = QDateTime.currentDateTime().toString("[hh:mm:ss]")
-        text = f"{timestamp} {error_data['code']}: {error_data['desc']} ({error_data['source']})"
-        
-        item = QListWidgetItem(text)
-        item.setForeground(self._get_error_color(error_data['source']))
-        
-        self.list_widget.insertItem(0, item)
-        
-        # Maintain max entries
-        while self.list_widget.count() > self.max_entries:
-            self.list_widget.takeItem(self.max_entries)
-
-    def _get_error_color(self, source):
-        colors = {
-            'Motors': QColor(255, 100, 100),     # Red
-            'Battery': QColor(255, 200, 100),    # Orange
-            'Flight Controller': QColor(100, 200, 255),  # Blue
-            'Sensors': QColor(200, 100, 255)     # Purple
-        }
-        return colors.get(source, QColor(255, 255, 255))
\ No newline at end of file
+        self.model.append(error_data)
@@ -0,0 +1,94 @@
+from PyQt5.QtCore import QObject, QTimer
+from array import array
+import base64
+import json
+import sys
+from utils.profiler import profiled
+
+def encode_points(points):
+    """Encode a flat array('d') of (lat, lon) pairs as little-endian base64"""
+    if sys.byteorder != 'little':
+        points = array('d', points)
+        points.byteswap()
+    return base64.b64encode(points.tobytes()).decode('ascii')
+
+class MapBridge(QObject):
+    """Coalesces map updates into one JavaScript call per flush interval.
+
+    Telemetry can arrive much faster than the page can usefully redraw, so
+    positions are buffered here and only the latest one is sent. Track
+    updates from the simplifier are merged per zoom level and shipped as
+    base64-encoded float64 batches which the page decodes straight into a
+    Float64Array.
+    """
+
+    def __init__(self, run_js, interval_ms=33, parent=None):
+        super().__init__(parent)
+        self.run_js = run_js
+        self.ready = False
+
+        self.pending_position = None
+        # zoom -> [new committed vertices, latest simplified tail]
+        self.pending_track = {}
+        self.pending_reset = False
+        self.pending_fleet = None
+
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(interval_ms)
+        self.flush_timer.timeout.connect(self.flush)
+
+    def set_ready(self, ready=True):
+        self.ready = ready
+        if ready:
+            self.flush()
+
+    def push_position(self, lat, lon):
+        self.pending_position = (lat, lon)
+        self._schedule()
+
+    def push_track(self, levels):
+        for zoom, (new, tail) in levels.items():
+            if zoom in self.pending_track:
+                self.pending_track[zoom][0].extend(new)
+                self.pending_track[zoom][1] = tail
+            else:
+                self.pending_track[zoom] = [array('d', new), tail]
+        self._schedule()
+
+    def reset_track(self):
+        self.pending_track = {}
+        self.pending_reset = True
+        self._schedule()
+
+    def push_fleet(self, vehicles, selected):
+        """Positions of every vehicle as (index, lat, lon, armed)"""
+        self.pending_fleet = (vehicles, selected)
+        self._schedule()
+
+    def _schedule(self):
+        if self.ready and not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+    @profiled
+    def flush(self):
+        if not self.ready:
+            return
+        if self.pending_reset:
+            self.run_js("resetTrack();")
+            self.pending_reset = False
+        if self.pending_fleet is not None:
+            vehicles, selected = self.pending_fleet
+            self.run_js(f"queueFleet({json.dumps(vehicles)}, {selected});")
+            self.pending_fleet = None
+        if self.pending_track:
+            track = {
+                str(zoom): [encode_points(new), encode_points(tail)]
+                for zoom, (new, tail) in self.pending_track.items()
+            }
+            self.run_js(f"queueTrack({json.dumps(track)});")
+            self.pending_track = {}
+        if self.pending_position is not None:
+            lat, lon = self.pending_position
+            self.run_js(f"queueUpdate({lat}, {lon});")
+            self.pending_position = None
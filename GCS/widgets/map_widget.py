@@ -1,55 +1,129 @@
-from PyQt5.QtWidgets import QWidget, QVBoxLayout,QSizePolicy
-from PyQt5.QtWebEngineWidgets import QWebEngineView
-from PyQt5.QtCore import QUrl, pyqtSlot
-import os
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QSizePolicy, QLabel
+from PyQt5.QtCore import Qt, QUrl, pyqtSlot, pyqtSignal
+from widgets.map_bridge import MapBridge
+from utils.profiler import profiled
 
 class MapWidget(QWidget):
-    def __init__(self):
+    """Leaflet map shared by every view.
+
+    MainWindow creates a single instance and hands it to both views, which
+    reparent it into their own layout with ``attach_map`` when they become
+    active. Until ``load()`` is called (MainWindow does it after the first
+    paint) a placeholder stands in for the map, and QtWebEngine is not even
+    imported: starting Chromium takes longer than building every other
+    widget. Positions received before that are buffered and handed to the
+    track worker when it starts, so the flown track has no gap.
+    ``headless=True`` never creates the web view at all (positions are
+    still tracked, which is enough for offscreen runs).
+    """
+    loaded = pyqtSignal(bool)
+
+    def __init__(self, headless=False):
         super().__init__()
         self.layout = QVBoxLayout()
         self.setLayout(self.layout)
-        self.setStyleSheet("""
-            QGroupBox {
-                border: 1px solid #252526;
-                margin-top: 15px;
-            }
-            QLabel {
-                font: bold 12px;
-            }
-        """)
+        self.setMinimumHeight(400)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
-        self.view = QWebEngineView()
-        self.layout.addWidget(self.view)
+        self.headless = headless
+        self.view = None
+        self.placeholder = QLabel("Map disabled" if headless else "Loading map...")
+        self.placeholder.setAlignment(Qt.AlignCenter)
+        self.layout.addWidget(self.placeholder)
 
-        # Track if map is ready
+        # Track if map is ready; updates are buffered by the bridge until then
         self.map_ready = False
-        self.pending_position = None
+        self.last_position = None
+        # Track points received before load(); replayed into the track worker
+        self.pending_track = []
+        self.fleet = None
+        self.bridge = MapBridge(self._run_js, parent=self)
+
+        # Track simplification runs off the GUI thread, only for a real map
+        self.track_worker = None
+        self.tile_server = None
+
+    def load(self):
+        """Create the web view and start loading the map page"""
+        if self.view is not None or self.headless:
+            return
+        try:
+            from PyQt5.QtWebEngineWidgets import QWebEngineView
+        except ImportError as e:
+            print(f"[MapWidget] QtWebEngine unavailable, map disabled: {e}")
+            self.placeholder.setText("Map unavailable (QtWebEngine could not be loaded)")
+            self.headless = True
+            self.pending_track = []
+            return
+        from utils.track_simplifier import TrackSimplifierThread
+        from utils.tile_server import TileServer
+
+        self.view = QWebEngineView()
+        self.layout.replaceWidget(self.placeholder, self.view)
+        self.placeholder.deleteLater()
 
-        # Load the map HTML file
-        
-        map_path = os.path.join(os.path.dirname(__file__), "leaflet_map.html")
-        map_path = os.path.abspath(map_path)
+        # The map page, Leaflet and tiles are all served from the offline cache
+        self.tile_server = TileServer()
+        self.tile_server.start()
+        map_url = self.tile_server.url("map.html")
 
-        print("[MapWidget] Loading:",map_path)
-        self.view.setMinimumHeight(400)
+        print("[MapWidget] Loading:",map_url)
         self.view.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.view.load(QUrl.fromLocalFile(map_path))
         self.view.loadFinished.connect(self.on_map_loaded)
+        self.view.load(QUrl(map_url))
+
+        self.track_worker = TrackSimplifierThread()
+        self.track_worker.track_updated.connect(self.bridge.push_track)
+        self.track_worker.track_reset.connect(self.bridge.reset_track)
+        self.track_worker.start()
+
+        # Telemetry that arrived before the map existed
+        for lat, lon in self.pending_track:
+            self.track_worker.add_point(lat, lon)
+        self.pending_track = []
+        if self.last_position is not None:
+            self.bridge.push_position(*self.last_position)
+        if self.fleet is not None:
+            self.update_fleet(*self.fleet)
 
     @pyqtSlot(bool)
     def on_map_loaded(self, ok):
         if ok:
             self.map_ready = True
-            if self.pending_position:
-                self._send_position(*self.pending_position)
-                self.pending_position = None
+            self.bridge.set_ready()
+        self.loaded.emit(ok)
 
+    @profiled
     def update_position(self, lat, lon):
-        if self.map_ready:
-            self._send_position(lat, lon)
+        self.last_position = (lat, lon)
+        if self.track_worker is not None:
+            self.track_worker.add_point(lat, lon)
+            self.bridge.push_position(lat, lon)
+        elif not self.headless:
+            self.pending_track.append((lat, lon))
+
+    @profiled
+    def update_fleet(self, vehicles, selected):
+        """Show every vehicle of a fleet in one map layer"""
+        self.fleet = (vehicles, selected)
+        if self.track_worker is not None:
+            self.bridge.push_fleet(vehicles, selected)
+
+    def reset_track(self):
+        """Clear the flown track, e.g. when another vehicle is selected"""
+        if self.track_worker is not None:
+            self.track_worker.reset()
         else:
-            self.pending_position = (lat, lon)
+            self.pending_track = []
+
+    def shutdown(self):
+        """Stop the track worker thread and the tile server"""
+        if self.track_worker is not None:
+            self.track_worker.stop()
+            self.track_worker = None
+        if self.tile_server is not None:
+            self.tile_server.stop()
+            self.tile_server = None
 
-    def _send_position(self, lat, lon):
-        js_code = f"updatePosition({lat}, {lon});"
+    def _run_js(self, js_code):
         self.view.page().runJavaScript(js_code)
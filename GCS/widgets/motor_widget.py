@@ -1,20 +1,13 @@
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar, QFrame
 from PyQt5.QtCore import Qt
+from utils.profiler import profiled
+from utils.theme import set_variant
 
 class MotorWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.layout = QVBoxLayout()
         self.setLayout(self.layout)
-        self.setStyleSheet("""
-            QGroupBox {
-                border: 1px solid #252526;
-                margin-top: 15px;
-            }
-            QLabel {
-                font: bold 12px;
-            }
-        """)
         
         self.layout.addWidget(self._section_title("Motor Status"))
         self.motor_widgets = []
@@ -22,11 +15,7 @@ class MotorWidget(QWidget):
         for i in range(7):
             container = QFrame()
             container.setFrameShape(QFrame.StyledPanel)
-            container.setStyleSheet("""
-                                    background-color: #f9f9f9;
-                                    border-radius:8px;
-                                    padding: 6px;
-                                    """)
+            container.setObjectName("statusRow")
             hbox = QHBoxLayout(container)
             
             name_label = QLabel(f"Motor {i+1}")
@@ -36,17 +25,6 @@ class MotorWidget(QWidget):
             rpm_bar.setMaximum(10000)
             rpm_bar.setFormat("%p RPM")
             rpm_bar.setFixedHeight(30)
-            rpm_bar.setStyleSheet("""
-                                  QProgressBar{
-                                    border-radius: 8px;
-                                    text-align: center;
-                                    font-weight: bold;
-                                    }
-                                QProgressBar::chunk {
-                                    background-color: #4caf50;
-                                    border-radius: 8px;
-                                  }
-                                  """)
             
             temp_label = QLabel("Temp: 0°C")
             temp_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
@@ -61,9 +39,10 @@ class MotorWidget(QWidget):
             
     def _section_title(self,text):
         label = QLabel(f"<b>{text}</b>")
-        label.setStyleSheet("font-size:16px; font-weight:bold;color: #D4D4D4;")
+        label.setObjectName("sectionTitle")
         return label
     
+    @profiled
     def update_data(self,rpms,temps):
         for i in range(7):
             rpm = int(rpms[i])
@@ -74,28 +53,17 @@ class MotorWidget(QWidget):
             
             # RMP color feedback
             if rpm > 8000:
-                chunk_color = "#e53935"  # red
+                set_variant(rpm_bar, "level", "critical")
             elif rpm > 6000:
-                chunk_color = "#fb8c00"  # orange
+                set_variant(rpm_bar, "level", "warning")
             else:
-                chunk_color = "#2196f3"  # blue
-            rpm_bar.setStyleSheet(f"""
-                                  QProgressBar{{
-                                      border-radius: 8px;
-                                      text-align: center;
-                                      font-weight: bold;
-                                  }}
-                                  QProgressBar::chunk {{ 
-                                  background-color: {chunk_color}; 
-                                  border-radius: 8px;
-                                  }}
-                                  """)
+                set_variant(rpm_bar, "level", "ok")
 
             # Temperature label color
             temp_label.setText(f"Temp: {temp:.1f}°C")
             if temp > 85:
-                temp_label.setStyleSheet("color: red;")
+                set_variant(temp_label, "level", "critical")
             elif temp > 70:
-                temp_label.setStyleSheet("color: orange;")
+                set_variant(temp_label, "level", "warning")
             else:
-                temp_label.setStyleSheet("color: green;") 
\ No newline at end of file
+                set_variant(temp_label, "level", "ok")
@@ -2,6 +2,7 @@ from PyQt5.QtWidgets import (QGroupBox, QGridLayout, QLabel, QWidget,
                             QHBoxLayout, QVBoxLayout, QFrame)
 from PyQt5.QtGui import QFont, QColor, QPainter, QBrush, QPen, QPixmap
 from PyQt5.QtCore import Qt, QSize, QTimer, pyqtProperty, QPropertyAnimation, QEasingCurve, QRectF
+from utils.profiler import profiled
 
 class CoordinateIndicator(QWidget):
     def __init__(self, parent=None):
@@ -58,18 +59,10 @@ class ValueLabel(QWidget):
         self.value_label = QLabel(initial_text)
         self.value_label.setFont(QFont('Monospace', 12, QFont.Bold))
         self.value_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        self.value_label.setStyleSheet("color: #FFFFFF;")
         
         # Create a frame for the value with a subtle background
         value_frame = QFrame()
         value_frame.setFrameShape(QFrame.StyledPanel)
-        value_frame.setStyleSheet("""
-            QFrame {
-                background-color: rgba(0, 20, 40, 0.3);
-                border-radius: 3px;
-                padding: 2px;
-            }
-        """)
         value_layout = QHBoxLayout(value_frame)
         value_layout.setContentsMargins(5, 2, 5, 2)
         value_layout.addWidget(self.value_label)
@@ -88,30 +81,6 @@ class ValueLabel(QWidget):
 class PositionWidget(QGroupBox):
     def __init__(self):
         super().__init__("Position & Altitude")
-        self.setStyleSheet("""
-            QGroupBox {
-                border: 2px solid #1E90FF;
-                border-radius: 5px;
-                margin-top: 1ex;
-                font-weight: bold;
-                color: #1E90FF;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top center;
-                padding: 0 5px;
-                background-color: #0A1520;
-            }
-            QLabel {
-                font: bold 12px;
-                color: #D4D4D4;
-            }
-            QLabel.unit {
-                color: #888888;
-                font-size: 10px;
-                font-style: italic;
-            }
-        """)
         
         main_layout = QVBoxLayout()
         
@@ -162,7 +131,7 @@ class PositionWidget(QGroupBox):
         # Create a simple position indicator
         self.position_indicator = QWidget()
         self.position_indicator.setMinimumHeight(60)
-        self.position_indicator.setStyleSheet("background-color: rgba(0, 20, 40, 0.3); border-radius: 3px;")
+        self.position_indicator.setObjectName("positionIndicator")
         
         # Add a paintEvent to the position indicator
         def paintEvent(event):
@@ -211,6 +180,7 @@ class PositionWidget(QGroupBox):
         self._last_lon = 0
         self._last_alt = 0
 
+    @profiled
     def update_data(self, lat, lon, alt):
         # Update the labels with formatted values
         self.lat_label.setText(f"{lat:.6f}°")
@@ -0,0 +1,61 @@
+from PyQt5.QtWidgets import QWidget, QHBoxLayout, QPushButton, QSlider, QLabel, QComboBox
+from PyQt5.QtCore import Qt
+from utils.profiler import profiled
+
+SPEEDS = ["1x", "2x", "5x", "10x", "50x", "100x", "500x", "1000x"]
+
+class ReplayBar(QWidget):
+    """Play/pause, speed and seek controls for a ReplaySource"""
+
+    def __init__(self, replay_source):
+        super().__init__()
+        self.source = replay_source
+        self.dragging = False
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(10, 5, 10, 5)
+
+        self.play_btn = QPushButton("PAUSE")
+        self.play_btn.setObjectName("playButton")
+        self.play_btn.clicked.connect(self.toggle_pause)
+
+        self.speed_box = QComboBox()
+        self.speed_box.addItems(SPEEDS)
+        self.speed_box.setCurrentText(f"{self.source.speed:g}x")
+        self.speed_box.currentTextChanged.connect(
+            lambda text: self.source.set_speed(float(text.rstrip("x"))))
+
+        self.slider = QSlider(Qt.Horizontal)
+        self.slider.setRange(0, 0)
+        self.slider.sliderPressed.connect(self._drag_started)
+        self.slider.sliderReleased.connect(self._drag_finished)
+
+        self.position_label = QLabel("Indexing log...")
+
+        layout.addWidget(self.play_btn)
+        layout.addWidget(self.speed_box)
+        layout.addWidget(self.slider, 1)
+        layout.addWidget(self.position_label)
+
+        self.source.position_changed.connect(self.update_position)
+        self.source.finished_replay.connect(lambda: self.position_label.setText(
+            self.position_label.text() + " (end)"))
+
+    def toggle_pause(self):
+        paused = not self.source.paused
+        self.source.set_paused(paused)
+        self.play_btn.setText("PLAY" if paused else "PAUSE")
+
+    @profiled
+    def update_position(self, frame, total):
+        self.slider.setMaximum(max(0, total - 1))
+        if not self.dragging:
+            self.slider.setValue(frame)
+        self.position_label.setText(f"{frame + 1} / {total} frames")
+
+    def _drag_started(self):
+        self.dragging = True
+
+    def _drag_finished(self):
+        self.dragging = False
+        self.source.seek(self.slider.value())
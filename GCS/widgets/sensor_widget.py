@@ -1,19 +1,11 @@
 from PyQt5.QtWidgets import QGroupBox, QGridLayout, QWidget
 from PyQt5.QtGui import QPainter, QColor
 from PyQt5.QtCore import Qt,QSize
+from utils.profiler import profiled
 
 class SensorWidget(QGroupBox):
     def __init__(self):
         super().__init__("Sensor Health")
-        self.setStyleSheet("""
-            QGroupBox {
-                border: 1px solid #252526;
-                margin-top: 15px;
-            }
-            QLabel {
-                font: bold 12px;
-            }
-        """)
         self.sensors = {
             'Accelerometer': 1,
             'Gyroscope': 1,
@@ -34,16 +26,8 @@ class SensorWidget(QGroupBox):
             layout.addWidget(indicator, i//2, i%2)
             
         self.setLayout(layout)
-        self.setStyleSheet("""
-            QGroupBox {
-                font: bold 14px;
-                color: #1E90FF;
-                border: 2px solid #1E90FF;
-                border-radius: 5px;
-                margin-top: 10px;
-            }
-        """)
 
+    @profiled
     def update_status(self, sensor_health):
         for name, status in sensor_health.items():
             if name in self.indicators:
@@ -1,22 +1,50 @@
 import sys
+import argparse
+# First, so the startup timeline includes the imports below
+from utils.startup import StartupTimer
 from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout, QMainWindow, 
-                            QSplitter,QPushButton, QTabWidget, QStyleFactory, QLabel, QFrame)
+                            QSplitter,QPushButton, QTabWidget, QStyleFactory, QLabel, QFrame,
+                            QDockWidget)
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont, QPalette, QColor, QIcon
-from widgets.live_view.chart_container import ChartContainer
-from widgets.live_view.metrics_panel import MetricsPanel
-from widgets.command_station.manual_control import ManualControl
-from widgets.command_station.profile_control import ProfileControl, ProfileWorker
 from utils.data_simulator import DataSimulator
-from widgets.data_logging import DataLogging
-from widgets.command_station.replay_control import ReplayControl
+from utils.styles import LightTheme
+from widgets.lazy_tab import LazyTab
+from utils.profiler import profiled, install_overlay, PROFILER
+from utils.watchdog import StallWatchdog
+from widgets.stall_log import StallLogWidget
 
 class ThrustStandApp(QMainWindow):
-    def __init__(self):
+    def __init__(self, serial_port=None, baud=None, trace=None, seed=None, profile=False):
         super().__init__()
-        self.data_simulator = DataSimulator()
+        self.startup = StartupTimer(self)
+        self.startup.mark("imports")
+        # The rig's serial link and trace playback have the same interface as the simulator.
+        # Both pull in numpy, so they are only imported when used.
+        if serial_port:
+            from utils.serial_link import SerialDataSource, DEFAULT_BAUD
+            self.data_simulator = SerialDataSource(serial_port, baud or DEFAULT_BAUD)
+        elif trace:
+            from utils.golden_trace import TracePlayer
+            self.data_simulator = TracePlayer(trace)
+        else:
+            self.data_simulator = DataSimulator(seed)
+        self.profile = profile
+        # Built on demand (see init_ui)
+        self.chart_container = None
+        self.metrics_panel = None
+        self.manual_control = None
+        self.profile_control = None
+        self.replay_control = None
+        self.data_logging = None
         self.set_application_style()
         self.init_ui()
+        # F12 toggles the slot profiler overlay
+        install_overlay(self, show=profile)
+        self.create_stall_dock()
+        self.startup.mark("window built")
+        # The charts (pyqtgraph) are the slowest part; build them once the window is up
+        self.startup.first_paint.connect(self.build_live_view)
         # self.data_simulator.start(100)
         # self.data_simulator.data_updated.connect(self.handle_data)
 
@@ -52,6 +80,8 @@ class ThrustStandApp(QMainWindow):
         
         # Apply the palette
         QApplication.setPalette(palette)
+        # One stylesheet for the whole app, parsed once (see utils/styles.py)
+        QApplication.instance().setStyleSheet(LightTheme.STYLESHEET)
 
     def init_ui(self):
         self.setWindowTitle("Sarla Aviation - Thrust Stand Controller")
@@ -66,20 +96,14 @@ class ThrustStandApp(QMainWindow):
         # Create a header with title
         header = QFrame()
         header.setFrameShape(QFrame.StyledPanel)
-        header.setStyleSheet("""
-            QFrame {
-                background-color: #0984e3;
-                border-radius: 8px;
-                border: none;
-            }
-        """)
+        header.setObjectName("header")
         header_layout = QVBoxLayout(header)
         header_layout.setContentsMargins(15, 10, 15, 10)
         
         title_label = QLabel("THRUST STAND CONTROLLER")
         title_label.setFont(QFont("Segoe UI", 16, QFont.Bold))
         title_label.setAlignment(Qt.AlignCenter)
-        title_label.setStyleSheet("color: white; letter-spacing: 1px;font-size: 18px;")
+        title_label.setObjectName("titleLabel")
         header_layout.addWidget(title_label)
         
         # Main content area
@@ -90,122 +114,37 @@ class ThrustStandApp(QMainWindow):
         
         main_splitter = QSplitter(Qt.Horizontal)
         main_splitter.setHandleWidth(1)
-        main_splitter.setStyleSheet("""
-            QSplitter::handle {
-                background-color: #dfe6e9;
-            }
-        """)
+        main_splitter.setObjectName("mainSplitter")
         
         # Left Panel - Charts and Metrics
         left_panel = QFrame()
         left_panel.setFrameShape(QFrame.StyledPanel)
-        left_panel.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border-radius: 8px;
-                border: 1px solid #dfe6e9;
-            }
-        """)
+        left_panel.setObjectName("leftPanel")
         left_layout = QVBoxLayout(left_panel)
         left_layout.setContentsMargins(15, 15, 15, 15)
         left_layout.setSpacing(15)
         
-        # Chart container with shadow effect
-        self.chart_container = ChartContainer(self.data_simulator)
-        self.chart_container.setStyleSheet("""
-            background-color: white;
-            border-radius: 8px;
-            border: 1px solid #dfe6e9;
-            
-            /* Fix for capture graph button */
-            QPushButton[objectName="captureGraphBtn"] {
-                background-color: #00b894;
-                color: #000000;
-                font-weight: bold;
-                font-size: 11pt;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            
-            QPushButton[objectName="captureGraphBtn"]:hover {
-                background-color: #00a885;
-            }
-            
-            QPushButton[objectName="captureGraphBtn"]:pressed {
-                background-color: #009876;
-            }
-        """)
-        
-        # Connect the chart visibility toggle signals
-        # This ensures the chart only displays selected data series
-        if hasattr(self.chart_container, 'series_visibility_changed'):
-            self.chart_container.series_visibility_changed.connect(self.update_chart_visibility)
-        
-        # Metrics panel with shadow effect
-        self.metrics_panel = MetricsPanel()
-        self.metrics_panel.setStyleSheet("""
-            background-color: white;
-            border-radius: 8px;
-            border: 1px solid #dfe6e9;
-        """)
-        
-        left_layout.addWidget(self.chart_container, 70)
-        left_layout.addWidget(self.metrics_panel, 30)
+        self.live_view_placeholder = QLabel("Loading live view...")
+        self.live_view_placeholder.setAlignment(Qt.AlignCenter)
+        self.live_view_placeholder.setObjectName("liveViewPlaceholder")
+        left_layout.addWidget(self.live_view_placeholder)
+        self.left_layout = left_layout
         
         # Right Panel - Controls
         right_panel = QFrame()
         right_panel.setFrameShape(QFrame.StyledPanel)
-        right_panel.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border-radius: 8px;
-                border: 1px solid #dfe6e9;
-            }
-        """)
+        right_panel.setObjectName("rightPanel")
         right_layout = QVBoxLayout(right_panel)
         right_layout.setContentsMargins(15, 15, 15, 15)
         
-        self.manual_control = ManualControl(self.data_simulator)
-        self.profile_control = ProfileControl(self.handle_profile_data)
-        self.replay_control = ReplayControl(self.data_simulator)
-        self.data_logging = DataLogging(self.data_simulator)
-        
-        # Modern tab widget styling with improved visibility for tab names
         right_tabs = QTabWidget()
-        right_tabs.setStyleSheet("""
-            QTabWidget::pane { 
-                border: none;
-                background-color: white; 
-                border-radius: 8px; 
-            }
-            QTabBar::tab { 
-                background-color: #f1f2f6; 
-                color: #2d3436; 
-                padding: 10px 20px; 
-                margin-right: 4px; 
-                border-top-left-radius: 6px; 
-                border-top-right-radius: 6px; 
-                font-weight: 500;
-                border: 1px solid #dfe6e9;
-                border-bottom: none;
-                min-width: 120px; /* Ensure tabs have enough width */
-                max-width: 200px; /* Limit maximum width */
-            }
-            QTabBar::tab:selected { 
-                background-color: #0984e3; 
-                color: white; 
-                border: 1px solid #0984e3;
-                border-bottom: none;
-            }
-            QTabBar::tab:hover:!selected { 
-                background-color: #dfe6e9; 
-            }
-        """)
+        right_tabs.setObjectName("controlTabs")
         
-        right_tabs.addTab(self.manual_control, "Manual Control")
-        right_tabs.addTab(self.profile_control, "Profile Control")
-        right_tabs.addTab(self.replay_control, "Replay Data")
-        right_tabs.addTab(self.data_logging, "Data Logging")
+        # Each tab is built the first time it is shown
+        right_tabs.addTab(LazyTab(self.build_manual_control), "Manual Control")
+        right_tabs.addTab(LazyTab(self.build_profile_control), "Profile Control")
+        right_tabs.addTab(LazyTab(self.build_replay_control), "Replay Data")
+        right_tabs.addTab(LazyTab(self.build_data_logging), "Data Logging")
         
         right_layout.addWidget(right_tabs)
         
@@ -219,116 +158,115 @@ class ThrustStandApp(QMainWindow):
         main_layout.addWidget(header, 1)
         main_layout.addWidget(content, 9)
         
-        # Set global widget styles
-        qss = """
-            QWidget {
-                font-family: 'Segoe UI', 'Arial', sans-serif;
-                font-size: 10pt;
-            }
-            QPushButton {
-                background-color: #0984e3;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #0878d4;
-            }
-            QPushButton:pressed {
-                background-color: #076ebf;
-            }
-            QPushButton:disabled {
-                background-color: #b2bec3;
-                color: #636e72;
-            }
-            QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox {
-                padding: 6px;
-                border: 1px solid #dfe6e9;
-                border-radius: 4px;
-                background-color: white;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            QSlider::groove:horizontal {
-                height: 8px;
-                background: #dfe6e9;
-                border-radius: 4px;
-            }
-            QSlider::handle:horizontal {
-                background: #0984e3;
-                width: 16px;
-                margin: -4px 0;
-                border-radius: 8px;
-            }
-            QSlider::sub-page:horizontal {
-                background: #74b9ff;
-                border-radius: 4px;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #dfe6e9;
-                border-radius: 6px;
-                margin-top: 12px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-            /* Style for data series selection checkboxes */
-            QCheckBox {
-                spacing: 8px;
-                font-weight: 500;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-                border-radius: 3px;
-                border: 1px solid #dfe6e9;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #0984e3;
-                border: 1px solid #0984e3;
-                image: url(check.png);
-            }
-            QCheckBox::indicator:unchecked {
-                background-color: white;
-            }
-        """
-        self.setStyleSheet(qss)
-        
         # After setting up the UI, find and explicitly style the capture graph button
         # self.find_and_style_capture_button()
         
         self.setCentralWidget(main_widget)
+        # self.data_simulator.data_updated.connect(self.handle_data)
+
+    def build_live_view(self):
+        """Charts and metrics, built after the first paint"""
+        from widgets.live_view.chart_container import ChartContainer
+        from widgets.live_view.metrics_panel import MetricsPanel
+        self.startup.mark("live view imports")
+
+        self.chart_container = ChartContainer(self.data_simulator)
+        
+        # Connect the chart visibility toggle signals
+        # This ensures the chart only displays selected data series
+        if hasattr(self.chart_container, 'series_visibility_changed'):
+            self.chart_container.series_visibility_changed.connect(self.update_chart_visibility)
+        
+        self.metrics_panel = MetricsPanel()
+        
+        self.left_layout.removeWidget(self.live_view_placeholder)
+        self.live_view_placeholder.deleteLater()
+        self.left_layout.addWidget(self.chart_container, 70)
+        self.left_layout.addWidget(self.metrics_panel, 30)
         self.metrics_panel.connect_to_simulator(self.data_simulator)
+        # Start the data only now, so no sample arrives before the charts exist
         self.data_simulator.start(100)
-        # self.data_simulator.data_updated.connect(self.handle_data)
+        self.startup.mark("live view built")
+        self.startup.finish()
+
+    def build_manual_control(self):
+        from widgets.command_station.manual_control import ManualControl
+        self.manual_control = ManualControl(self.data_simulator)
+        return self.manual_control
 
+    def build_profile_control(self):
+        from widgets.command_station.profile_control import ProfileControl
+        self.profile_control = ProfileControl(self.handle_profile_data)
+        return self.profile_control
+
+    def build_replay_control(self):
+        from widgets.command_station.replay_control import ReplayControl
+        self.replay_control = ReplayControl(self.data_simulator)
+        return self.replay_control
+
+    def build_data_logging(self):
+        from widgets.data_logging import DataLogging
+        self.data_logging = DataLogging(self.data_simulator)
+        return self.data_logging
+
+    def create_stall_dock(self):
+        """Dock listing UI stalls; it appears the first time one is caught"""
+        self.stall_log = StallLogWidget()
+        self.stall_dock = QDockWidget("UI Stalls", self)
+        self.stall_dock.setWidget(self.stall_log)
+        self.addDockWidget(Qt.BottomDockWidgetArea, self.stall_dock)
+        self.stall_dock.hide()
+        self.watchdog = StallWatchdog(self.heartbeat, parent=self)
+        self.watchdog.stall_detected.connect(self.handle_stall)
+        # Armed once startup is over, so building the window is not reported as a stall
+        self.startup.finished.connect(self.watchdog.start)
+
+    def handle_stall(self, stall):
+        self.stall_log.add_stall(stall)
+        self.stall_dock.show()
+
+    @profiled
     def handle_data(self, data):
         # Update visualization components
         self.chart_container.update_charts(data)
         self.metrics_panel.update_metrics(data)
         
         # Handle data logging
-        if self.data_logging.logging_active:
+        if self.data_logging is not None and self.data_logging.logging_active:
             self.data_logging.log_data(data)
 
+    @profiled
     def handle_profile_data(self, rpm):
         self.data_simulator.set_rpm(rpm)
         
     def update_chart_visibility(self, series_name, visible):
         # Update the chart to show only selected series
-        if hasattr(self.chart_container, 'set_series_visibility'):
+        if self.chart_container is not None and hasattr(self.chart_container, 'set_series_visibility'):
             self.chart_container.set_series_visibility(series_name, visible)
 
+    def closeEvent(self, event):
+        # Stops the serial reader thread before Qt tears it down
+        self.watchdog.stop()
+        self.data_simulator.stop()
+        # Let chart exports still being written finish
+        if self.chart_container is not None:
+            self.chart_container.wait_for_exports()
+        if self.profile:
+            PROFILER.dump()
+        event.accept()
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Thrust Stand Command Station")
+    parser.add_argument("--serial", metavar="PORT",
+                        help="read the rig over a serial port (e.g. /dev/ttyUSB0) instead of simulating")
+    parser.add_argument("--baud", type=int, help="serial baud rate (default 921600)")
+    parser.add_argument("--trace", metavar="FILE", help="play a golden trace instead of simulating")
+    parser.add_argument("--seed", type=int, help="seed the simulator for repeatable runs")
+    parser.add_argument("--profile", action="store_true",
+                        help="show the slot profiler overlay (F12) and dump a profile on exit")
+    args, _ = parser.parse_known_args()
     app = QApplication(sys.argv)
-    window = ThrustStandApp()
+    window = ThrustStandApp(serial_port=args.serial, baud=args.baud, trace=args.trace,
+                            seed=args.seed, profile=args.profile)
     window.show()
     sys.exit(app.exec_())
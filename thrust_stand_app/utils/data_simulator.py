@@ -1,12 +1,15 @@
 from PyQt5.QtCore import QObject, QTimer, pyqtSignal
 import random
 import math
+from utils.profiler import profiled
 
 class DataSimulator(QObject):
+    """Simulated thrust stand; a fixed ``seed`` makes runs repeatable"""
     data_updated = pyqtSignal(dict)
     
-    def __init__(self):
+    def __init__(self, seed=None):
         super().__init__()
+        self.rng = random.Random(seed)
         self.timer = QTimer()
         self.base_rpm = 0
         self._running = False
@@ -33,25 +36,26 @@ class DataSimulator(QObject):
         self.temp = 25.0
         self.voltage = 24.0
 
+    @profiled
     def generate_data(self):
         # Calculate RPM with realistic fluctuation (smaller at lower RPMs)
         rpm_fluctuation = max(10, int(self.base_rpm * 0.02))
-        actual_rpm = max(0, self.base_rpm + random.randint(-rpm_fluctuation, rpm_fluctuation))
+        actual_rpm = max(0, self.base_rpm + self.rng.randint(-rpm_fluctuation, rpm_fluctuation))
         
         # Calculate current based on RPM (quadratic relationship)
         # Higher RPM = higher current draw
         rpm_ratio = actual_rpm / self.max_rpm
         base_current = 0.5 + (rpm_ratio ** 2) * 15  # 0.5A at idle, up to ~15.5A at max
-        current = base_current + random.uniform(-0.2, 0.2)  # Small fluctuation
+        current = base_current + self.rng.uniform(-0.2, 0.2)  # Small fluctuation
         
         # Calculate torque based on RPM and current
         # Torque is roughly proportional to current
         torque_factor = 0.3  # Nm per amp
-        torque = current * torque_factor * (1 + random.uniform(-0.05, 0.05))
+        torque = current * torque_factor * (1 + self.rng.uniform(-0.05, 0.05))
         
         # Update voltage (drops under load)
         self.voltage = max(18.0, 24.0 - (actual_rpm * self.voltage_drop_factor))
-        voltage = self.voltage + random.uniform(-0.1, 0.1)  # Small fluctuation
+        voltage = self.voltage + self.rng.uniform(-0.1, 0.1)  # Small fluctuation
         
         # Update temperature (rises with current draw, slowly)
         if self._running:
@@ -61,7 +65,7 @@ class DataSimulator(QObject):
             # Temperature falls when not running
             self.temp = max(25.0, self.temp - 0.1)
             
-        temp = self.temp + random.uniform(-0.2, 0.2)  # Small fluctuation
+        temp = self.temp + self.rng.uniform(-0.2, 0.2)  # Small fluctuation
         
         data = {
             'rpm': int(actual_rpm),
@@ -0,0 +1,155 @@
+"""Golden thrust stand traces: recorded rig frames for repeatable runs.
+
+A trace is a 64-byte header followed by frames in the rig's serial
+format (``utils.serial_link``, 31 bytes each), recorded from a seeded
+DataSimulator stepping through a fixed RPM profile. The header stores
+the sample interval, the seed and a SHA-256 of the frame bytes.
+
+A trace can be played straight into the GUI (``TracePlayer`` has the
+DataSimulator interface) or served byte for byte over a pty by the rig
+emulator, so it also goes through the serial pipeline::
+
+    python -m utils.golden_trace record golden.tstrace --seed 1
+    python main.py --trace golden.tstrace
+    python -m utils.serial_link emulate --trace golden.tstrace
+"""
+import sys
+import struct
+import hashlib
+import argparse
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from utils.serial_link import FRAME_SIZE, FrameParser, encode_frame, sample_to_dict
+
+MAGIC = b"TSTRACE\x00"
+VERSION = 1
+# magic, version, frame size, interval, seed (-1 = unseeded), frames, SHA-256 of frames
+HEADER = struct.Struct("<8sHHdqI32s")
+DEFAULT_PROFILE = (0, 3000, 6000, 9000, 12000, 6000, 0)
+
+class TraceError(ValueError):
+    pass
+
+def simulate_trace(profile=DEFAULT_PROFILE, hold=100, interval=0.1, seed=0):
+    """Rig frame bytes of a seeded DataSimulator run over an RPM profile"""
+    from utils.data_simulator import DataSimulator
+
+    simulator = DataSimulator(seed)
+    simulator._running = True
+    data = bytearray()
+    seq = 0
+    for rpm in profile:
+        simulator.set_rpm(rpm)
+        for _ in range(hold):
+            simulator.generate_data()
+            d = simulator.last_data
+            data += encode_frame(seq, int(round(seq * interval * 1e6)), d['rpm'], d['current'],
+                                 d['torque'], d['temp'], d['voltage'])
+            seq += 1
+    return data
+
+def record_trace(path, profile=DEFAULT_PROFILE, hold=100, interval=0.1, seed=0):
+    """Simulate a run over ``profile`` (``hold`` samples per RPM) and save it"""
+    data = simulate_trace(profile, hold, interval, seed)
+    digest = hashlib.sha256(data).digest()
+    frames = len(data) // FRAME_SIZE
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, FRAME_SIZE, interval,
+                            -1 if seed is None else seed, frames, digest))
+        f.write(data)
+    return {'frames': frames, 'interval': interval, 'seed': seed, 'digest': digest.hex()}
+
+def load_trace(path, verify=True):
+    """Return ``(info, frame_bytes)``; raise TraceError if the file is bad"""
+    with open(path, 'rb') as f:
+        header = f.read(HEADER.size)
+        if len(header) != HEADER.size:
+            raise TraceError(f"{path}: truncated header")
+        magic, version, frame_size, interval, seed, frames, digest = HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION or frame_size != FRAME_SIZE:
+            raise TraceError(f"{path}: not a version {VERSION} thrust stand trace")
+        data = f.read()
+    if len(data) != frames * FRAME_SIZE:
+        raise TraceError(f"{path}: expected {frames} frames, found {len(data) / FRAME_SIZE:g}")
+    if verify and hashlib.sha256(data).digest() != digest:
+        raise TraceError(f"{path}: frame data does not match the recorded digest")
+    info = {'frames': frames, 'interval': interval, 'seed': None if seed < 0 else seed,
+            'digest': digest.hex()}
+    return info, data
+
+def read_trace(path):
+    """All samples of a trace as DataSimulator dicts"""
+    _, data = load_trace(path)
+    parser = FrameParser(buffer_size=max(len(data), FRAME_SIZE))
+    parser.feed(data)
+    return [sample_to_dict(sample) for sample in parser.parse()]
+
+class TracePlayer(QObject):
+    """Plays a trace with the DataSimulator interface.
+
+    One sample is emitted per timer tick, in order, and the trace stops
+    at its end. ``set_rpm`` is ignored: the RPM profile is part of the
+    recording.
+    """
+    data_updated = pyqtSignal(dict)
+    finished_playback = pyqtSignal()
+
+    def __init__(self, path):
+        super().__init__()
+        self.info, _ = load_trace(path)
+        self.samples = read_trace(path)
+        self.position = 0
+        self.last_data = {}
+        self.timer = QTimer()
+        self.timer.timeout.connect(self.generate_data)
+
+    def start(self, interval=100):
+        self.timer.start(interval)
+
+    def stop(self):
+        self.timer.stop()
+
+    def set_rpm(self, value):
+        pass
+
+    def generate_data(self):
+        if self.position >= len(self.samples):
+            self.timer.stop()
+            self.finished_playback.emit()
+            return
+        # Slots add derived keys to the dict, so each emit gets its own copy
+        data = dict(self.samples[self.position])
+        self.position += 1
+        self.last_data = data
+        self.data_updated.emit(data)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Record and check golden thrust stand traces")
+    sub = parser.add_subparsers(dest="command", required=True)
+    record_parser = sub.add_parser("record", help="record a seeded simulator run")
+    record_parser.add_argument("path")
+    record_parser.add_argument("--profile", type=lambda text: [float(v) for v in text.split(",")],
+                               default=DEFAULT_PROFILE, help="comma-separated RPM steps")
+    record_parser.add_argument("--hold", type=int, default=100, help="samples per RPM step")
+    record_parser.add_argument("--interval", type=float, default=0.1, help="seconds per sample")
+    record_parser.add_argument("--seed", type=int, default=0)
+    verify_parser = sub.add_parser("verify", help="check a trace's digest")
+    verify_parser.add_argument("path")
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        info = record_trace(args.path, args.profile, args.hold, args.interval, args.seed)
+        print(f"[Trace] {info['frames']} frames written to {args.path} (sha256 {info['digest'][:16]})")
+        return 0
+
+    try:
+        info, data = load_trace(args.path)
+    except TraceError as e:
+        print(f"[Trace] {e}")
+        return 1
+    samples = read_trace(args.path)
+    print(f"[Trace] {info['frames']} frames, interval {info['interval']}s, seed {info['seed']}, "
+          f"{len(samples)} decoded")
+    return 0 if len(samples) == info['frames'] else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
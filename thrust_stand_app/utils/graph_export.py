@@ -0,0 +1,136 @@
+"""Chart export without stalling live plotting.
+
+Only the grab runs on the GUI thread: ``grab_plots`` renders the current
+frame of each plot into a QImage at ``scale`` times its on-screen size
+(pyqtgraph redraws at that resolution, so lines and text stay sharp).
+That takes a few milliseconds per plot, well inside one sample interval.
+``GraphExportThread`` then composites, encodes and writes the file:
+
+- ``.png`` (or any raster format): one image laid out like the screen
+- ``.pdf``: one page per plot
+- ``.svg``: one document laid out like the screen, each plot embedded as
+  an image
+"""
+import os
+import time
+from xml.sax.saxutils import escape
+from PyQt5.QtCore import (Qt, QThread, QPoint, QRect, QSize, QMarginsF, QByteArray,
+                          QBuffer, QIODevice, pyqtSignal)
+from PyQt5.QtGui import QImage, QPainter, QPageSize, QPdfWriter
+from PyQt5.QtWidgets import QWidget
+
+EXPORT_FORMATS = ["PNG", "PDF", "SVG"]
+
+def export_scale(widget, minimum=2):
+    """Pixels per on-screen pixel: at least ``minimum``, more on high-DPI screens"""
+    return max(minimum, widget.devicePixelRatioF())
+
+def grab_plots(plots, page, scale):
+    """Render ``plots`` (title, widget) into images, placed as on ``page``.
+
+    Returns ``(frames, size)``: ``frames`` is a list of
+    ``(title, QImage, QRect)`` with the rects in export pixels, ``size``
+    the size of the whole page in export pixels.
+    """
+    frames = []
+    for title, widget in plots:
+        image = QImage(widget.size() * scale, QImage.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(scale)
+        image.fill(Qt.white)
+        # QWidget.render: PlotWidget overrides render() with QGraphicsView's
+        QWidget.render(widget, image)
+        # The worker places images in export pixels
+        image.setDevicePixelRatio(1)
+        origin = widget.mapTo(page, QPoint(0, 0)) * scale
+        frames.append((title, image, QRect(origin, image.size())))
+    bounds = QRect()
+    for _, _, rect in frames:
+        bounds = bounds.united(rect)
+    # Crop to the plots themselves (drops the page margins)
+    frames = [(title, image, rect.translated(-bounds.topLeft())) for title, image, rect in frames]
+    return frames, bounds.size()
+
+class GraphExportThread(QThread):
+    """Composites grabbed plot frames and writes them to ``path``"""
+    export_finished = pyqtSignal(str, int)  # path, milliseconds
+    export_failed = pyqtSignal(str, str)    # path, error
+
+    def __init__(self, frames, size, path, scale=1):
+        super().__init__()
+        self.frames = frames
+        self.size = size
+        self.path = path
+        self.scale = scale
+
+    def run(self):
+        started = time.perf_counter()
+        try:
+            ext = os.path.splitext(self.path)[1].lower()
+            if ext == ".pdf":
+                self.write_pdf()
+            elif ext == ".svg":
+                self.write_svg()
+            else:
+                self.write_image()
+        except Exception as e:
+            self.export_failed.emit(self.path, str(e))
+            return
+        self.export_finished.emit(self.path, int((time.perf_counter() - started) * 1000))
+
+    def composite(self, painter):
+        for _, image, rect in self.frames:
+            painter.drawImage(rect, image)
+
+    def write_image(self):
+        canvas = QImage(self.size, QImage.Format_RGB32)
+        canvas.fill(Qt.white)
+        painter = QPainter(canvas)
+        self.composite(painter)
+        painter.end()
+        if not canvas.save(self.path):
+            raise IOError(f"could not write {self.path}")
+
+    def write_pdf(self):
+        writer = QPdfWriter(self.path)
+        # Keep the plots' physical size: 96 on-screen pixels per inch
+        writer.setResolution(int(round(96 * self.scale)))
+        writer.setPageMargins(QMarginsF(0, 0, 0, 0))
+        painter = None
+        for index, (title, image, _) in enumerate(self.frames):
+            points = QSize(round(image.width() * 72 / writer.resolution()),
+                           round(image.height() * 72 / writer.resolution()))
+            writer.setPageSize(QPageSize(points, title, QPageSize.ExactMatch))
+            if index == 0:
+                writer.setTitle(", ".join(title for title, _, _ in self.frames))
+                painter = QPainter(writer)
+            else:
+                writer.newPage()
+            painter.drawImage(QRect(0, 0, writer.width(), writer.height()), image)
+        if painter is not None:
+            painter.end()
+
+    def write_svg(self):
+        # Written by hand: painting into a QSvgGenerator, even from this
+        # thread, holds up the GUI event loop for the whole encode
+        width, height = self.size.width(), self.size.height()
+        title = ", ".join(title for title, _, _ in self.frames)
+        lines = [
+            '<?xml version="1.0" encoding="UTF-8"?>',
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{width / self.scale:g}" '
+            f'height="{height / self.scale:g}" viewBox="0 0 {width} {height}">',
+            f'<title>{escape(title)}</title>',
+            f'<rect width="{width}" height="{height}" fill="white"/>',
+        ]
+        for _, image, rect in self.frames:
+            data = QByteArray()
+            buffer = QBuffer(data)
+            buffer.open(QIODevice.WriteOnly)
+            if not image.save(buffer, "PNG"):
+                raise IOError(f"could not encode {self.path}")
+            lines.append(
+                f'<image x="{rect.x()}" y="{rect.y()}" width="{rect.width()}" '
+                f'height="{rect.height()}" '
+                f'href="data:image/png;base64,{bytes(data.toBase64()).decode("ascii")}"/>')
+        lines.append('</svg>')
+        with open(self.path, "w") as f:
+            f.write("\n".join(lines) + "\n")
@@ -0,0 +1,344 @@
+"""Serial telemetry link for the thrust stand rig.
+
+The rig streams fixed-size, length-prefixed frames at up to 2 kHz::
+
+    A5 5A | len (u8) | seq (u16) | time_us (u32) | rpm, current, torque,
+    temp, voltage (5 x f32) | CRC-16/CCITT over len..voltage (u16)
+
+all little-endian, 31 bytes per frame. The reader thread reads straight
+into a preallocated ``bytearray``, views whole runs of in-sync frames as
+a NumPy structured array and checks their CRCs column-wise, so a batch
+is decoded without touching individual bytes in Python. After line noise
+it resyncs on the next ``A5 5A`` marker.
+
+``SerialDataSource`` has the same interface as DataSimulator
+(``data_updated(dict)``, ``start``, ``stop``, ``set_rpm``). The port is
+opened with termios, so any POSIX tty works, including a pty; try it
+with the built-in rig emulator::
+
+    python -m utils.serial_link emulate          # prints /dev/pts/N
+    python main.py --serial /dev/pts/N
+"""
+import os
+import sys
+import time
+import select
+import struct
+import termios
+import tty
+import argparse
+import numpy as np
+from PyQt5.QtCore import QThread, pyqtSignal
+
+SYNC = b"\xa5\x5a"
+SYNC_WORD = 0x5AA5
+DEFAULT_BAUD = 921600
+
+FRAME_DTYPE = np.dtype([
+    ('sync', '<u2'), ('length', 'u1'), ('seq', '<u2'), ('time_us', '<u4'),
+    ('rpm', '<f4'), ('current', '<f4'), ('torque', '<f4'), ('temp', '<f4'),
+    ('voltage', '<f4'), ('crc', '<u2'),
+])
+FRAME_SIZE = FRAME_DTYPE.itemsize
+PAYLOAD_SIZE = FRAME_SIZE - 5  # everything between the length byte and the CRC
+CHANNELS = ('rpm', 'current', 'torque', 'temp', 'voltage')
+
+# Host -> rig: set target RPM
+COMMAND = struct.Struct("<2sBBf")  # sync, length, command id, value
+SET_RPM = 0x01
+
+def _crc_table():
+    table = np.zeros(256, dtype=np.uint32)
+    for byte in range(256):
+        crc = byte << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x1021) if crc & 0x8000 else crc << 1
+        table[byte] = crc & 0xFFFF
+    return table
+
+CRC_TABLE = _crc_table()
+_CRC_LIST = CRC_TABLE.tolist()
+
+def crc16(data):
+    """CRC-16/CCITT-FALSE of a bytes-like object"""
+    crc = 0xFFFF
+    for byte in data:
+        crc = ((crc << 8) & 0xFFFF) ^ _CRC_LIST[(crc >> 8) ^ byte]
+    return crc
+
+def crc16_rows(rows):
+    """CRC-16/CCITT-FALSE of every row of a 2-D uint8 array at once"""
+    crc = np.full(len(rows), 0xFFFF, dtype=np.uint32)
+    for column in rows.T:
+        crc = ((crc << 8) & 0xFFFF) ^ CRC_TABLE[(crc >> 8) ^ column]
+    return crc
+
+def encode_frame(seq, time_us, rpm, current, torque, temp, voltage):
+    """Build one rig frame (used by the emulator and for testing)"""
+    body = struct.pack("<BHIfffff", PAYLOAD_SIZE, seq & 0xFFFF, time_us & 0xFFFFFFFF,
+                       rpm, current, torque, temp, voltage)
+    return SYNC + body + struct.pack("<H", crc16(body))
+
+def encode_command(command, value):
+    body = COMMAND.pack(SYNC, 5, command, value)
+    return body + struct.pack("<H", crc16(body[2:]))
+
+def open_port(path, baud=DEFAULT_BAUD):
+    """Open a tty in raw mode and return its file descriptor"""
+    fd = os.open(path, os.O_RDWR | os.O_NOCTTY)
+    tty.setraw(fd)
+    attrs = termios.tcgetattr(fd)
+    speed = getattr(termios, f"B{baud}", None)
+    if speed is not None:
+        attrs[4] = attrs[5] = speed
+        termios.tcsetattr(fd, termios.TCSANOW, attrs)
+    return fd
+
+def sample_to_dict(sample):
+    """One decoded frame as the dict DataSimulator emits"""
+    return {
+        'rpm': int(sample['rpm']),
+        'current': round(float(sample['current']), 2),
+        'torque': round(float(sample['torque']), 2),
+        'temp': round(float(sample['temp']), 1),
+        'voltage': round(float(sample['voltage']), 2),
+    }
+
+class FrameParser:
+    """Reassembles frames from a byte stream into NumPy batches"""
+
+    def __init__(self, buffer_size=1 << 16):
+        self.buffer = bytearray(buffer_size)
+        self.view = memoryview(self.buffer)
+        self.fill = 0
+        self.last_seq = None
+
+        self.frames = 0
+        self.crc_errors = 0
+        self.skipped_bytes = 0
+        self.lost = 0
+
+    def read_from(self, fd):
+        """Read whatever is available from ``fd`` into the free space"""
+        if self.fill == len(self.buffer):
+            # Nothing parseable in a full buffer: drop it and resync
+            self.skipped_bytes += self.fill
+            self.fill = 0
+        count = os.readv(fd, [self.view[self.fill:]])
+        self.fill += count
+        return count
+
+    def feed(self, data):
+        """Append bytes (for callers that are not reading a file descriptor)"""
+        data = memoryview(data)
+        while len(data):
+            if self.fill == len(self.buffer):
+                self.skipped_bytes += self.fill
+                self.fill = 0
+            count = min(len(data), len(self.buffer) - self.fill)
+            self.view[self.fill:self.fill + count] = data[:count]
+            self.fill += count
+            data = data[count:]
+
+    def parse(self):
+        """Return a structured array of all complete, valid frames buffered"""
+        batches = []
+        pos = 0
+        while self.fill - pos >= FRAME_SIZE:
+            count = (self.fill - pos) // FRAME_SIZE
+            frames = np.frombuffer(self.buffer, dtype=FRAME_DTYPE, count=count, offset=pos)
+            in_sync = (frames['sync'] == SYNC_WORD) & (frames['length'] == PAYLOAD_SIZE)
+            good = count if in_sync.all() else int(np.argmin(in_sync))
+            if good:
+                batches.append(self._check(pos, good))
+                pos += good * FRAME_SIZE
+            if good < count:
+                # Lost sync: skip to the next marker
+                found = self.buffer.find(SYNC, pos + 1, self.fill)
+                if found < 0:
+                    found = self.fill - 1  # the last byte may start a marker
+                self.skipped_bytes += found - pos
+                pos = found
+            del frames
+
+        # Keep the incomplete tail at the start of the buffer
+        if pos:
+            remaining = self.fill - pos
+            self.buffer[:remaining] = self.buffer[pos:self.fill]
+            self.fill = remaining
+
+        if not batches:
+            return np.empty(0, dtype=FRAME_DTYPE)
+        batch = batches[0] if len(batches) == 1 else np.concatenate(batches)
+        self._count_lost(batch['seq'])
+        self.frames += len(batch)
+        return batch
+
+    def _check(self, pos, count):
+        raw = np.frombuffer(self.buffer, dtype=np.uint8, count=count * FRAME_SIZE, offset=pos)
+        rows = raw.reshape(count, FRAME_SIZE)
+        frames = rows.view(FRAME_DTYPE).reshape(count)
+        valid = crc16_rows(rows[:, 2:FRAME_SIZE - 2]) == frames['crc']
+        self.crc_errors += count - int(valid.sum())
+        # Copy out: the buffer is compacted after parsing
+        return frames[valid].copy()
+
+    def _count_lost(self, seq):
+        if not len(seq):
+            return
+        seq = seq.astype(np.int64)
+        if self.last_seq is not None:
+            seq = np.concatenate(([self.last_seq], seq))
+        gaps = (np.diff(seq) - 1) % 0x10000
+        self.lost += int(gaps.sum())
+        self.last_seq = int(seq[-1])
+
+    def stats(self):
+        return {
+            'frames': self.frames,
+            'crc_errors': self.crc_errors,
+            'skipped_bytes': self.skipped_bytes,
+            'lost': self.lost,
+        }
+
+class SerialDataSource(QThread):
+    """Drop-in replacement for DataSimulator backed by the rig's serial link.
+
+    ``data_updated(dict)`` carries the newest sample at most once per
+    ``start(interval)`` milliseconds, like the simulator. Every decoded
+    sample is also published as a NumPy batch on ``batch_ready`` for
+    consumers that need the full 2 kHz stream.
+    """
+    data_updated = pyqtSignal(dict)
+    batch_ready = pyqtSignal(object)
+
+    def __init__(self, port, baud=DEFAULT_BAUD):
+        super().__init__()
+        self.port = port
+        self.baud = baud
+        self.interval = 0.1
+        self.running = False
+        self.fd = None
+        self.parser = FrameParser()
+        self.last_data = {}
+
+    def start(self, interval=100):
+        self.interval = interval / 1000.0
+        self.fd = open_port(self.port, self.baud)
+        self.running = True
+        print(f"[Serial] Reading rig telemetry from {self.port}")
+        super().start()
+
+    def stop(self):
+        self.running = False
+        self.wait()
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+        print(f"[Serial] Link closed: {self.parser.stats()}")
+
+    def set_rpm(self, value):
+        if self.fd is not None:
+            os.write(self.fd, encode_command(SET_RPM, float(value)))
+
+    def run(self):
+        last_emit = 0.0
+        while self.running:
+            ready, _, _ = select.select([self.fd], [], [], 0.05)
+            if not ready:
+                continue
+            try:
+                if not self.parser.read_from(self.fd):
+                    continue
+            except OSError as e:
+                # EIO when the other end of a pty goes away
+                print(f"[Serial] Read failed: {e}")
+                break
+            batch = self.parser.parse()
+            if not len(batch):
+                continue
+            self.batch_ready.emit(batch)
+            now = time.monotonic()
+            if now - last_emit >= self.interval:
+                last_emit = now
+                self._emit(batch[-1])
+
+    def _emit(self, sample):
+        data = sample_to_dict(sample)
+        self.last_data = data
+        self.data_updated.emit(data)
+
+def emulate(rate=2000, noise=0.0, seed=None, trace=None):
+    """Serve simulated rig frames on a new pty until interrupted.
+
+    ``noise`` is the fraction of frames that get a corrupted byte, to
+    exercise CRC checks and resync. With ``trace`` the frames of a golden
+    trace are served byte for byte (in a loop) instead of simulated ones.
+    """
+    from utils.data_simulator import DataSimulator
+
+    master, slave = os.openpty()
+    tty.setraw(master)
+    print(f"[Serial] Rig emulator on {os.ttyname(slave)} at {rate} frames/s")
+    sim = DataSimulator(seed)
+    sim._running = True
+    sim.set_rpm(3000)
+    if trace:
+        from utils.golden_trace import load_trace
+        _, trace_frames = load_trace(trace)
+        trace_count = len(trace_frames) // FRAME_SIZE
+    seq = 0
+    start = time.monotonic()
+    pending = bytearray()
+    try:
+        while True:
+            if trace:
+                index = (seq % trace_count) * FRAME_SIZE
+                frame = bytearray(trace_frames[index:index + FRAME_SIZE])
+            else:
+                sim.generate_data()
+                d = sim.last_data
+                frame = bytearray(encode_frame(seq, int((time.monotonic() - start) * 1e6), d['rpm'],
+                                               d['current'], d['torque'], d['temp'], d['voltage']))
+            if noise and np.random.random() < noise:
+                frame[np.random.randint(len(frame))] ^= 0xFF
+            pending += frame
+            seq += 1
+
+            # Write in small bursts, like a USB serial adapter
+            if len(pending) >= 8 * FRAME_SIZE:
+                os.write(master, pending)
+                pending.clear()
+            readable, _, _ = select.select([master], [], [], 0)
+            if readable:
+                command = os.read(master, 64)
+                end = COMMAND.size
+                if (len(command) >= end + 2 and command[:2] == SYNC and command[3] == SET_RPM
+                        and crc16(command[2:end]) == struct.unpack_from("<H", command, end)[0]):
+                    sim.set_rpm(COMMAND.unpack_from(command)[3])
+
+            due = start + seq / rate
+            now = time.monotonic()
+            if due > now:
+                time.sleep(due - now)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        os.close(master)
+        os.close(slave)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Thrust stand serial link tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+    emulate_parser = sub.add_parser("emulate", help="serve simulated rig frames on a pty")
+    emulate_parser.add_argument("--rate", type=float, default=2000.0)
+    emulate_parser.add_argument("--noise", type=float, default=0.0,
+                                help="fraction of frames with a corrupted byte")
+    emulate_parser.add_argument("--seed", type=int, help="make the simulated frames repeatable")
+    emulate_parser.add_argument("--trace", help="serve a golden trace instead of simulating")
+    args = parser.parse_args(argv)
+    if args.command == "emulate":
+        emulate(args.rate, args.noise, args.seed, args.trace)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+"""SQLite catalog of thrust stand log files (log_*.csv).
+
+Directories are scanned incrementally: a log is only read again when its
+mtime or size changed. Rows, duration and per-channel min/max/mean are
+extracted once and cached, so the Saved Runs browser opens instantly and
+can filter with queries such as ``max temp > 80``.
+"""
+import os
+import re
+import time
+import json
+import sqlite3
+import threading
+from PyQt5.QtCore import QThread, pyqtSignal
+
+# Next to the app, not the working directory; paths inside are absolute
+DEFAULT_CATALOG_PATH = os.path.join(os.path.dirname(__file__), "..", "session_catalog.db")
+LOG_PATTERN = re.compile(r"^log_.*\.csv$")
+
+SESSION_FIELDS = {"rows", "duration", "size"}
+STAT_FIELDS = {"min", "max", "mean"}
+CLAUSE = re.compile(r"^(\w+)\s+(?:(\S+)\s+)?(>=|<=|!=|>|<|=)\s*(-?[\d.]+)$")
+
+def extract_session(path, chunksize=100000):
+    """Read a log once and return its row count, duration and channel stats"""
+    # pandas takes ~250 ms to import; only the scanner thread ever needs it
+    import pandas as pd
+
+    rows = 0
+    channels = []
+    stats = {}
+    first_time = last_time = None
+    for chunk in pd.read_csv(path, chunksize=chunksize):
+        rows += len(chunk)
+        channels += [c for c in chunk.columns if c not in channels]
+        if "timestamp" in chunk and len(chunk):
+            times = pd.to_datetime(chunk["timestamp"], errors="coerce").dropna()
+            if len(times):
+                first_time = times.iloc[0] if first_time is None else first_time
+                last_time = times.iloc[-1]
+        numeric = chunk.select_dtypes(include="number").astype(float)
+        for name, low, high, total, count in zip(
+                numeric.columns, numeric.min(), numeric.max(), numeric.sum(), numeric.count()):
+            if count == 0:
+                continue
+            if name in stats:
+                old = stats[name]
+                stats[name] = [min(old[0], low), max(old[1], high), old[2] + total, old[3] + count]
+            else:
+                stats[name] = [low, high, total, count]
+
+    duration = (last_time - first_time).total_seconds() if first_time is not None else 0.0
+    return {
+        "rows": rows,
+        "duration": duration,
+        "channels": channels,
+        "stats": {name: (float(low), float(high), float(total / count))
+                  for name, (low, high, total, count) in stats.items()},
+    }
+
+def parse_query(text):
+    """Turn "max temp > 80 and duration > 60" into filter clauses.
+
+    Clauses are ``<min|max|mean> <channel> <op> <number>``,
+    ``<rows|duration|size> <op> <number>``, or free text matched against
+    the run name.
+    """
+    clauses = []
+    for part in re.split(r"\s+and\s+", text.strip(), flags=re.IGNORECASE):
+        part = part.strip()
+        if not part:
+            continue
+        match = CLAUSE.match(part)
+        if match:
+            field, channel, op, value = match.groups()
+            field = field.lower()
+            if channel and field in STAT_FIELDS:
+                clauses.append((field, channel, op, float(value)))
+                continue
+            if not channel and field in SESSION_FIELDS:
+                clauses.append((field, None, op, float(value)))
+                continue
+        clauses.append(("name", part, None, None))
+    return clauses
+
+class SessionCatalog:
+    """Run metadata and channel stats cached in SQLite"""
+
+    def __init__(self, path=DEFAULT_CATALOG_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS sessions (
+                id INTEGER PRIMARY KEY, path TEXT UNIQUE, name TEXT,
+                mtime REAL, size INTEGER, rows INTEGER, duration REAL,
+                channels TEXT, scanned REAL
+            );
+            CREATE TABLE IF NOT EXISTS channel_stats (
+                session_id INTEGER, channel TEXT,
+                min REAL, max REAL, mean REAL,
+                PRIMARY KEY (session_id, channel)
+            );
+            CREATE INDEX IF NOT EXISTS channel_stats_max ON channel_stats (channel, max);
+            CREATE INDEX IF NOT EXISTS sessions_mtime ON sessions (mtime);
+        """)
+        self.conn.commit()
+
+    def scan(self, directories):
+        """Bring the catalog up to date; return (added/updated, removed)"""
+        found = {}
+        for directory in directories:
+            if not os.path.isdir(directory):
+                continue
+            for entry in os.scandir(directory):
+                if entry.is_file() and LOG_PATTERN.match(entry.name):
+                    info = entry.stat()
+                    found[os.path.abspath(entry.path)] = (info.st_mtime, info.st_size)
+
+        roots = [os.path.abspath(d) for d in directories]
+        with self.lock:
+            known = {path: (mtime, size) for path, mtime, size in self.conn.execute(
+                "SELECT path, mtime, size FROM sessions")}
+        changed = [path for path, signature in found.items() if known.get(path) != signature]
+        removed = [path for path in known if path not in found
+                   and os.path.dirname(path) in roots]
+
+        for path in changed:
+            try:
+                summary = extract_session(path)
+            except Exception as e:
+                print(f"[Catalog] Skipping {path}: {e}")
+                continue
+            self._store(path, found[path], summary)
+
+        with self.lock:
+            for path in removed:
+                self._delete(path)
+            self.conn.commit()
+        return len(changed), len(removed)
+
+    def _store(self, path, signature, summary):
+        name = os.path.basename(path)[:-len(".csv")]
+        mtime, size = signature
+        with self.lock:
+            self._delete(path)
+            cursor = self.conn.execute(
+                "INSERT INTO sessions (path, name, mtime, size, rows, duration, channels, scanned)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (path, name, mtime, size, summary["rows"], summary["duration"],
+                 json.dumps(summary["channels"]), time.time()))
+            self.conn.executemany(
+                "INSERT INTO channel_stats VALUES (?, ?, ?, ?, ?)",
+                [(cursor.lastrowid, channel) + values for channel, values in summary["stats"].items()])
+            self.conn.commit()
+
+    def _delete(self, path):
+        row = self.conn.execute("SELECT id FROM sessions WHERE path=?", (path,)).fetchone()
+        if row:
+            self.conn.execute("DELETE FROM channel_stats WHERE session_id=?", row)
+            self.conn.execute("DELETE FROM sessions WHERE id=?", row)
+
+    def query(self, where="", limit=None):
+        """Return matching runs, newest first, as dicts"""
+        conditions = []
+        params = []
+        for field, channel, op, value in parse_query(where):
+            if field == "name":
+                conditions.append("s.name LIKE ?")
+                params.append(f"%{channel}%")
+            elif channel is None:
+                conditions.append(f"s.{field} {op} ?")
+                params.append(value)
+            else:
+                conditions.append(
+                    "EXISTS (SELECT 1 FROM channel_stats c WHERE c.session_id = s.id"
+                    f" AND c.channel LIKE ? AND c.{field} {op} ?)")
+                params += [f"%{channel}%", value]
+
+        sql = "SELECT s.path, s.name, s.mtime, s.size, s.rows, s.duration FROM sessions s"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY s.mtime DESC"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        keys = ("path", "name", "mtime", "size", "rows", "duration")
+        with self.lock:
+            return [dict(zip(keys, row)) for row in self.conn.execute(sql, params)]
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+class CatalogScanner(QThread):
+    """Runs SessionCatalog.scan off the GUI thread"""
+    scan_finished = pyqtSignal(int, int)  # updated, removed
+
+    def __init__(self, catalog, directories):
+        super().__init__()
+        self.catalog = catalog
+        self.directories = directories
+
+    def run(self):
+        changed, removed = self.catalog.scan(self.directories)
+        self.scan_finished.emit(changed, removed)
@@ -0,0 +1,402 @@
+"""Application-wide light theme.
+
+``LightTheme.STYLESHEET`` holds every rule of the app and is applied once
+to the QApplication (``ThrustStandApp.set_application_style``). Widgets
+pick their rules by class, object name or a dynamic property instead of
+carrying their own stylesheets; state changes go through ``set_variant``.
+"""
+
+class LightTheme:
+    STYLESHEET = """
+    QWidget {
+        font-family: 'Segoe UI', 'Arial', sans-serif;
+        font-size: 10pt;
+    }
+    QPushButton {
+        background-color: #0984e3;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #0878d4;
+    }
+    QPushButton:pressed {
+        background-color: #076ebf;
+    }
+    QPushButton:disabled {
+        background-color: #b2bec3;
+        color: #636e72;
+    }
+    QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox {
+        padding: 6px;
+        border: 1px solid #dfe6e9;
+        border-radius: 4px;
+        background-color: white;
+    }
+    QComboBox::drop-down {
+        border: none;
+        width: 20px;
+    }
+    QSlider::groove:horizontal {
+        height: 8px;
+        background: #dfe6e9;
+        border-radius: 4px;
+    }
+    QSlider::handle:horizontal {
+        background: #0984e3;
+        width: 16px;
+        margin: -4px 0;
+        border-radius: 8px;
+    }
+    QSlider::sub-page:horizontal {
+        background: #74b9ff;
+        border-radius: 4px;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 1px solid #dfe6e9;
+        border-radius: 6px;
+        margin-top: 12px;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+    /* Style for data series selection checkboxes */
+    QCheckBox {
+        spacing: 8px;
+        font-weight: 500;
+    }
+    QCheckBox::indicator {
+        width: 18px;
+        height: 18px;
+        border-radius: 3px;
+        border: 1px solid #dfe6e9;
+    }
+    QCheckBox::indicator:checked {
+        background-color: #0984e3;
+        border: 1px solid #0984e3;
+        image: url(check.png);
+    }
+    QCheckBox::indicator:unchecked {
+        background-color: white;
+    }
+
+    /* Colored buttons: setProperty("variant", ...) */
+    QPushButton[variant="success"] { background-color: #4CAF50; color: white; font-weight: bold; }
+    QPushButton[variant="danger"] { background-color: #f44336; color: white; font-weight: bold; }
+    QPushButton[variant="primary"] { background-color: #2196F3; color: white; font-weight: bold; }
+    QPushButton[variant="warning"] { background-color: #FF9800; color: white; font-weight: bold; }
+    QPushButton[variant="accent"] { background-color: #9C27B0; color: white; font-weight: bold; }
+
+    /* Window layout */
+    QFrame#header, #header QFrame {
+        background-color: #0984e3;
+        border-radius: 8px;
+        border: none;
+    }
+    QLabel#titleLabel {
+        color: white;
+        letter-spacing: 1px;
+        font-size: 18px;
+    }
+    QSplitter#mainSplitter::handle {
+        background-color: #dfe6e9;
+    }
+    QFrame#leftPanel, #leftPanel *, QFrame#rightPanel, #rightPanel QFrame {
+        background-color: white;
+        border-radius: 8px;
+        border: 1px solid #dfe6e9;
+    }
+    QLabel#liveViewPlaceholder {
+        color: #636e72;
+        font-size: 12pt;
+        border: none;
+    }
+    QTabWidget#controlTabs::pane {
+        border: none;
+        background-color: white;
+        border-radius: 8px;
+    }
+    QTabWidget#controlTabs QTabBar::tab {
+        background-color: #f1f2f6;
+        color: #2d3436;
+        padding: 10px 20px;
+        margin-right: 4px;
+        border-top-left-radius: 6px;
+        border-top-right-radius: 6px;
+        font-weight: 500;
+        border: 1px solid #dfe6e9;
+        border-bottom: none;
+        min-width: 120px; /* Ensure tabs have enough width */
+        max-width: 200px; /* Limit maximum width */
+    }
+    QTabWidget#controlTabs QTabBar::tab:selected {
+        background-color: #0984e3;
+        color: white;
+        border: 1px solid #0984e3;
+        border-bottom: none;
+    }
+    QTabWidget#controlTabs QTabBar::tab:hover:!selected {
+        background-color: #dfe6e9;
+    }
+
+    /* Shared by the control tabs */
+    QListWidget#presetList, QListWidget#runList {
+        border: 1px solid #ccc;
+        border-radius: 4px;
+        padding: 5px;
+        background-color: #f9f9f9;
+    }
+    QListWidget#presetList::item, QListWidget#runList::item {
+        padding: 5px;
+        border-bottom: 1px solid #eee;
+    }
+    QListWidget#presetList::item:selected, QListWidget#runList::item:selected {
+        background-color: #e3f2fd;
+        color: #1565c0;
+    }
+    QFrame#statusFrame, QFrame#statusFrame * {
+        background-color: #f5f5f5;
+        border-radius: 5px;
+        padding: 10px;
+    }
+    QFrame#statusFrame QLabel#statusLabel {
+        font-weight: bold;
+        color: #333;
+    }
+    ProfileControl QGroupBox, ReplayControl QGroupBox, DataLogging QGroupBox {
+        font-weight: bold;
+        border: 1px solid #cccccc;
+        border-radius: 5px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+    ProfileControl QGroupBox::title, ReplayControl QGroupBox::title, DataLogging QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+
+    /* Manual Control */
+    ManualControl QLineEdit {
+        font-size: 14px;
+        padding: 5px;
+    }
+    QFrame#rpmContainer, QFrame#rpmContainer * {
+        background-color: #f9f9f9;
+        border-radius: 8px;
+        padding: 6px;
+    }
+    QFrame#rpmContainer QLabel {
+        font-weight: bold;
+    }
+    QFrame#rpmContainer QProgressBar {
+        border-radius: 8px;
+        text-align: center;
+        font-weight: bold;
+        height: 30px;
+        font-size: 14px;
+    }
+    QFrame#rpmContainer QProgressBar::chunk {
+        background-color: #4caf50;
+        border-radius: 8px;
+    }
+    QFrame#rpmContainer QProgressBar[level="warning"]::chunk { background-color: #ff9800; }
+    QFrame#rpmContainer QProgressBar[level="critical"]::chunk { background-color: #f44336; }
+
+    /* Profile Control */
+    ProfileControl QLineEdit, ProfileControl QComboBox {
+        padding: 5px;
+        border: 1px solid #aaaaaa;
+        border-radius: 3px;
+    }
+    ProfileControl QComboBox {
+        font-size: 14px;
+    }
+    ProfileControl QLabel {
+        font-weight: bold;
+    }
+    QLabel#paramTitle {
+        font-size: 14px;
+        font-weight: bold;
+        color: #333;
+    }
+    QFrame#stepRow, QFrame#stepRow * {
+        background-color: #f5f5f5;
+        border-radius: 5px;
+    }
+    QFrame#stepRow QPushButton#removeStepButton {
+        color: white;
+        font-weight: bold;
+        background-color: #f44336;
+        border-radius: 15px;
+    }
+
+    /* Replay Control */
+    ReplayControl QPushButton {
+        padding: 8px;
+    }
+    QPushButton#playButton, QPushButton#pauseButton, QPushButton#stepButton {
+        min-width: 80px;
+        padding: 10px;
+    }
+    QLabel#fileLabel {
+        font-style: italic;
+        padding: 5px;
+        background-color: #f5f5f5;
+        border: 1px solid #ddd;
+        border-radius: 3px;
+    }
+    ReplayControl QLineEdit {
+        padding: 5px;
+        border: 1px solid #ccc;
+        border-radius: 4px;
+    }
+    QLabel#runsLabel {
+        color: #666;
+        font-size: 11px;
+    }
+    QLabel#speedLabel {
+        font-weight: bold;
+        margin-top: 10px;
+    }
+    ReplayControl QSlider::groove:horizontal {
+        height: 8px;
+        background: #ddd;
+        border-radius: 4px;
+    }
+    ReplayControl QSlider::handle:horizontal {
+        background: #2196F3;
+        border: 1px solid #1565c0;
+        width: 18px;
+        margin: -5px 0;
+        border-radius: 9px;
+    }
+    ReplayControl QSlider::sub-page:horizontal {
+        background: #bbdefb;
+        border-radius: 4px;
+    }
+
+    /* Data Logging */
+    DataLogging QGroupBox {
+        padding-top: 15px;
+    }
+    QGroupBox#motorParams {
+        background-color: #e8f5e9;
+        border: 1px solid #a5d6a7;
+    }
+    QGroupBox#motorParams::title {
+        color: #2e7d32;
+    }
+    QGroupBox#electricalParams {
+        background-color: #e3f2fd;
+        border: 1px solid #90caf9;
+    }
+    QGroupBox#electricalParams::title {
+        color: #1565c0;
+    }
+    QCheckBox#selectAll {
+        font-weight: bold;
+        font-size: 12px;
+    }
+    QGroupBox#motorParams QCheckBox, QGroupBox#electricalParams QCheckBox {
+        spacing: 10px;
+        font-size: 12px;
+    }
+    QGroupBox#motorParams QCheckBox::indicator:unchecked, QGroupBox#electricalParams QCheckBox::indicator:unchecked {
+        border: 2px solid #bbbbbb;
+        border-radius: 3px;
+        background-color: white;
+    }
+    QGroupBox#motorParams QCheckBox::indicator:checked, QGroupBox#electricalParams QCheckBox::indicator:checked {
+        border: 2px solid #4CAF50;
+        border-radius: 3px;
+        background-color: #4CAF50;
+    }
+    DataLogging QFrame#statusFrame QLabel {
+        font-size: 12px;
+    }
+    DataLogging QFrame#statusFrame QLabel#statusLabel {
+        font-size: 14px;
+    }
+    DataLogging QFrame#statusFrame QLabel#statusLabel[logging="true"] {
+        color: #4CAF50;
+    }
+    QPushButton#loggingButton {
+        background-color: #4CAF50;
+        color: white;
+        font-weight: bold;
+        border-radius: 5px;
+    }
+    QPushButton#loggingButton:hover {
+        background-color: #45a049;
+    }
+    QPushButton#loggingButton:pressed {
+        background-color: #388e3c;
+    }
+    QPushButton#loggingButton[logging="true"] {
+        background-color: #f44336;
+    }
+    QPushButton#loggingButton[logging="true"]:hover {
+        background-color: #e53935;
+    }
+    QPushButton#loggingButton[logging="true"]:pressed {
+        background-color: #d32f2f;
+    }
+
+    /* Live view */
+    ChartContainer QPushButton#captureButton {
+        background-color: #00b894;
+        color: #ffffff;
+        font-weight: bold;
+        font-size: 11pt;
+        padding: 8px 16px;
+        border-radius: 4px;
+    }
+
+    /* Stall log dock */
+    StallLogWidget {
+        font-family: 'DejaVu Sans Mono', monospace;
+        font-size: 9pt;
+        border: 1px solid #dfe6e9;
+        background-color: white;
+    }
+
+    /* Profiler overlay (F12) */
+    ProfilerOverlay {
+        background-color: rgba(20, 20, 20, 215);
+        border: 1px solid #007ACC;
+        border-radius: 4px;
+    }
+    ProfilerOverlay QLabel {
+        color: #E0E0E0;
+        font: 11px "DejaVu Sans Mono", monospace;
+        background: transparent;
+        border: none;
+    }
+    ProfilerOverlay QPushButton {
+        color: white;
+        background-color: #007ACC;
+        border: none;
+        padding: 3px 10px;
+        font: bold 11px;
+    }
+    """
+
+def set_variant(widget, name, value):
+    """Switch a style variant (a dynamic property the theme selects on).
+
+    The widget is only re-polished when the value actually changes.
+    """
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
@@ -0,0 +1,91 @@
+"""Event-loop stall watchdog.
+
+A background thread watches the profiler heartbeat (``utils.profiler``).
+When the main thread has not serviced it for ``threshold_ms``, the
+watchdog captures the main thread's Python stack with
+``sys._current_frames()`` right away, while the stall is still in
+progress. When the heartbeat resumes, the stall is complete: it goes into
+``PROFILER.stalls`` (a ring buffer, included in profile dumps) and is
+emitted on ``stall_detected`` with its duration, the slot that was
+running and the captured stack.
+
+Mirrored copy of ``GCS/utils/watchdog.py``, which is the source: change
+that file and copy it here rather than editing this one.
+"""
+import sys
+import time
+import threading
+import traceback
+from datetime import datetime
+from PyQt5.QtCore import QObject, pyqtSignal
+from utils.profiler import PROFILER
+
+class StallWatchdog(QObject):
+    """Reports main-thread stalls longer than ``threshold_ms``"""
+    stall_detected = pyqtSignal(dict)
+
+    def __init__(self, heartbeat, threshold_ms=500, poll_ms=50, parent=None):
+        super().__init__(parent)
+        self.heartbeat = heartbeat
+        self.threshold = threshold_ms / 1000
+        self.poll = poll_ms / 1000
+        self.main_thread = threading.main_thread().ident
+        self.stopping = threading.Event()
+        self.thread = None
+
+    def start(self):
+        if self.thread is not None:
+            return
+        self.thread = threading.Thread(target=self._watch, name="StallWatchdog", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stopping.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def _watch(self):
+        stall = None
+        while not self.stopping.wait(self.poll):
+            last_beat = self.heartbeat.last_beat
+            due = last_beat + self.heartbeat.interval
+            if stall is None:
+                if time.monotonic() - due >= self.threshold:
+                    stall = self._capture(due)
+            elif last_beat > stall['last_beat']:
+                # The main thread is back: the stall ended at this beat
+                self._finish(stall, last_beat)
+                stall = None
+
+    def _capture(self, due):
+        frame = sys._current_frames().get(self.main_thread)
+        stack = traceback.format_stack(frame) if frame is not None else []
+        slots = list(PROFILER.active)
+        if slots:
+            slot = slots[-1]
+        elif frame is not None:
+            slot = getattr(frame.f_code, 'co_qualname', frame.f_code.co_name)
+        else:
+            slot = None
+        return {
+            'started': datetime.now().timestamp() - (time.monotonic() - due),
+            'due': due,
+            'last_beat': self.heartbeat.last_beat,
+            'slot': slot,
+            'slots': slots,
+            'stack': stack,
+        }
+
+    def _finish(self, stall, resumed):
+        event = {
+            'time': datetime.fromtimestamp(stall['started']).isoformat(timespec='milliseconds'),
+            'duration_ms': round((resumed - stall['due']) * 1000, 1),
+            'slot': stall['slot'],
+            'slots': stall['slots'],
+            'stack': stall['stack'],
+        }
+        PROFILER.stalls.append(event)
+        print(f"[Watchdog] UI stalled {event['duration_ms']:.0f} ms in {event['slot']}\n"
+              + "".join(event['stack'][-6:]), end="")
+        self.stall_detected.emit(event)
@@ -1,6 +1,8 @@
 from PyQt5.QtWidgets import QWidget, QListWidgetItem, QVBoxLayout, QSlider, QLineEdit, QProgressBar, QPushButton, QListWidget, QLabel, QHBoxLayout, QGroupBox, QFrame
 from PyQt5.QtCore import Qt
 import json
+from utils.profiler import profiled
+from utils.styles import set_variant
 
 class ManualControl(QWidget):
     def __init__(self, data_simulator):
@@ -11,27 +13,13 @@ class ManualControl(QWidget):
         self.load_presets()
         
     def style_progress_bar(self, value=0):
-        # Determine color based on RPM value
+        # Chunk color follows the RPM (see utils/styles.py)
         if value < 3000:
-            chunk_color = "#4caf50"  # green
+            set_variant(self.rpm_progress, "level", "ok")
         elif value < 7000:
-            chunk_color = "#ff9800"  # orange
+            set_variant(self.rpm_progress, "level", "warning")
         else:
-            chunk_color = "#f44336"  # red
-            
-        self.rpm_progress.setStyleSheet(f"""
-            QProgressBar {{
-                border-radius: 8px;
-                text-align: center;
-                font-weight: bold;
-                height: 30px;
-                font-size: 14px;
-            }}
-            QProgressBar::chunk {{
-                background-color: {chunk_color};
-                border-radius: 8px;
-            }}
-        """)
+            set_variant(self.rpm_progress, "level", "critical")
         
     def apply_preset(self, item):
         rpm = int(item.text().split('(')[1].split('RPM')[0].strip())
@@ -79,22 +67,7 @@ class ManualControl(QWidget):
         
         self.preset_list = QListWidget()
         self.preset_list.setFixedHeight(150)
-        self.preset_list.setStyleSheet("""
-            QListWidget {
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                padding: 5px;
-                background-color: #f9f9f9;
-            }
-            QListWidget::item {
-                padding: 5px;
-                border-bottom: 1px solid #eee;
-            }
-            QListWidget::item:selected {
-                background-color: #e3f2fd;
-                color: #1565c0;
-            }
-        """)
+        self.preset_list.setObjectName("presetList")
         
         preset_layout.addWidget(self.preset_list)
         preset_group.setLayout(preset_layout)
@@ -105,15 +78,15 @@ class ManualControl(QWidget):
         
         self.start_btn = QPushButton("Start")
         self.start_btn.setMinimumHeight(40)
-        self.start_btn.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold;")
+        self.start_btn.setProperty("variant", "success")
         
         self.reset_btn = QPushButton("Reset")
         self.reset_btn.setMinimumHeight(40)
-        self.reset_btn.setStyleSheet("background-color: #f44336; color: white; font-weight: bold;")
+        self.reset_btn.setProperty("variant", "danger")
         
         self.save_btn = QPushButton("Save Preset")
         self.save_btn.setMinimumHeight(40)
-        self.save_btn.setStyleSheet("background-color: #2196F3; color: white; font-weight: bold;")
+        self.save_btn.setProperty("variant", "primary")
         
         btn_layout.addWidget(self.start_btn)
         btn_layout.addWidget(self.reset_btn)
@@ -140,19 +113,17 @@ class ManualControl(QWidget):
         rpm_input_layout = QHBoxLayout()
         rpm_input_layout.addWidget(QLabel("RPM:"))
         self.rpm_input = QLineEdit()
-        self.rpm_input.setStyleSheet("font-size: 14px; padding: 5px;")
         rpm_input_layout.addWidget(self.rpm_input)
         
         # RPM Progress Bar in a styled container
         progress_container = QFrame()
         progress_container.setFrameShape(QFrame.StyledPanel)
-        progress_container.setStyleSheet("background-color: #f9f9f9; border-radius: 8px; padding: 6px;")
+        progress_container.setObjectName("rpmContainer")
         
         progress_layout = QHBoxLayout(progress_container)
         
         rpm_label = QLabel("RPM")
         rpm_label.setFixedWidth(60)
-        rpm_label.setStyleSheet("font-weight: bold;")
         
         self.rpm_progress = QProgressBar()
         self.rpm_progress.setMaximum(10000)
@@ -195,6 +166,7 @@ class ManualControl(QWidget):
         self.reset_btn.clicked.connect(lambda: self.rpm_slider.setValue(0))
         self.start_btn.clicked.connect(lambda: self.data_simulator.set_rpm(self.rpm_slider.value()))
 
+    @profiled
     def update_rpm(self, value):
         self.data_simulator.set_rpm(value)
         self.rpm_input.setText(str(value))
@@ -31,8 +31,6 @@ class ProfileControl(QWidget):
             "Ramp Function",
             "Chirp Signal"
         ])
-        self.profile_type.setStyleSheet("font-size: 14px; padding: 5px;")
-        
         profile_layout.addWidget(self.profile_type)
         profile_group.setLayout(profile_layout)
         
@@ -42,15 +40,15 @@ class ProfileControl(QWidget):
         
         self.apply_btn = QPushButton("Apply Profile")
         self.apply_btn.setMinimumHeight(40)
-        self.apply_btn.setStyleSheet("background-color: #2196F3; color: white; font-weight: bold;")
+        self.apply_btn.setProperty("variant", "primary")
         
         self.start_btn = QPushButton("Start")
         self.start_btn.setMinimumHeight(40)
-        self.start_btn.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold;")
+        self.start_btn.setProperty("variant", "success")
         
         self.stop_btn = QPushButton("Stop")
         self.stop_btn.setMinimumHeight(40)
-        self.stop_btn.setStyleSheet("background-color: #f44336; color: white; font-weight: bold;")
+        self.stop_btn.setProperty("variant", "danger")
         self.stop_btn.setEnabled(False)
         
         btn_layout.addWidget(self.apply_btn)
@@ -107,35 +105,6 @@ class ProfileControl(QWidget):
         
         # Initialize with default parameters
         self.update_parameters(self.profile_type.currentText())
-        
-        # Apply global stylesheet
-        self.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #cccccc;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-            QLineEdit {
-                padding: 5px;
-                border: 1px solid #aaaaaa;
-                border-radius: 3px;
-            }
-            QComboBox {
-                padding: 5px;
-                border: 1px solid #aaaaaa;
-                border-radius: 3px;
-            }
-            QLabel {
-                font-weight: bold;
-            }
-        """)
 
     def update_parameters(self, profile_type):
         # Clear existing parameters
@@ -144,7 +113,7 @@ class ProfileControl(QWidget):
             
         # Common parameters
         title_label = QLabel("Profile Parameters")
-        title_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #333;")
+        title_label.setObjectName("paramTitle")
         self.param_form.addRow(title_label)
         
         # Add a separator line
@@ -188,7 +157,7 @@ class ProfileControl(QWidget):
         self.step_widgets = []
         
         add_step_btn = QPushButton("+ Add Step")
-        add_step_btn.setStyleSheet("background-color: #4CAF50; color: white;")
+        add_step_btn.setProperty("variant", "success")
         add_step_btn.clicked.connect(self.add_step_row)
         
         self.param_form.addRow(QLabel("Steps:"))
@@ -226,7 +195,7 @@ class ProfileControl(QWidget):
     def add_step_row(self):
         step_frame = QFrame()
         step_frame.setFrameShape(QFrame.StyledPanel)
-        step_frame.setStyleSheet("background-color: #f5f5f5; border-radius: 5px;")
+        step_frame.setObjectName("stepRow")
         
         row = QHBoxLayout(step_frame)
         rpm_input = QLineEdit()
@@ -236,7 +205,7 @@ class ProfileControl(QWidget):
         duration_input.setPlaceholderText("Seconds")
         
         remove_btn = QPushButton("×")
-        remove_btn.setStyleSheet("color: white; font-weight: bold; background-color: #f44336; border-radius: 15px;")
+        remove_btn.setObjectName("removeStepButton")
         remove_btn.setFixedSize(30, 30)
         
         row.addWidget(QLabel("RPM:"))
@@ -1,19 +1,32 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                             QLabel, QFileDialog, QListWidget, QAbstractItemView,
-                            QSlider, QGroupBox, QFrame, QSplitter, QFileIconProvider)
+                            QSlider, QGroupBox, QFrame, QSplitter, QFileIconProvider,
+                            QLineEdit, QListWidgetItem)
 from PyQt5.QtCore import QTimer, Qt
 from PyQt5.QtGui import QIcon, QFont
+from utils.session_catalog import SessionCatalog, CatalogScanner
 import csv
 import os
+from utils.profiler import profiled
+
+RUN_LIMIT = 500  # Newest runs listed; narrow the filter to reach older ones
 
 class ReplayControl(QWidget):
-    def __init__(self, data_handler):
+    def __init__(self, data_handler, log_dirs=None):
         super().__init__()
         self.selected_file = None
         self.data_handler = data_handler
+        # DataLogging writes log_*.csv into the working directory
+        self.log_dirs = log_dirs or [os.getcwd()]
+        self.catalog = SessionCatalog()
+        self.scanner = None
         self.replay_data = []
         self.replay_index = 0
         self.replay_timer = QTimer(self)  # Define timer before using it
+        # Re-query once typing pauses instead of on every keystroke
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(250)
         self.init_ui()
 
     def init_ui(self):
@@ -30,10 +43,10 @@ class ReplayControl(QWidget):
         file_btn_layout = QHBoxLayout()
         self.file_btn = QPushButton("Choose File")
         self.file_btn.setIcon(QIcon.fromTheme("document-open"))
-        self.file_btn.setStyleSheet("background-color: #2196F3; color: white; font-weight: bold; padding: 8px;")
+        self.file_btn.setProperty("variant", "primary")
         
         self.file_label = QLabel("No file chosen")
-        self.file_label.setStyleSheet("font-style: italic; padding: 5px; background-color: #f5f5f5; border: 1px solid #ddd; border-radius: 3px;")
+        self.file_label.setObjectName("fileLabel")
         
         file_btn_layout.addWidget(self.file_btn)
         file_layout.addLayout(file_btn_layout)
@@ -45,30 +58,24 @@ class ReplayControl(QWidget):
         data_group = QGroupBox("Saved Runs")
         data_layout = QVBoxLayout()
         
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText('Filter runs, e.g. "max temp > 80"')
+        self.filter_edit.setClearButtonEnabled(True)
+
         self.data_list = QListWidget()
-        self.data_list.addItems(["Test Run 1", "Test Run 2", "Baseline Data"])
+        self.data_list.setUniformItemSizes(True)
         self.data_list.setSelectionMode(QAbstractItemView.SingleSelection)
-        self.data_list.setStyleSheet("""
-            QListWidget {
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                padding: 5px;
-                background-color: #f9f9f9;
-            }
-            QListWidget::item {
-                padding: 5px;
-                border-bottom: 1px solid #eee;
-            }
-            QListWidget::item:selected {
-                background-color: #e3f2fd;
-                color: #1565c0;
-            }
-        """)
+        self.data_list.setObjectName("runList")
         
         self.load_btn = QPushButton("Load Selected Run")
-        self.load_btn.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold; padding: 8px;")
+        self.load_btn.setProperty("variant", "success")
         
+        self.runs_label = QLabel("")
+        self.runs_label.setObjectName("runsLabel")
+
+        data_layout.addWidget(self.filter_edit)
         data_layout.addWidget(self.data_list)
+        data_layout.addWidget(self.runs_label)
         data_layout.addWidget(self.load_btn)
         
         data_group.setLayout(data_layout)
@@ -90,15 +97,18 @@ class ReplayControl(QWidget):
         
         self.play_button = QPushButton("Play")
         self.play_button.setIcon(QIcon.fromTheme("media-playback-start"))
-        self.play_button.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold; min-width: 80px; padding: 10px;")
+        self.play_button.setObjectName("playButton")
+        self.play_button.setProperty("variant", "success")
         
         self.pause_button = QPushButton("Pause")
         self.pause_button.setIcon(QIcon.fromTheme("media-playback-pause"))
-        self.pause_button.setStyleSheet("background-color: #FF9800; color: white; font-weight: bold; min-width: 80px; padding: 10px;")
+        self.pause_button.setObjectName("pauseButton")
+        self.pause_button.setProperty("variant", "warning")
         
         self.step_button = QPushButton("Step")
         self.step_button.setIcon(QIcon.fromTheme("media-skip-forward"))
-        self.step_button.setStyleSheet("background-color: #9C27B0; color: white; font-weight: bold; min-width: 80px; padding: 10px;")
+        self.step_button.setObjectName("stepButton")
+        self.step_button.setProperty("variant", "accent")
         
         buttons_layout.addWidget(self.play_button)
         buttons_layout.addWidget(self.pause_button)
@@ -109,30 +119,12 @@ class ReplayControl(QWidget):
         
         speed_label = QLabel("Playback Speed")
         speed_label.setAlignment(Qt.AlignCenter)
-        speed_label.setStyleSheet("font-weight: bold; margin-top: 10px;")
+        speed_label.setObjectName("speedLabel")
         
         self.speed_slider = QSlider(Qt.Horizontal)
         self.speed_slider.setMinimum(1)
         self.speed_slider.setMaximum(100)
         self.speed_slider.setValue(50)
-        self.speed_slider.setStyleSheet("""
-            QSlider::groove:horizontal {
-                height: 8px;
-                background: #ddd;
-                border-radius: 4px;
-            }
-            QSlider::handle:horizontal {
-                background: #2196F3;
-                border: 1px solid #1565c0;
-                width: 18px;
-                margin: -5px 0;
-                border-radius: 9px;
-            }
-            QSlider::sub-page:horizontal {
-                background: #bbdefb;
-                border-radius: 4px;
-            }
-        """)
         
         speed_value_layout = QHBoxLayout()
         speed_value_layout.addWidget(QLabel("Slow"))
@@ -146,13 +138,13 @@ class ReplayControl(QWidget):
         # Playback status
         status_frame = QFrame()
         status_frame.setFrameShape(QFrame.StyledPanel)
-        status_frame.setStyleSheet("background-color: #f5f5f5; border-radius: 5px; padding: 10px;")
+        status_frame.setObjectName("statusFrame")
         
         status_layout = QVBoxLayout(status_frame)
         
         self.status_label = QLabel("Ready to play")
         self.status_label.setAlignment(Qt.AlignCenter)
-        self.status_label.setStyleSheet("font-weight: bold; color: #333;")
+        self.status_label.setObjectName("statusLabel")
         
         self.progress_label = QLabel("0 / 0 frames")
         self.progress_label.setAlignment(Qt.AlignCenter)
@@ -187,36 +179,58 @@ class ReplayControl(QWidget):
         # Connect signals
         self.file_btn.clicked.connect(self.open_file_dialog)
         self.load_btn.clicked.connect(self.load_selected)
+        self.data_list.itemDoubleClicked.connect(lambda item: self.load_selected())
+        self.filter_edit.textChanged.connect(self.filter_timer.start)
+        self.filter_timer.timeout.connect(self.refresh_runs)
         self.replay_timer.timeout.connect(self.replay_next)
         self.play_button.clicked.connect(self.start_replay)
         self.pause_button.clicked.connect(self.pause_replay)
         self.step_button.clicked.connect(self.step_once)
         self.speed_slider.valueChanged.connect(self.change_speed)
-        
-        # Apply global stylesheet
-        self.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #cccccc;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
+
+        # Show what the catalog already knows, then pick up new logs in the background
+        self.refresh_runs()
+        self.scan_logs()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.scan_logs()
+
+    def scan_logs(self):
+        if self.scanner is not None and self.scanner.isRunning():
+            return
+        self.scanner = CatalogScanner(self.catalog, self.log_dirs)
+        self.scanner.scan_finished.connect(self._scan_finished)
+        self.scanner.start()
+
+    def _scan_finished(self, changed, removed):
+        if changed or removed:
+            self.refresh_runs()
+
+    def refresh_runs(self):
+        runs = self.catalog.query(self.filter_edit.text(), limit=RUN_LIMIT)
+        self.data_list.setUpdatesEnabled(False)
+        self.data_list.clear()
+        for run in runs:
+            minutes, seconds = divmod(int(run["duration"]), 60)
+            item = QListWidgetItem(f"{run['name']}  ({run['rows']} frames, {minutes}:{seconds:02d})")
+            item.setData(Qt.UserRole, run["path"])
+            self.data_list.addItem(item)
+        self.data_list.setUpdatesEnabled(True)
+        if len(runs) == RUN_LIMIT:
+            self.runs_label.setText(f"Newest {RUN_LIMIT} runs")
+        else:
+            self.runs_label.setText(f"{len(runs)} runs")
 
     def load_selected(self):
         if not self.data_list.currentItem():
             self.status_label.setText("No run selected")
             return
             
-        selected = self.data_list.currentItem().text()
+        path = self.data_list.currentItem().data(Qt.UserRole)
+        selected = os.path.basename(path)
         try:
-            with open(f"{selected}.csv") as f:
+            with open(path, newline='') as f:
                 reader = csv.DictReader(f)
                 self.replay_data = list(reader)
                 self.replay_index = 0
@@ -227,6 +241,7 @@ class ReplayControl(QWidget):
         except Exception as e:
             self.status_label.setText(f"Error loading file: {str(e)}")
 
+    @profiled
     def replay_next(self):
         if self.replay_index < len(self.replay_data):
             data = self.replay_data[self.replay_index]
@@ -7,6 +7,8 @@ from datetime import datetime
 import csv
 import shutil
 import os
+from utils.profiler import profiled
+from utils.styles import set_variant
 
 class DataLogging(QWidget):
     def __init__(self, data_simulator):
@@ -28,21 +30,6 @@ class DataLogging(QWidget):
         
         # Parameter Selection Group
         param_group = QGroupBox("Logging Parameters")
-        param_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #cccccc;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 15px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
-        
         param_scroll = QScrollArea()
         param_scroll.setWidgetResizable(True)
         param_scroll.setFrameShape(QFrame.NoFrame)
@@ -53,7 +40,7 @@ class DataLogging(QWidget):
         
         # Select All option
         select_all = QCheckBox("Select All Parameters")
-        select_all.setStyleSheet("font-weight: bold; font-size: 12px;")
+        select_all.setObjectName("selectAll")
         select_all.stateChanged.connect(self.toggle_select_all)
         param_layout.addWidget(select_all)
         
@@ -65,82 +52,25 @@ class DataLogging(QWidget):
         
         # Motor Parameters
         motor_group = QGroupBox("Motor Parameters")
-        motor_group.setStyleSheet("""
-            QGroupBox {
-                background-color: #e8f5e9;
-                border: 1px solid #a5d6a7;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 15px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-                color: #2e7d32;
-            }
-        """)
+        motor_group.setObjectName("motorParams")
         
         motor_layout = QVBoxLayout()
         self.rpm_check = QCheckBox("RPM")
         self.temp_check = QCheckBox("Temperature")
         
-        # Style checkboxes
-        checkbox_style = """
-            QCheckBox {
-                spacing: 10px;
-                font-size: 12px;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-            }
-            QCheckBox::indicator:unchecked {
-                border: 2px solid #bbbbbb;
-                border-radius: 3px;
-                background-color: white;
-            }
-            QCheckBox::indicator:checked {
-                border: 2px solid #4CAF50;
-                border-radius: 3px;
-                background-color: #4CAF50;
-            }
-        """
-        
-        self.rpm_check.setStyleSheet(checkbox_style)
-        self.temp_check.setStyleSheet(checkbox_style)
-        
         motor_layout.addWidget(self.rpm_check)
         motor_layout.addWidget(self.temp_check)
         motor_group.setLayout(motor_layout)
         
         # Electrical Parameters
         elec_group = QGroupBox("Electrical Parameters")
-        elec_group.setStyleSheet("""
-            QGroupBox {
-                background-color: #e3f2fd;
-                border: 1px solid #90caf9;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 15px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-                color: #1565c0;
-            }
-        """)
+        elec_group.setObjectName("electricalParams")
         
         elec_layout = QVBoxLayout()
         self.current_check = QCheckBox("Current")
         self.voltage_check = QCheckBox("Voltage")
         self.power_check = QCheckBox("Power")
         
-        self.current_check.setStyleSheet(checkbox_style)
-        self.voltage_check.setStyleSheet(checkbox_style)
-        self.power_check.setStyleSheet(checkbox_style)
-        
         elec_layout.addWidget(self.current_check)
         elec_layout.addWidget(self.voltage_check)
         elec_layout.addWidget(self.power_check)
@@ -163,40 +93,23 @@ class DataLogging(QWidget):
         
         # Status Panel
         status_group = QGroupBox("Logging Status")
-        status_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #cccccc;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 15px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
-        
         status_layout = QVBoxLayout()
         
         # Status indicators
         status_frame = QFrame()
         status_frame.setFrameShape(QFrame.StyledPanel)
-        status_frame.setStyleSheet("background-color: #f5f5f5; border-radius: 5px; padding: 10px;")
+        status_frame.setObjectName("statusFrame")
         
         status_indicators = QVBoxLayout(status_frame)
         
         self.status_label = QLabel("Status: Idle")
-        self.status_label.setStyleSheet("font-weight: bold; font-size: 14px; color: #333;")
+        self.status_label.setObjectName("statusLabel")
         self.status_label.setAlignment(Qt.AlignCenter)
         
         self.duration_label = QLabel("Duration: 0:00")
-        self.duration_label.setStyleSheet("font-size: 12px;")
         self.duration_label.setAlignment(Qt.AlignCenter)
         
         self.size_label = QLabel("Log Size: 0 KB")
-        self.size_label.setStyleSheet("font-size: 12px;")
         self.size_label.setAlignment(Qt.AlignCenter)
         
         status_indicators.addWidget(self.status_label)
@@ -208,30 +121,15 @@ class DataLogging(QWidget):
         
         # Control Buttons Group
         control_group = QGroupBox("Controls")
-        control_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #cccccc;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 15px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
-        
         btn_layout = QVBoxLayout()
         
         self.start_btn = QPushButton("Start Logging")
         self.start_btn.setMinimumHeight(40)
-        self.start_btn.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold;")
+        self.start_btn.setObjectName("loggingButton")
         
         self.export_btn = QPushButton("Export Log File")
         self.export_btn.setMinimumHeight(40)
-        self.export_btn.setStyleSheet("background-color: #2196F3; color: white; font-weight: bold;")
+        self.export_btn.setProperty("variant", "primary")
         
         btn_layout.addWidget(self.start_btn)
         btn_layout.addWidget(self.export_btn)
@@ -308,40 +206,12 @@ class DataLogging(QWidget):
     def update_ui_state(self):
         if self.logging_active:
             self.status_label.setText("Status: Logging")
-            self.status_label.setStyleSheet("font-weight: bold; font-size: 14px; color: #4CAF50;")
             self.start_btn.setText("Stop Logging")
-            self.start_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #f44336;
-                    color: white;
-                    font-weight: bold;
-                    border-radius: 5px;
-                }
-                QPushButton:hover {
-                    background-color: #e53935;
-                }
-                QPushButton:pressed {
-                    background-color: #d32f2f;
-                }
-            """)
         else:
             self.status_label.setText("Status: Idle")
-            self.status_label.setStyleSheet("font-weight: bold; font-size: 14px; color: #333;")
             self.start_btn.setText("Start Logging")
-            self.start_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #4CAF50;
-                    color: white;
-                    font-weight: bold;
-                    border-radius: 5px;
-                }
-                QPushButton:hover {
-                    background-color: #45a049;
-                }
-                QPushButton:pressed {
-                    background-color: #388e3c;
-                }
-            """)
+        set_variant(self.status_label, "logging", self.logging_active)
+        set_variant(self.start_btn, "logging", self.logging_active)
             
     def toggle_select_all(self, state):
         checkboxes = [self.rpm_check, self.temp_check,
@@ -358,6 +228,7 @@ class DataLogging(QWidget):
         if self.power_check.isChecked(): params.append('power')
         return params
 
+    @profiled
     def update_log_stats(self):
         if self.start_time:
             elapsed = datetime.now() - self.start_time
@@ -0,0 +1,28 @@
+from PyQt5.QtWidgets import QWidget, QVBoxLayout
+from PyQt5.QtCore import pyqtSignal
+
+class LazyTab(QWidget):
+    """Tab page that builds its content the first time it is shown.
+
+    ``factory`` is called with no arguments and returns the content
+    widget. Build it early with ``build()`` if something needs it first.
+    """
+    built = pyqtSignal(object)
+
+    def __init__(self, factory):
+        super().__init__()
+        self.factory = factory
+        self.content = None
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+    def build(self):
+        if self.content is None:
+            self.content = self.factory()
+            self.layout().addWidget(self.content)
+            self.built.emit(self.content)
+        return self.content
+
+    def showEvent(self, event):
+        self.build()
+        super().showEvent(event)
@@ -3,8 +3,10 @@ from PyQt5.QtCore import pyqtSignal
 import pyqtgraph as pg
 from pyqtgraph import PlotWidget
 from datetime import datetime
-from pyqtgraph.exporters import ImageExporter
 import time
+from utils.profiler import profiled
+from utils.graph_export import EXPORT_FORMATS, GraphExportThread, export_scale, grab_plots
+from widgets.lazy_tab import LazyTab
 
 class ChartContainer(QWidget):
     # Signal to sync data with metrics panel
@@ -16,6 +18,7 @@ class ChartContainer(QWidget):
         self.plot_data = {"x": [], "rpm": [], "current": [], "torque": [], "thrust": [], 
                          "temperature": [], "voltage": [], "temp": []}
         self.param_selector = QListWidget()
+        self.exports = []  # running GraphExportThreads
         self.init_ui()
         self.init_signals()
         self.add_controls()
@@ -31,46 +34,62 @@ class ChartContainer(QWidget):
         
         # Screenshot button
         self.screenshot_btn = QPushButton("Capture Graph")
-        self.screenshot_btn.setStyleSheet(
-            """
-                QPushButton{
-                    background-color: #00b894;
-                color: #ffffff;
-                font-weight: bold;
-                font-size: 11pt;
-                padding: 8px 16px;
-                border-radius: 4px;
-                }
-            """
-        )
+        self.screenshot_btn.setObjectName("captureButton")
         self.screenshot_btn.clicked.connect(self.save_screenshot)
+        self.export_format = QComboBox()
+        self.export_format.addItems(EXPORT_FORMATS)
+        self.export_format.setToolTip("PNG: one image, PDF: one page per plot, SVG: one document")
         
         control_layout.addWidget(self.param_selector)
+        control_layout.addWidget(self.export_format)
         control_layout.addWidget(self.screenshot_btn)
         self.main_layout.insertLayout(0, control_layout)
         
-    def save_screenshot(self, clicked=None):
-        # Ignore the clicked parameter that comes from the button signal
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f'chart_{timestamp}.png'
-            
-        # Get the current tab
+    def visible_plots(self):
+        """(title, PlotWidget) for every plot on the current tab"""
         current_tab = self.view_tabs.currentWidget()
         if current_tab == self.single_chart_widget:
-            exporter = ImageExporter(self.single_plot_widget.plotItem)
-            exporter.export(filename)
-            print(f"Screenshot saved as {filename}")
-        elif current_tab == self.grid_view_widget:
-            # For grid view, save the first plot as an example
-            if self.plot_widgets:
-                first_metric = list(self.plot_widgets.keys())[0]
-                exporter = ImageExporter(self.plot_widgets[first_metric].plotItem)
-                exporter.export(filename)
-                print(f"Screenshot saved as {filename}")
-        else:
+            return [("Live Motor Metrics", self.single_plot_widget)]
+        if current_tab == self.grid_view_widget:
+            return list(self.plot_widgets.items())
+        return []
+
+    @profiled
+    def save_screenshot(self, clicked=None, path=None, scale=None):
+        """Export the plots on the current tab.
+
+        Only the grab happens here; compositing, encoding and writing run
+        in a GraphExportThread, so live plotting carries on meanwhile.
+        """
+        plots = self.visible_plots()
+        if not plots:
             print("No valid widget to capture.")
+            return None
+        if path is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            path = f'chart_{timestamp}.{self.export_format.currentText().lower()}'
+        if scale is None:
+            scale = export_scale(self)
+        frames, size = grab_plots(plots, self.view_tabs.currentWidget(), scale)
+        worker = GraphExportThread(frames, size, path, scale)
+        worker.export_finished.connect(self._export_finished)
+        worker.export_failed.connect(self._export_failed)
+        worker.finished.connect(lambda: self.exports.remove(worker))
+        self.exports.append(worker)
+        worker.start()
+        return worker
+
+    def _export_finished(self, path, ms):
+        print(f"Screenshot saved as {path} ({ms} ms in the background)")
+
+    def _export_failed(self, path, error):
+        print(f"[Export] Could not save {path}: {error}")
+
+    def wait_for_exports(self):
+        """Block until running exports are written (used on shutdown)"""
+        for worker in list(self.exports):
+            worker.wait()
 
-            
     def init_ui(self):
         self.main_layout = QVBoxLayout()
         
@@ -81,9 +100,10 @@ class ChartContainer(QWidget):
         self.single_chart_widget = QWidget()
         self.create_single_chart()
         
-        # Create grid view
-        self.grid_view_widget = QWidget()
-        self.create_grid_view()
+        # Grid view: six more plots, so only built when its tab is first shown
+        self.plot_widgets = {}
+        self.grid_curves = {}
+        self.grid_view_widget = LazyTab(self.create_grid_view)
         
         # Add tabs
         self.view_tabs.addTab(self.single_chart_widget, "Single Chart")
@@ -124,15 +144,14 @@ class ChartContainer(QWidget):
         self.single_chart_widget.setLayout(layout)
         
     def create_grid_view(self):
+        grid_widget = QWidget()
         grid_layout = QGridLayout()
         
         # Define metrics and their properties
         metrics = ['RPM', 'Current', 'Torque', 'Thrust', 'Temperature', 'Voltage']
+        keys = ['rpm', 'current', 'torque', 'thrust', 'temperature', 'voltage']
         colors = ['r', 'b', 'g', 'y', 'm', (0, 128, 0)]
         
-        self.plot_widgets = {}
-        self.grid_curves = {}
-        
         # Create a grid of plot widgets
         cols = 3
         for index, metric in enumerate(metrics):
@@ -140,7 +159,8 @@ class ChartContainer(QWidget):
             plot_widget.setBackground('w')
             plot_widget.setLabel('left', metric)
             plot_widget.setLabel('bottom', 'Time')
-            curve = plot_widget.plot(pen=colors[index])
+            # Start from the samples collected before the tab was opened
+            curve = plot_widget.plot(self.plot_data['x'], self.plot_data[keys[index]], pen=colors[index])
             self.plot_widgets[metric] = plot_widget
             self.grid_curves[metric] = curve
             
@@ -148,13 +168,15 @@ class ChartContainer(QWidget):
             col = index % cols
             grid_layout.addWidget(plot_widget, row, col)
             
-        self.grid_view_widget.setLayout(grid_layout)
+        grid_widget.setLayout(grid_layout)
+        return grid_widget
         
     def init_signals(self):
         self.data_simulator.data_updated.connect(self.update_charts)
         self.parameter_selector.currentTextChanged.connect(self.update_visibility)
         self.param_selector.itemSelectionChanged.connect(self.update_param_visibility)
         
+    @profiled
     def update_charts(self, data):
     # Add timestamp
         timestamp = len(self.plot_data['x'])
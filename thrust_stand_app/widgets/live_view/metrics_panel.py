@@ -1,5 +1,6 @@
 from PyQt5.QtWidgets import QTabWidget, QWidget, QGridLayout, QLabel
 from PyQt5.QtCore import pyqtSlot
+from utils.profiler import profiled
 
 class MetricsPanel(QTabWidget):
     def __init__(self):
@@ -30,6 +31,7 @@ class MetricsPanel(QTabWidget):
         widget.setLayout(grid)
         self.addTab(widget, "Metrics")
         
+    @profiled
     def update_metrics(self, data):
         # Update metric labels with defensive checks
         rpm = self.findChild(QLabel, "rpm_label")
@@ -86,6 +88,7 @@ class MetricsPanel(QTabWidget):
         widget.setLayout(layout)
         self.addTab(widget, "Details")
 
+    @profiled
     def update_details(self, data):
         # Update performance metrics
         efficiency = self.findChild(QLabel, "efficiency_label")
@@ -130,6 +133,7 @@ class MetricsPanel(QTabWidget):
         """Connect this metrics panel to a chart container to receive data updates"""
         chart_container.data_sync_signal.connect(self.update_from_chart)
         
+    @profiled
     def update_from_chart(self, data):
         """Update both metrics and details panels from chart data"""
         self.update_metrics(data)
@@ -140,6 +144,7 @@ class MetricsPanel(QTabWidget):
         simulator.data_updated.connect(self.update_from_simulator)
         
     @pyqtSlot(dict)
+    @profiled
     def update_from_simulator(self, data):
         """Update both metrics and details panels from simulator data"""
         # Calculate thrust based on torque and RPM (simplified model)
@@ -0,0 +1,22 @@
+from PyQt5.QtWidgets import QListWidget, QListWidgetItem
+from PyQt5.QtGui import QColor
+
+class StallLogWidget(QListWidget):
+    """Newest-first list of UI stalls reported by the watchdog.
+
+    Hovering an entry shows the main-thread stack captured during the
+    stall.
+    """
+
+    def __init__(self, capacity=200):
+        super().__init__()
+        self.capacity = capacity
+
+    def add_stall(self, stall):
+        time_text = stall['time'].split('T')[-1]
+        item = QListWidgetItem(f"{time_text}  UI stalled {stall['duration_ms']:.0f} ms in {stall['slot']}")
+        item.setForeground(QColor("#d63031"))
+        item.setToolTip("".join(stall['stack']).rstrip())
+        self.insertItem(0, item)
+        while self.count() > self.capacity:
+            self.takeItem(self.count() - 1)